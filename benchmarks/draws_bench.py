@@ -0,0 +1,226 @@
+"""Golden-output checks and timings for the WTA draw PDF parser.
+
+    python benchmarks/draws_bench.py                   # check every PDF against its golden JSON, time it
+    python benchmarks/draws_bench.py --update          # (re)write the golden JSON from the current parser
+    python benchmarks/draws_bench.py --collect         # add PDFs of the draws in data/draws_store_cache.json
+    python benchmarks/draws_bench.py --collect 902/2026/MDS 560/2025/QS
+
+The corpus is benchmarks/fixtures/draws: `<tid>-<year>-<MDS|QS>-<draw size>.pdf`
+next to `<same name>.json`, which holds the expected `draws.parse_draw_pdf`
+output plus draw_watcher's Round 1 lines for it (check_draw.py parses the same
+PDFs). The committed documents are synthetic, one per draw size in
+TARGET_SIZES (make_draw_fixtures.py). --collect adds real ones, keeping at
+most PER_SIZE documents of each of those sizes, so the corpus covers small to
+Grand Slam draws.
+
+Each document is parsed --repeat times; the best time is reported for the
+whole document and per page, split into text extraction (get_text) and
+`_parse_page`, together with the parser's peak Python allocation (tracemalloc;
+MuPDF's own memory is only visible in the process peak RSS printed at the end).
+Exits with 1 if any output differs from its golden JSON.
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+import time
+import tracemalloc
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, os.path.join(BASE_DIR, "draw_watcher"))
+
+import fitz  # noqa: E402
+
+import draws  # noqa: E402
+from check_draw import build_round1_match_lines  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+CORPUS_DIR = os.path.join(BASE_DIR, "benchmarks", "fixtures", "draws")
+DRAWS_STORE_FILE = os.path.join(BASE_DIR, "data", "draws_store_cache.json")
+TARGET_SIZES = (32, 48, 56, 64, 96, 128)
+PER_SIZE = 2
+MAX_DIFF_LINES = 5
+
+
+def peak_rss_mb():
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def golden_output(pdf_bytes):
+    draw = draws.parse_draw_pdf(pdf_bytes)
+    try:
+        round1 = build_round1_match_lines(draw)
+    except ValueError as e:
+        round1 = f"error: {e}"
+    # Round-trip through JSON so it compares equal to what was saved.
+    return json.loads(json.dumps({"draw": draw, "round1_lines": round1}, ensure_ascii=False))
+
+
+def describe_diff(expected, actual, path=""):
+    """First few differences between two JSON values, as 'path: expected -> actual' lines."""
+    if type(expected) is not type(actual):
+        return [f"{path or '.'}: {expected!r} -> {actual!r}"]
+    if isinstance(expected, dict):
+        lines = []
+        for key in sorted(set(expected) | set(actual)):
+            if expected.get(key) != actual.get(key):
+                lines += describe_diff(expected.get(key), actual.get(key), f"{path}.{key}")
+        return lines
+    if isinstance(expected, list):
+        if len(expected) != len(actual):
+            lines = [f"{path}: {len(expected)} items -> {len(actual)}"]
+        else:
+            lines = []
+        for i, (a, b) in enumerate(zip(expected, actual)):
+            if a != b:
+                lines += describe_diff(a, b, f"{path}[{i}]")
+        return lines
+    return [] if expected == actual else [f"{path or '.'}: {expected!r} -> {actual!r}"]
+
+
+def time_document(pdf_bytes, repeat):
+    """Best wall time of parse_draw_pdf, best per-page (get_text, _parse_page) times, peak traced bytes."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        draws.parse_draw_pdf(pdf_bytes)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    draws.parse_draw_pdf(pdf_bytes)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    pages = []
+    for page_idx in range(doc.page_count):
+        extract = parse = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            text = doc[page_idx].get_text() or ""
+            mid = time.perf_counter()
+            draws._parse_page(text)
+            extract = min(extract, mid - start)
+            parse = min(parse, time.perf_counter() - mid)
+        pages.append((extract, parse))
+    doc.close()
+    return best, pages, peak
+
+
+def check_corpus(corpus_dir, repeat, update):
+    pdfs = sorted(glob.glob(os.path.join(corpus_dir, "*.pdf")))
+    if not pdfs:
+        sys.exit(f"No draw PDFs in {corpus_dir}; add some with --collect first.")
+
+    failures = 0
+    total = 0.0
+    print(f"{'document':<32} {'size':>4} {'pages':>5} {'parse':>9} {'per page':>9} "
+          f"{'get_text':>9} {'_parse_page':>11} {'peak py':>8}  golden")
+    for path in pdfs:
+        name = os.path.splitext(os.path.basename(path))[0]
+        golden_path = os.path.splitext(path)[0] + ".json"
+        with open(path, "rb") as f:
+            pdf_bytes = f.read()
+
+        actual = golden_output(pdf_bytes)
+        if update or not os.path.exists(golden_path):
+            with open(golden_path, "w", encoding="utf-8") as f:
+                json.dump(actual, f, ensure_ascii=False, indent=1)
+                f.write("\n")
+            status, diff = "written", []
+        else:
+            with open(golden_path, encoding="utf-8") as f:
+                diff = describe_diff(json.load(f), actual)
+            status = "ok" if not diff else f"DIFFERS ({len(diff)})"
+            failures += bool(diff)
+
+        seconds, pages, peak = time_document(pdf_bytes, repeat)
+        total += seconds
+        n = max(1, len(pages))
+        print(f"{name:<32} {actual['draw']['draw_size']:>4} {len(pages):>5} {seconds * 1000:>7.1f}ms "
+              f"{seconds * 1000 / n:>7.1f}ms {sum(p[0] for p in pages) * 1000 / n:>7.1f}ms "
+              f"{sum(p[1] for p in pages) * 1000 / n:>9.2f}ms {peak / (1024 * 1024):>6.1f}MB  {status}")
+        for line in diff[:MAX_DIFF_LINES]:
+            print(f"    {line}")
+
+    print(f"{len(pdfs)} documents, {total * 1000:.0f} ms total (best of {repeat}), "
+          f"peak RSS {peak_rss_mb():.0f} MB, {failures} differing from golden output")
+    return failures
+
+
+def _store_specs():
+    """(tid, year, draw type) of the WTA draws the pipeline currently tracks."""
+    try:
+        with open(DRAWS_STORE_FILE, encoding="utf-8") as f:
+            store = json.load(f)
+    except (OSError, ValueError):
+        return []
+    specs = []
+    for t_key, tdata in store.items():
+        m = re.search(r"/tournaments/(\d+)/[^/]+/(\d{4})/", t_key)
+        if not m or not isinstance(tdata, dict):
+            continue
+        for dtype in (tdata.get("draws") or {}):
+            specs.append((m.group(1), m.group(2), dtype))
+    return specs
+
+
+def collect(corpus_dir, spec_args):
+    """Download draw PDFs into the corpus, keeping up to PER_SIZE per draw size in TARGET_SIZES."""
+    os.makedirs(corpus_dir, exist_ok=True)
+    specs = [tuple(s.split("/")) for s in spec_args] if spec_args else _store_specs()
+    have = {}
+    for path in glob.glob(os.path.join(corpus_dir, "*.pdf")):
+        size = os.path.splitext(path)[0].rsplit("-", 1)[-1]
+        have[size] = have.get(size, 0) + 1
+
+    added = 0
+    for tid, year, dtype in specs:
+        name = f"{tid}-{year}-{dtype}"
+        if glob.glob(os.path.join(corpus_dir, name + "-*.pdf")):
+            continue
+        pdf_bytes = draws.fetch_draw_pdf_bytes(tid, year, dtype)
+        if not pdf_bytes:
+            print(f"  {name}: no PDF")
+            continue
+        size = str(draws.parse_draw_pdf(pdf_bytes)["draw_size"])
+        if not spec_args and (int(size) not in TARGET_SIZES or have.get(size, 0) >= PER_SIZE):
+            print(f"  {name}: draw size {size}, not needed")
+            continue
+        with open(os.path.join(corpus_dir, f"{name}-{size}.pdf"), "wb") as f:
+            f.write(pdf_bytes)
+        have[size] = have.get(size, 0) + 1
+        added += 1
+        print(f"  {name}: added (draw size {size})")
+    missing = [s for s in TARGET_SIZES if not have.get(str(s))]
+    print(f"{added} PDFs added" + (f"; no document yet for draw sizes {missing}" if missing else ""))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and time the draw PDF parser against a golden corpus.")
+    parser.add_argument("--update", action="store_true", help="Rewrite the golden JSON from the current parser")
+    parser.add_argument("--collect", nargs="*", metavar="TID/YEAR/DTYPE",
+                        help="Download PDFs into the corpus (default: the draws in the draws store)")
+    parser.add_argument("--repeat", type=int, default=5, help="Parses per document; the best time is reported")
+    parser.add_argument("--corpus", default=CORPUS_DIR, help="Corpus directory")
+    args = parser.parse_args()
+
+    if args.collect is not None:
+        collect(args.corpus, args.collect)
+        return
+    sys.exit(1 if check_corpus(args.corpus, max(1, args.repeat), args.update) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Generate the synthetic draw PDFs of the draws_bench.py corpus.
+
+    python benchmarks/make_draw_fixtures.py             # write into benchmarks/fixtures/draws
+    python benchmarks/draws_bench.py --update           # then (re)write their golden JSON
+
+The real WTA PDFs cannot be committed, so the corpus is made-up draws laid
+out like them (synthetic_draws.py), one per draw size in draws_bench's
+TARGET_SIZES: single and two-page documents, qualifying and main draws, byes,
+seeds, entry codes and draws still in progress. PDFs collected with
+`draws_bench.py --collect` can sit next to them.
+"""
+
+import argparse
+import os
+import random
+import sys
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+
+from draws_bench import CORPUS_DIR  # noqa: E402
+from synthetic_draws import (  # noqa: E402
+    build_draw, main_round_labels, qualifying_round_labels, render_draw_pdf, synthetic_players,
+)
+
+YEAR = 2026
+# (tid, draw type, positions, rounds shown, rounds played, pages, byes, seeds)
+DRAWS = [
+    (9032, "MDS", 32, 5, 5, 1, 0, 8),
+    (9048, "QS", 48, 3, 3, 1, 0, 12),
+    (9056, "QS", 56, 2, 2, 2, 0, 14),
+    (9064, "MDS", 64, 6, 3, 2, 8, 16),
+    (9096, "QS", 96, 2, 1, 2, 0, 24),
+    (9128, "MDS", 128, 7, 4, 2, 32, 32),
+]
+
+
+def make_draw(tid, dtype, size, rounds, played, pages, byes, seeds):
+    """PDF bytes of one synthetic draw."""
+    rng = random.Random(f"draw-fixture:{tid}")
+    section = size // seeds
+    seed_positions = [i * section + 1 if i % 2 == 0 else (i + 1) * section for i in range(seeds)]
+    bye_positions = [p + 1 if p % 2 else p - 1 for p in seed_positions[:byes]]
+    players = synthetic_players(rng, size - byes, start_id=900000 + tid * 1000)
+    free = [p for p in range(1, size + 1) if p not in seed_positions and p not in bye_positions]
+    entries = dict(zip(rng.sample(free, 6), ["WC", "WC", "Q", "LL", "PR", "ALT"]))
+    draw = build_draw(rng, players, size, rounds, played, byes=bye_positions, entries=entries, seeds=seeds)
+    if dtype == "MDS":
+        title, labels = "MAIN DRAW SINGLES", main_round_labels(size, rounds)
+    else:
+        title, labels = "QUALIFYING DRAW SINGLES", qualifying_round_labels(rounds)
+    header = (f"Synthetic Open {tid}", "Villa Serena, ARG", f"4 - 10 May {YEAR} | $267,082 | Clay", title, labels)
+    return render_draw_pdf(draw, header, pages=pages, seed=tid)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write the synthetic draw PDFs of the draws_bench corpus.")
+    parser.add_argument("--corpus", default=CORPUS_DIR, help="Corpus directory")
+    args = parser.parse_args()
+
+    os.makedirs(args.corpus, exist_ok=True)
+    for spec in DRAWS:
+        tid, dtype, size = spec[:3]
+        path = os.path.join(args.corpus, f"{tid}-{YEAR}-{dtype}-{size}.pdf")
+        with open(path, "wb") as f:
+            f.write(make_draw(*spec))
+        print(f"  {os.path.basename(path)}")
+    print(f"{len(DRAWS)} PDFs written; run draws_bench.py --update to refresh their golden JSON")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,650 @@
+"""Generate the synthetic HTTP fixture set of pipeline_bench.py.
+
+    python benchmarks/make_pipeline_fixtures.py                  # rewrite benchmarks/fixtures/pipeline
+    python benchmarks/make_pipeline_fixtures.py --fixtures /tmp/fx main.py
+
+No network or Chrome is needed: the workflow's scripts run on a scratch copy
+of the tree (like pipeline_bench.py) in `http_fixtures.py` record mode, but
+every request is answered by `World`, a made-up season anchored on today's
+date, instead of the real APIs. So the set holds exactly the requests the
+scripts make, with answers that agree with each other: the rankings carry
+every player of the draws, the calendars the tournaments whose player lists,
+matches, drawsheets and draw PDFs are asked for, and so on.
+
+Players are made up (synthetic_draws.py), except the Argentine players, who
+are taken from data/wta_matches_arg.csv with made-up ranks, so the site has
+its usual content. Regenerate the set when the scripts' requests change.
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unicodedata
+from datetime import date, timedelta
+from urllib.parse import parse_qs, urlsplit
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+
+from pipeline_bench import BASE_DIR, DEFAULT_FIXTURES_DIR, WORKFLOW_TARGETS, copy_tree  # noqa: E402
+from synthetic_draws import (  # noqa: E402
+    build_draw, main_round_labels, qualifying_round_labels, render_draw_pdf, synthetic_players,
+)
+
+SEED = "pipeline-fixtures"
+RANKED_PLAYERS = 700
+ITF_ONLY_PLAYERS = 250
+ARG_WTA_RANKS = [48, 85, 119, 152, 207, 263, 331, 402, 478, 561, 640, 690]
+ITF_EVENTS_PER_WEEK = 4
+# Weeks around today get a second WTA event, like the busy part of a season.
+BUSY_WEEKS = 5
+
+WTA_LEVELS = ["WTA 250", "WTA 500", "WTA 250", "WTA 1000", "WTA 125"]
+# level: (draw size, byes, seeds, qualifying size, qualifying rounds, MD ranks, Q ranks)
+WTA_FORMATS = {
+    "WTA 1000": (64, 8, 16, 32, 2, (0, 70), (50, 150)),
+    "WTA 500": (32, 4, 8, 16, 2, (10, 90), (60, 180)),
+    "WTA 250": (32, 0, 8, 16, 2, (30, 150), (100, 250)),
+    "WTA 125": (32, 0, 8, 16, 2, (60, 220), (150, 350)),
+}
+ITF_LEVELS = ["W15", "W35", "W50", "W75", "W100", "W35", "W15", "W50"]
+CITIES = [
+    ("Valmara", "ESP", "Clay"), ("Porto Lindo", "BRA", "Clay"), ("San Rafael", "ARG", "Clay"),
+    ("Villa Serena", "ARG", "Clay"), ("Lakehaven", "USA", "Hard"), ("Nordby", "SWE", "Hard"),
+    ("Kastelgrad", "SRB", "Clay"), ("Aomura", "JPN", "Hard"), ("Rivamonte", "ITA", "Clay"),
+    ("Bellecombe", "FRA", "Hard"), ("Westbridge", "GBR", "Grass"), ("Monteluna", "MEX", "Hard"),
+    ("Santa Brisa", "CHI", "Clay"), ("Kolvino", "CZE", "Clay"), ("Harrowdale", "AUS", "Hard"),
+    ("Ostrava Nova", "CZE", "Hard"), ("Maple Falls", "CAN", "Hard"), ("Lindau Tal", "GER", "Clay"),
+]
+MD_ROUND_IDS = {8: "Q", 4: "S", 2: "F"}
+ITF_ROUND_DESCS = {8: "Quarter-finals", 4: "Semi-finals", 2: "Final"}
+JSON_TYPE = "application/json; charset=utf-8"
+
+
+def _rng(*key):
+    return random.Random(":".join(str(k) for k in (SEED,) + key))
+
+
+def _ascii(text):
+    return "".join(c for c in unicodedata.normalize("NFKD", text) if not unicodedata.combining(c))
+
+
+def _full_name(p):
+    return f"{p['first']} {p['last']}"
+
+
+def _monday(d):
+    return d - timedelta(days=d.weekday())
+
+
+def _arg_players():
+    """Argentine WTA players seen in the match history (id and name), most active first."""
+    import csv
+    counts = {}
+    with open(os.path.join(BASE_DIR, "data", "wta_matches_arg.csv"), encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            if row["date"] < "2024":
+                continue
+            for side in ("winner", "loser"):
+                if row[side + "Country"] == "ARG" and row[side + "Id"]:
+                    key = (row[side + "Id"], row[side + "Name"])
+                    counts[key] = counts.get(key, 0) + 1
+    players = []
+    for (pid, name), _ in sorted(counts.items(), key=lambda kv: (-kv[1], kv[0])):
+        first, _, last = name.partition(" ")
+        players.append({"id": pid, "first": first, "last": last, "country": "ARG"})
+    return players
+
+
+def _itf_ids():
+    """WTA id -> ITF id from the alias table."""
+    try:
+        with open(os.path.join(BASE_DIR, "data", "player_aliases_wta_itf.json"), encoding="utf-8") as f:
+            return {a["wta_id"]: a["itf_id"] for a in json.load(f) if a.get("wta_id") and a.get("itf_id")}
+    except (OSError, ValueError):
+        return {}
+
+
+def _score_sets(score):
+    """WTA-style score ("64 36 76(4) RET") as [(winner games, loser games, tiebreak)] and retired flag."""
+    sets = []
+    for token in score.split():
+        m = re.match(r"^(\d)(\d)(?:\((\d+)\))?$", token)
+        if m:
+            sets.append((int(m.group(1)), int(m.group(2)), int(m.group(3)) if m.group(3) else None))
+    return sets, score.endswith("RET")
+
+
+class World:
+    """A made-up season around `today`: players, rankings, WTA and ITF tournaments and their draws."""
+
+    def __init__(self, today):
+        self.today = today
+        self.year = today.year
+        rng = _rng("players")
+        itf_ids = _itf_ids()
+        synthetic = synthetic_players(rng, RANKED_PLAYERS + ITF_ONLY_PLAYERS)
+        arg = _arg_players()
+        ranked = synthetic[:RANKED_PLAYERS - len(ARG_WTA_RANKS)]
+        for rank, player in zip(ARG_WTA_RANKS, arg):
+            ranked.insert(rank - 1, player)
+        self.ranked = ranked
+        self.itf_only = arg[len(ARG_WTA_RANKS):] + synthetic[RANKED_PLAYERS - len(ARG_WTA_RANKS):]
+        for i, p in enumerate(ranked):
+            p["rank"] = i + 1
+        for i, p in enumerate(self.ranked + self.itf_only):
+            p.setdefault("dob", f"{1995 + i % 12}-{1 + i % 12:02d}-{1 + i % 28:02d}")
+            p["itf_id"] = itf_ids.get(p["id"]) or str(800900000 + i)
+            p["itf_rank"] = int(p["rank"] * 1.4) if "rank" in p else 900 + i
+        self.arg = [p for p in self.ranked + self.itf_only if p["country"] == "ARG"]
+        self.by_id = {p["id"]: p for p in self.ranked + self.itf_only}
+        self.wta_events = self._wta_calendar()
+        self.itf_events = self._itf_calendar()
+        self.itf_by_key = {e["tournamentKey"]: e for e in self.itf_events}
+        self.itf_by_id = {e["tournamentId"]: e for e in self.itf_events}
+        self._draws = {}
+
+    # ── Calendars ──────────────────────────────────────────────────────────
+
+    def _weeks(self):
+        monday = _monday(date(self.year, 1, 1))
+        if monday.year < self.year:
+            monday += timedelta(days=7)
+        while monday.year == self.year:
+            yield monday
+            monday += timedelta(days=7)
+
+    def _wta_calendar(self):
+        events = []
+        this_monday = _monday(self.today)
+        for i, monday in enumerate(self._weeks()):
+            levels = [WTA_LEVELS[i % len(WTA_LEVELS)]]
+            if abs((monday - this_monday).days) <= 7 * BUSY_WEEKS:
+                levels.append("WTA 125" if levels[0] != "WTA 125" else "WTA 250")
+            for j, level in enumerate(levels):
+                tid = 2000 + 2 * i + j
+                city, country, surface = _rng("wta-city", tid).choice(CITIES)
+                name = f"{city} {level[4:]}" if level == "WTA 125" else f"{city} Open"
+                events.append({
+                    "tournamentGroup": {"id": tid, "name": name, "level": level},
+                    "year": self.year,
+                    "title": f"{name} - {city}, {country}",
+                    "level": level,
+                    "city": city.upper(),
+                    "country": country,
+                    "countryCode": country,
+                    "startDate": monday.isoformat(),
+                    "endDate": (monday + timedelta(days=6)).isoformat(),
+                    "surface": surface,
+                    "inOutdoor": "I" if surface == "Hard" and tid % 3 == 0 else "O",
+                    "singlesDrawSize": WTA_FORMATS[level][0] - WTA_FORMATS[level][1],
+                })
+        return events
+
+    def _itf_calendar(self):
+        events = []
+        seq = {}
+        for i, monday in enumerate(self._weeks()):
+            for j in range(ITF_EVENTS_PER_WEEK):
+                rng = _rng("itf-event", i, j)
+                city, country, surface = rng.choice(CITIES)
+                level = ITF_LEVELS[(i + j) % len(ITF_LEVELS)]
+                seq[country] = seq.get(country, 0) + 1
+                key = f"w-itf-{country.lower()}-{self.year}-{seq[country]:03d}"
+                name = f"{level} {city}"
+                events.append({
+                    "tournamentKey": key,
+                    "tournamentLink": f"{name.lower().replace(' ', '-')}/{country.lower()}/{self.year}/{key}/",
+                    "tournamentName": name,
+                    "startDate": f"{monday.isoformat()}T00:00:00",
+                    "endDate": f"{(monday + timedelta(days=6)).isoformat()}T00:00:00",
+                    "category": level,
+                    "status": "Cancelled" if rng.random() < 0.02 else "",
+                    "surfaceDesc": surface,
+                    "hostNationCode": country,
+                    "hostNation": country,
+                    "indoorOrOutDoor": "Outdoor",
+                    "tournamentId": 1100900000 + 10 * i + j,
+                })
+        return events
+
+    # ── Draws ──────────────────────────────────────────────────────────────
+
+    def _played(self, monday, rounds, qualifying):
+        """(complete rounds, True if the next round is under way) as of today."""
+        offset = (self.today - monday).days
+        days = []
+        for k in range(rounds):
+            if qualifying:
+                days.append(k - rounds)
+            elif k >= rounds - 3:
+                days.append(6 - (rounds - 1 - k))
+            else:
+                days.append((k + 1) * 4 // (rounds - 3) - 1)
+        complete = sum(1 for d in days if d < offset)
+        return complete, complete < rounds and days[complete] == offset
+
+    def _entrants(self, key, md_ranks, q_ranks, md_count, q_count, itf=False):
+        rng = _rng("entrants", key)
+        md_pool = self.ranked[md_ranks[0]:md_ranks[1]]
+        md = sorted(rng.sample(md_pool, md_count), key=lambda p: p["rank"])
+        q_pool = [p for p in self.ranked[q_ranks[0]:q_ranks[1]] + (self.itf_only if itf else []) if p not in md]
+        q = rng.sample(q_pool, q_count)
+        arg = [p for p in self.arg if p not in md and p not in q]
+        for _ in range(rng.randint(1, 2)):
+            if arg:
+                q[rng.randrange(q_count)] = arg.pop(rng.randrange(len(arg)))
+        q.sort(key=lambda p: p.get("rank", 9000 + p["itf_rank"]))
+        return md, q
+
+    def draw(self, source, tid, kind, level, monday):
+        """Simulated draw of one event: {"slots", "results", "size", "rounds", "in_progress"}, or None if not out yet."""
+        memo_key = (source, tid, kind)
+        if memo_key in self._draws:
+            return self._draws[memo_key]
+        if source == "WTA":
+            size, byes, seeds, q_size, q_rounds, md_ranks, q_ranks = WTA_FORMATS[level]
+        else:
+            size, byes, seeds, q_size, q_rounds, md_ranks, q_ranks = 32, 0, 8, 32, 2, (250, 650), (450, 700)
+        q_winners = q_size >> q_rounds
+        md_players, q_players = self._entrants(f"{source}{tid}", md_ranks, q_ranks,
+                                               size - byes - q_winners, q_size, itf=source == "ITF")
+        rng = _rng("draw", source, tid, kind)
+        if kind == "Q":
+            rounds = q_rounds
+            complete, in_progress = self._played(monday, rounds, True)
+            if complete == 0 and not in_progress and (self.today - monday).days < -3:
+                result = None
+            else:
+                result = build_draw(rng, q_players, q_size, rounds, complete + in_progress, seeds=q_size // 4)
+        else:
+            rounds = size.bit_length() - 1
+            complete, in_progress = self._played(monday, rounds, False)
+            if (self.today - monday).days < -2:
+                result = None
+            else:
+                section = size // seeds
+                seed_positions = [i * section + 1 if i % 2 == 0 else (i + 1) * section for i in range(seeds)]
+                bye_positions = [p + 1 if p % 2 else p - 1 for p in seed_positions[:byes]]
+                free = [p for p in range(1, size + 1) if p not in seed_positions and p not in bye_positions]
+                q_positions = sorted(rng.sample(free, q_winners))
+                qualifying = self.draw(source, tid, "Q", level, monday)
+                placed = {}
+                if qualifying and len(qualifying["results"]) == qualifying["rounds"]:
+                    for pos, (winner, _) in zip(q_positions, qualifying["results"][-1]):
+                        placed[pos] = {**winner, "seed": "", "entry": "Q"}
+                wild_cards = [p for p in free if p not in q_positions][:2]
+                result = build_draw(rng, md_players, size, rounds, complete + in_progress,
+                                    byes=bye_positions, qualifier_slots=[] if placed else q_positions,
+                                    entries={p: "WC" for p in wild_cards}, seeds=seeds, placed=placed)
+        if result is not None:
+            result["in_progress"] = in_progress
+            result["monday"] = monday
+        self._draws[memo_key] = result
+        return result
+
+    def _rounds_of(self, draw):
+        """[(round index, [(a, b, winner or None, score)])] of the matches that exist so far."""
+        rounds = []
+        alive = draw["slots"]
+        for r, winners in enumerate(draw["results"]):
+            last = r == len(draw["results"]) - 1 and draw["in_progress"]
+            matches = []
+            for i, (a, b) in enumerate(zip(alive[0::2], alive[1::2])):
+                winner, score = winners[i]
+                if last and i >= len(winners) // 2:
+                    winner, score = None, ""
+                matches.append((a, b, winner, score))
+            rounds.append((r, matches))
+            alive = [w for w, _ in winners]
+        return rounds
+
+    # ── WTA API ────────────────────────────────────────────────────────────
+
+    def rankings(self, at, page, page_size, nationality=None):
+        week = at or _monday(self.today).isoformat()
+        rng = _rng("rankings", week)
+        rows = []
+        for p in self.ranked:
+            points = int(10500 / p["rank"] ** 0.85 * (0.97 + 0.06 * rng.random())) + 1
+            rows.append((points, p))
+        rows.sort(key=lambda r: (-r[0], r[1]["id"]))
+        content = [{
+            "player": {"id": int(p["id"]), "fullName": _full_name(p), "countryCode": p["country"],
+                       "dateOfBirth": p["dob"]},
+            "ranking": rank, "points": points, "movement": 0,
+        } for rank, (points, p) in enumerate(rows, 1) if not nationality or p["country"] == nationality]
+        return {"content": content[page * page_size:(page + 1) * page_size], "pageInfo": {"page": page}}
+
+    def tournaments(self, page, page_size, exclude, from_date, to_date):
+        exclude = {x.strip() for x in exclude.split(",") if x.strip()}
+        found = [e for e in self.wta_events
+                 if e["level"] not in exclude and from_date <= e["startDate"] <= to_date]
+        content = found[page * page_size:(page + 1) * page_size]
+        return {"content": content, "last": (page + 1) * page_size >= len(found), "totalElements": len(found)}
+
+    def _wta_event(self, tid):
+        return next((e for e in self.wta_events if e["tournamentGroup"]["id"] == tid), None)
+
+    def wta_matches(self, tid):
+        event = self._wta_event(tid)
+        matches = []
+        if event is None:
+            return {"matches": matches}
+        monday = date.fromisoformat(event["startDate"])
+        for kind, prefix in (("Q", "QS"), ("M", "LS")):
+            draw = self.draw("WTA", tid, kind, event["level"], monday)
+            if draw is None:
+                continue
+            for r, round_matches in self._rounds_of(draw):
+                remaining = draw["size"] >> r
+                round_id = str(r + 1) if kind == "Q" else MD_ROUND_IDS.get(remaining, str(r + 1))
+                day = monday + timedelta(days=self._round_day(draw, r, kind))
+                for a, b, winner, score in round_matches:
+                    if not isinstance(a, dict) or not isinstance(b, dict):
+                        continue
+                    sets, retired = _score_sets(score)
+                    score_string = " ".join(f"{w}-{l}" + (f"({t})" if t is not None else "") for w, l, t in sets)
+                    match = {
+                        "MatchID": f"{prefix}{len(matches) + 1:03d}", "EventID": f"{tid:04d}", "EventYear": self.year,
+                        "DrawLevelType": kind, "DrawMatchType": "S", "RoundID": round_id,
+                        "MatchState": "F" if winner else "L",
+                        "Winner": ("2" if winner is a else "3") if winner else "0",
+                        "ScoreString": score_string + (" Ret'd" if retired else ""),
+                        "MatchTimeStamp": f"{day.isoformat()}T15:00:00+00:00",
+                    }
+                    for side, p in (("A", a), ("B", b)):
+                        match.update({
+                            f"PlayerID{side}": int(p["id"]), f"PlayerNameFirst{side}": p["first"],
+                            f"PlayerNameLast{side}": p["last"], f"PlayerCountry{side}": p["country"],
+                            f"EntryType{side}": p.get("entry", ""), f"Seed{side}": p.get("seed", ""),
+                        })
+                    matches.append(match)
+        return {"matches": matches}
+
+    def _round_day(self, draw, r, kind):
+        if kind == "Q":
+            return r - draw["rounds"]
+        rounds = draw["rounds"]
+        return 6 - (rounds - 1 - r) if r >= rounds - 3 else (r + 1) * 4 // (rounds - 3) - 1
+
+    def player_info(self, pid):
+        p = self.by_id.get(str(pid))
+        if p is None:
+            return None
+        return {"player": {"id": int(p["id"]), "fullName": _full_name(p), "countryCode": p["country"]},
+                "matches": []}
+
+    def player_list_html(self, tid):
+        event = self._wta_event(tid)
+        if event is None:
+            return None
+        size, byes, _, q_size, q_rounds, md_ranks, q_ranks = WTA_FORMATS[event["level"]]
+        md, q = self._entrants(f"WTA{tid}", md_ranks, q_ranks, size - byes - (q_size >> q_rounds), q_size)
+
+        def links(players):
+            return "\n".join(
+                f'<a class="player-row" href="/players/{p["id"]}/{_ascii(_full_name(p)).lower().replace(" ", "-")}">'
+                f'{_full_name(p)}</a>' for p in players)
+
+        return (f"<html><body><h1>{event['tournamentGroup']['name']} player list</h1>\n"
+                f'<div data-ui-tab="Singles">\n{links(md)}\n</div>\n'
+                f'<div data-ui-tab="Qualifying">\n{links(q)}\n</div>\n'
+                f'<div data-ui-tab="Doubles">\n{links(md[:8])}\n</div>\n</body></html>')
+
+    def draw_pdf(self, tid, dtype):
+        event = self._wta_event(tid)
+        if event is None:
+            return None
+        monday = date.fromisoformat(event["startDate"])
+        kind = "M" if dtype == "MDS" else "Q"
+        draw = self.draw("WTA", tid, kind, event["level"], monday)
+        if draw is None:
+            return None
+        full = {**draw, "results": draw["results"][:len(draw["results"]) - draw["in_progress"]]}
+        if kind == "M":
+            title, labels = "MAIN DRAW SINGLES", main_round_labels(draw["size"], draw["rounds"])
+        else:
+            title, labels = "QUALIFYING DRAW SINGLES", qualifying_round_labels(draw["rounds"])
+        end = monday + timedelta(days=6)
+        header = (event["tournamentGroup"]["name"], f"{event['city'].title()}, {event['country']}",
+                  f"{monday.day} - {end.day} {end.strftime('%B %Y')} | $267,082 | {event['surface']}", title, labels)
+        return render_draw_pdf(full, header, pages=2 if draw["size"] > 32 else 1, seed=tid)
+
+    # ── ITF API ────────────────────────────────────────────────────────────
+
+    def itf_calendar(self, date_from, date_to, skip, take):
+        found = [e for e in self.itf_events if date_from <= e["startDate"][:10] <= date_to]
+        return {"items": found[skip:skip + take], "totalItems": len(found)}
+
+    def acceptance_list(self, key):
+        event = self.itf_by_key.get(key)
+        if event is None:
+            return []
+        md, q = self._entrants(f"ITF{event['tournamentId']}", (250, 650), (450, 700), 24, 32, itf=True)
+        alternates = [p for p in self.itf_only[-40:] if p not in q][:6]
+
+        def entries(players):
+            return [{
+                "positionDisplay": str(i), "priority": "",
+                "players": [{"playerId": p["itf_id"], "givenName": p["first"], "familyName": p["last"],
+                             "nationalityCode": p["country"], "atpWtaRank": p.get("rank", ""),
+                             "itfBTRank": p["itf_rank"], "worldRating": ""}],
+            } for i, p in enumerate(players, 1)]
+
+        return [{"entryClassifications": [
+            {"entryClassification": "MAIN DRAW", "entryClassificationCode": "MDA", "entries": entries(md)},
+            {"entryClassification": "QUALIFYING", "entryClassificationCode": "Q", "entries": entries(q)},
+            {"entryClassification": "ALTERNATES", "entryClassificationCode": "A", "entries": entries(alternates)},
+        ]}]
+
+    def drawsheet(self, payload):
+        event = self.itf_by_id.get(int(payload.get("tournamentId") or 0))
+        if event is None or payload.get("weekNumber", 0) > 1:
+            return {"koGroups": []}
+        monday = date.fromisoformat(event["startDate"][:10])
+        kind = "M" if payload.get("eventClassificationCode") == "M" else "Q"
+        draw = self.draw("ITF", event["tournamentId"], kind, event["category"], monday)
+        if draw is None:
+            return {"koGroups": []}
+        played = self._rounds_of(draw)
+        rounds = []
+        alive = draw["slots"]
+        for r in range(draw["rounds"]):
+            remaining = draw["size"] >> r
+            if r < len(played):
+                round_matches = played[r][1]
+            else:
+                round_matches = [(a, b, None, "") for a, b in zip(alive[0::2], alive[1::2])]
+            matches = []
+            for i, (a, b, winner, score) in enumerate(round_matches):
+                bye = r == 0 and (a == "Bye" or b == "Bye")
+                sets, retired = _score_sets(score)
+                teams = []
+                for p in (a, b):
+                    won = winner is not None and p is winner
+                    team = {"isWinner": won or (bye and isinstance(p, dict)), "players": [], "entryStatus": "",
+                            "seeding": None, "scores": []}
+                    if isinstance(p, dict):
+                        team.update(players=[{"playerId": p["itf_id"], "givenName": p["first"],
+                                              "familyName": p["last"], "nationality": p["country"]}],
+                                    entryStatus=p.get("entry", ""), seeding=int(p["seed"]) if p.get("seed") else None)
+                    if winner is not None and sets:
+                        team["scores"] = [{"score": w if won else l, "losingScore": None if won else t}
+                                          for w, l, t in sets]
+                    teams.append(team)
+                matches.append({
+                    "matchId": f"{event['tournamentId']}{kind}{r + 1}{i:02d}",
+                    "playStatusCode": "PC" if winner is not None and not bye else "",
+                    "resultStatusCode": "BYE" if bye else "RET" if retired else "",
+                    "resultStatusDesc": "Bye" if bye else "Retired" if retired else "Completed" if winner else "",
+                    "teams": teams,
+                })
+            desc = ITF_ROUND_DESCS.get(remaining) if kind == "M" else None
+            rounds.append({"roundDesc": desc or f"{r + 1}{'st' if r == 0 else 'nd' if r == 1 else 'th'} Round",
+                           "roundNumber": r + 1, "matches": matches})
+            alive = [w for w, _ in draw["results"][r]] if r < len(draw["results"]) else [None] * (len(alive) // 2)
+        return {"koGroups": [{"rounds": rounds}]}
+
+    def itf_rankings(self, nation, skip, take):
+        players = sorted((p for p in self.ranked + self.itf_only if p["country"] == nation),
+                         key=lambda p: p["itf_rank"])
+        items = [{"playerId": p["itf_id"], "playerGivenName": p["first"], "playerFamilyName": p["last"],
+                  "playerNationalityCode": p["country"], "rank": p["itf_rank"], "points": 2000 // (1 + i)}
+                 for i, p in enumerate(players)]
+        return {"items": items[skip:skip + take], "totalItems": len(items)}
+
+    # ── Routing ────────────────────────────────────────────────────────────
+
+    def respond(self, method, url, body=""):
+        """(status, content type, bytes) for a request."""
+        parts = urlsplit(url)
+        query = {k: v[-1] for k, v in parse_qs(parts.query, keep_blank_values=True).items()}
+        host, path = parts.netloc, parts.path
+        data = None
+        if host == "api.wtatennis.com":
+            if path == "/tennis/players/ranked":
+                data = self.rankings(query.get("at"), int(query.get("page", 0)), int(query.get("pageSize", 100)),
+                                     query.get("nationality"))
+            elif path.rstrip("/") == "/tennis/tournaments":
+                data = self.tournaments(int(query.get("page", 0)), int(query.get("pageSize", 10)),
+                                        query.get("excludeLevels", ""), query.get("from", ""), query.get("to", "9"))
+            elif re.match(r"^/tennis/tournaments/\d+/\d+/matches$", path):
+                data = self.wta_matches(int(path.split("/")[3]))
+            elif re.match(r"^/tennis/players/\d+/matches$", path):
+                data = self.player_info(path.split("/")[3])
+        elif host == "www.wtatennis.com":
+            m = re.match(r"^/tournaments/(\d+)/[^/]+/\d+/player-list$", path)
+            html = self.player_list_html(int(m.group(1))) if m else None
+            if html is not None:
+                return 200, "text/html; charset=utf-8", html.encode("utf-8")
+        elif host == "wtafiles.wtatennis.com":
+            m = re.match(r"^/pdf/draws/\d+/(\d+)/(MDS|QS)\.pdf$", path)
+            pdf = self.draw_pdf(int(m.group(1)), m.group(2)) if m else None
+            if pdf is not None:
+                return 200, "application/pdf", pdf
+        elif host == "www.itftennis.com":
+            if path.endswith("/TournamentApi/GetCalendar"):
+                data = self.itf_calendar(query.get("dateFrom", ""), query.get("dateTo", "9"),
+                                         int(query.get("skip", 0)), int(query.get("take", 100)))
+            elif path.endswith("/TournamentApi/GetAcceptanceList"):
+                data = self.acceptance_list(query.get("tournamentKey", ""))
+            elif path.endswith("/TournamentApi/GetEventFilters"):
+                event = self.itf_by_key.get(query.get("tournamentKey", ""))
+                data = {"tournamentId": event["tournamentId"], "events": []} if event else {}
+            elif path.endswith("/TournamentApi/GetDrawsheet") and method.upper() == "POST":
+                data = self.drawsheet(json.loads(body or "{}"))
+            elif path.endswith("/PlayerRankApi/GetPlayerRankings"):
+                data = self.itf_rankings(query.get("nationCode", ""), int(query.get("skip", 0)),
+                                         int(query.get("take", 50)))
+            elif path.startswith("/en/"):
+                return 200, "text/html; charset=utf-8", b"<html><body>ITF World Tennis Tour</body></html>"
+        if data is None:
+            print(f"Synthetic world: no answer for {method} {url}", file=sys.stderr)
+            return 404, "text/plain", b"Not Found"
+        return 200, JSON_TYPE, json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class WorldDriver:
+    """Stand-in for `webdriver.Chrome`: page bodies come from the world and are recorded as browser loads."""
+
+    def __init__(self, world):
+        self._world = world
+        self._text = ""
+
+    def get(self, url):
+        import http_fixtures
+        status, content_type, content = self._world.respond("GET", url)
+        self._text = content.decode("utf-8") if content_type != "application/pdf" else ""
+        if "html" in content_type:
+            self._text = re.sub(r"<[^>]+>", "", self._text)
+        http_fixtures._record(http_fixtures._BROWSER, url, "", status, "text/plain", self._text.encode("utf-8"))
+
+    def find_element(self, by=None, value=None):
+        import http_fixtures
+        return http_fixtures._ReplayElement(self._text)
+
+    def get_cookies(self):
+        return [{"name": "synthetic", "value": "1", "domain": ".itftennis.com", "path": "/"}]
+
+    def execute_script(self, script, *args):
+        return "Mozilla/5.0 (synthetic)" if "userAgent" in script else None
+
+    def quit(self):
+        pass
+
+
+def serve(fixtures_dir, target):
+    """Run `target` in record mode with every request answered by the world (child process)."""
+    import requests
+    from requests.structures import CaseInsensitiveDict
+
+    import http_fixtures
+    world = World(date.today())
+    http_fixtures.install("record", fixtures_dir)
+
+    def send(adapter, request, **kwargs):
+        body = request.body or ""
+        if isinstance(body, bytes):
+            body = body.decode("utf-8", "replace")
+        status, content_type, content = world.respond(request.method, request.url, body)
+        resp = requests.Response()
+        resp.status_code, resp.reason = status, "OK" if status < 400 else "Not Found"
+        resp.headers = CaseInsensitiveDict({"content-type": content_type, "content-length": str(len(content))})
+        resp._content, resp.url, resp.request, resp.encoding = content, request.url, request, "utf-8"
+        return resp
+
+    requests.adapters.HTTPAdapter.send = send
+    from selenium import webdriver
+    from webdriver_manager.chrome import ChromeDriverManager
+    webdriver.Chrome = lambda *args, **kwargs: WorldDriver(world)
+    ChromeDriverManager.install = lambda self: "chromedriver (synthetic)"
+    time.sleep = lambda seconds: None
+    http_fixtures.run_target(target)
+
+
+def generate(fixtures_dir, targets):
+    if os.path.exists(os.path.join(fixtures_dir, "index.json")):
+        shutil.rmtree(fixtures_dir)
+    os.makedirs(fixtures_dir, exist_ok=True)
+    work_dir = tempfile.mkdtemp(prefix="pipeline-fixtures-")
+    try:
+        tree = os.path.join(work_dir, "tree")
+        copy_tree(tree)
+        env = {**os.environ, "PYTHONPATH": tree, "GITHUB_RUN_ID": "synthetic"}
+        for target in targets:
+            cmd = [sys.executable, os.path.join("benchmarks", "make_pipeline_fixtures.py"),
+                   "--serve", fixtures_dir, target]
+            start = time.perf_counter()
+            proc = subprocess.run(cmd, cwd=tree, env=env, capture_output=True, text=True)
+            print(f"  {target}: {time.perf_counter() - start:.1f}s ({'ok' if proc.returncode == 0 else 'exit ' + str(proc.returncode)})")
+            for line in (proc.stdout + proc.stderr).splitlines():
+                if proc.returncode != 0 or line.startswith("Synthetic world"):
+                    print("    " + line)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    with open(os.path.join(fixtures_dir, "index.json"), encoding="utf-8") as f:
+        print(f"{len(json.load(f))} responses in {fixtures_dir}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the synthetic HTTP fixture set for pipeline_bench.py.")
+    parser.add_argument("targets", nargs="*", default=WORKFLOW_TARGETS, help="Scripts to run, in order")
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES_DIR, help="Fixture directory (rewritten)")
+    parser.add_argument("--serve", nargs=2, metavar=("FIXTURES", "TARGET"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.serve:
+        serve(*args.serve)
+        return
+    generate(os.path.abspath(args.fixtures), args.targets)
+
+
+if __name__ == "__main__":
+    main()
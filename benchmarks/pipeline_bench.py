@@ -0,0 +1,123 @@
+"""Offline end-to-end benchmark of the update workflow, replayed from HTTP fixtures.
+
+    python benchmarks/pipeline_bench.py --record                 # live: (re)record the fixture set
+    python benchmarks/pipeline_bench.py                          # offline: replay and time it
+    python benchmarks/pipeline_bench.py --latency 0.2 --repeat 2 main.py
+
+Every run works on a scratch copy of the tree (without .git and .cache), so
+the checkout is left untouched. The targets (by default the workflow's scripts,
+in the workflow's order) run through `http_fixtures.py`; their metrics are read
+back from the copy's run_metrics.json and printed per script and per stage.
+With --repeat, the first run starts with cold caches and later runs reuse the
+same copy (warm caches).
+
+The committed fixture set in benchmarks/fixtures/pipeline is synthetic: it is
+generated by make_pipeline_fixtures.py (made-up players and tournaments, no
+network needed); regenerate it when the scripts' requests change. --record
+replaces it with a live recording instead (Chrome and network access needed).
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_FIXTURES_DIR = os.path.join(BASE_DIR, "benchmarks", "fixtures", "pipeline")
+WORKFLOW_TARGETS = [
+    "populate_data/load_weekly_ranking.py",
+    "populate_data/itf_load_new.py",
+    "populate_data/wta_load_new.py",
+    "populate_data/tournament_sizes_update.py",
+    "main.py",
+]
+MAX_STAGE_LINES = 10
+
+
+def copy_tree(dest):
+    shutil.copytree(BASE_DIR, dest, ignore=shutil.ignore_patterns(".git", ".cache", "__pycache__", "fixtures"))
+
+
+def run_targets(work_dir, targets, mode, fixtures_dir, latency, sleep_scale, run_id):
+    env = {**os.environ, "GITHUB_RUN_ID": run_id, "PYTHONPATH": work_dir}
+    for target in targets:
+        cmd = [sys.executable, "http_fixtures.py", mode, fixtures_dir, target,
+               "--latency", str(latency), "--sleep-scale", str(sleep_scale)]
+        start = time.perf_counter()
+        proc = subprocess.run(cmd, cwd=work_dir, env=env, capture_output=True, text=True)
+        status = "ok" if proc.returncode == 0 else f"exit {proc.returncode}"
+        print(f"  {target}: {time.perf_counter() - start:.1f}s ({status})")
+        if proc.returncode != 0:
+            print("\n".join("    " + line for line in (proc.stdout + proc.stderr).strip().splitlines()[-15:]))
+
+
+def load_run(work_dir, run_id):
+    try:
+        with open(os.path.join(work_dir, ".cache", "metrics", "run_metrics.json"), encoding="utf-8") as f:
+            runs = json.load(f).get("runs") or []
+    except (OSError, ValueError):
+        return {}
+    return next((r["scripts"] for r in reversed(runs) if r.get("run_id") == run_id), {})
+
+
+def print_run(scripts):
+    total = 0.0
+    for name, m in scripts.items():
+        http = m.get("http") or {}
+        fixtures = m.get("http_fixtures") or {}
+        total += m.get("seconds", 0)
+        print(f"  {name:<45} {m.get('seconds', 0):>7.1f}s  {http.get('requests', 0):>5} requests  "
+              f"{fixtures.get('fuzzy', 0):>4} by endpoint  {fixtures.get('missed', 0):>4} missed  "
+              f"{(m.get('sleep') or {}).get('seconds', 0):>6.1f} thread-s asleep  peak RSS {m.get('peak_rss_mb') or 0:.0f} MB")
+        stages = sorted((m.get("stages") or {}).items(), key=lambda kv: kv[1].get("seconds", 0), reverse=True)
+        for stage, t in stages[:MAX_STAGE_LINES]:
+            print(f"      {stage:<41} {t.get('seconds', 0):>7.2f}s  (at {t.get('start', 0):.1f}-{t.get('end', 0):.1f}s)")
+        if m.get("critical_path"):
+            print("      critical path: " + " -> ".join(m["critical_path"]))
+    print(f"  Total: {total:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay the update workflow offline and report per-stage timings.")
+    parser.add_argument("targets", nargs="*", default=WORKFLOW_TARGETS,
+                        help="Scripts (or module:function) to run, in order (default: the workflow's scripts)")
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES_DIR, help="Fixture directory")
+    parser.add_argument("--record", action="store_true", help="Run live and record the fixture set instead")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds added to every replayed response")
+    parser.add_argument("--sleep-scale", type=float, default=0.0,
+                        help="Scale of the scripts' own pacing sleeps when replaying (default: skip them)")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs; the first is cold, the rest warm")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch copy and print its path")
+    args = parser.parse_args()
+
+    fixtures_dir = os.path.abspath(args.fixtures)
+    mode = "record" if args.record else "replay"
+    if mode == "replay" and not os.path.exists(os.path.join(fixtures_dir, "index.json")):
+        sys.exit(f"No fixture set in {fixtures_dir}; record one with --record first.")
+    if mode == "record" and os.path.exists(os.path.join(fixtures_dir, "index.json")):
+        # Each target's recordings are merged into index.json, so start from an
+        # empty set: old entries would otherwise be matched by endpoint in replay.
+        shutil.rmtree(fixtures_dir)
+
+    work_dir = tempfile.mkdtemp(prefix="pipeline-bench-")
+    try:
+        copy_tree(os.path.join(work_dir, "tree"))
+        tree = os.path.join(work_dir, "tree")
+        for i in range(1 if args.record else max(1, args.repeat)):
+            run_id = f"bench-{i + 1}"
+            print(f"Run {i + 1} ({mode}, {'cold' if i == 0 else 'warm'} caches):")
+            run_targets(tree, args.targets, mode, fixtures_dir, args.latency, args.sleep_scale, run_id)
+            print_run(load_run(tree, run_id))
+    finally:
+        if args.keep:
+            print(f"Scratch copy kept in {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
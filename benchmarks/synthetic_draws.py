@@ -0,0 +1,202 @@
+"""Synthetic players and WTA-style draw PDFs for the benchmark fixtures.
+
+Nothing here comes from the WTA: names are made up from syllables, and
+`render_draw_pdf` lays a draw out the way `draws.parse_draw_pdf` reads the
+real PDFs (header lines, then per page the position/name/country lines of its
+players, the winners and scores round by round, the round labels and the
+footer). Everything is derived from a `random.Random`, so the same seed always
+gives the same bytes.
+"""
+
+import random
+
+import fitz
+
+FIRST_NAMES = [
+    "Ana", "Bianca", "Camila", "Daria", "Elena", "Flavia", "Greta", "Helena", "Irina", "Julia",
+    "Karla", "Lucia", "Marta", "Nadia", "Olivia", "Paula", "Renata", "Sofia", "Tamara", "Valeria",
+    "Wanda", "Ximena", "Yana", "Zoe", "Abril", "Brenda", "Clara", "Delfina", "Emma", "Fiona",
+]
+LAST_SYLLABLES = ["bar", "co", "del", "fer", "gal", "ko", "lin", "mar", "nov", "ra", "san", "ter", "va", "zu",
+                  "mi", "sta", "ber", "lo", "ne", "ri"]
+LAST_ENDINGS = ["", "a", "ez", "ova", "ini", "son", "ic", "ski", "o", "es"]
+ACCENTED_LAST_NAMES = ["Sánchez Lobo", "Núñez", "Müller-Aré", "Peña Ruiz", "Ibáñez", "Çelik"]
+COUNTRIES = ["USA", "FRA", "ESP", "ITA", "GER", "CZE", "POL", "JPN", "CHN", "AUS", "GBR", "UKR", "ROU", "CAN",
+             "BEL", "NED", "SUI", "SRB", "CRO", "SLO", "BRA", "COL", "MEX", "CHI", "PER", "URU", "PAR"]
+LATAM_COUNTRIES = ["ARG", "BRA", "COL", "MEX", "CHI", "PER", "URU", "PAR"]
+
+PAGE_WIDTH, PAGE_HEIGHT = 842, 595
+FONT_SIZE = 6
+LINE_HEIGHT = 7.5
+COLUMN_WIDTH = 100
+MARGIN = 24
+
+
+def synthetic_players(rng, count, countries=COUNTRIES, start_id=900000):
+    """`count` made-up players: {"id", "first", "last", "country", "dob"}, unique full names."""
+    players = []
+    seen = set()
+    while len(players) < count:
+        first = rng.choice(FIRST_NAMES)
+        if rng.random() < 0.03:
+            last = rng.choice(ACCENTED_LAST_NAMES)
+        else:
+            last = "".join(rng.choice(LAST_SYLLABLES) for _ in range(rng.randint(2, 3)))
+            last = (last + rng.choice(LAST_ENDINGS)).capitalize()
+        if (first, last) in seen:
+            continue
+        seen.add((first, last))
+        dob = f"{rng.randint(1990, 2009)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        players.append({"id": str(start_id + len(players)), "first": first, "last": last,
+                        "country": rng.choice(countries), "dob": dob})
+    return players
+
+
+def winner_label(player):
+    """How the draw PDFs name a winner: first initial and last name ("A. Smith")."""
+    return f"{player['first'][0]}. {player['last']}"
+
+
+def random_score(rng, retired=False):
+    sets = []
+    for _ in range(rng.choice([2, 2, 2, 3])):
+        loser = rng.randint(0, 6)
+        if loser >= 5:
+            sets.append(f"7{loser}" if loser == 5 else f"76({rng.randint(0, 8)})")
+        else:
+            sets.append(f"6{loser}")
+    if len(sets) == 3:
+        sets[1] = sets[1][::-1] if "(" not in sets[1] else f"67({rng.randint(0, 8)})"
+    if retired:
+        sets = sets[:1] + [f"{rng.randint(0, 4)}{rng.randint(0, 4)}"] + ["RET"]
+    return " ".join(sets)
+
+
+def build_draw(rng, players, size, rounds, played_rounds, byes=(), qualifier_slots=(), entries=None, seeds=0,
+               placed=None):
+    """Place players into a draw of `size` positions and play `played_rounds` rounds.
+
+    `rounds` is the number of rounds shown (log2(size) for a main draw, fewer for
+    qualifying). Positions in `byes` and `qualifier_slots` stay empty; `entries`
+    maps a position to an entry code and `placed` a position to a player put
+    there as is (e.g. a qualifier). The first `seeds` players are seeded and
+    placed at the top and bottom of the sections. Returns {"slots", "results"}:
+    slots[pos - 1] is a player dict, "Bye" or "Qualifier"; results[r] lists the
+    (player, score) of each match of round r + 1.
+    """
+    placed = placed or {}
+    open_positions = [p for p in range(1, size + 1)
+                      if p not in byes and p not in qualifier_slots and p not in placed]
+    field = list(players[:len(open_positions)])
+    seeded = field[:seeds]
+    unseeded = field[seeds:]
+    rng.shuffle(unseeded)
+    seed_positions = []
+    section = size // max(1, seeds)
+    for i in range(seeds):
+        seed_positions.append(i * section + 1 if i % 2 == 0 else (i + 1) * section)
+    slots = [None] * size
+    for i, (player, pos) in enumerate(zip(seeded, seed_positions)):
+        slots[pos - 1] = {**player, "seed": str(i + 1)}
+    for pos in byes:
+        slots[pos - 1] = "Bye"
+    for pos in qualifier_slots:
+        slots[pos - 1] = "Qualifier"
+    for pos, player in placed.items():
+        slots[pos - 1] = {"seed": "", **player}
+    rest = iter(unseeded)
+    for pos in range(1, size + 1):
+        if slots[pos - 1] is None:
+            slots[pos - 1] = {**next(rest), "seed": ""}
+    for pos, code in (entries or {}).items():
+        if isinstance(slots[pos - 1], dict):
+            slots[pos - 1]["entry"] = code
+
+    results = []
+    alive = slots
+    for _ in range(min(played_rounds, rounds)):
+        winners = []
+        for a, b in zip(alive[0::2], alive[1::2]):
+            if not isinstance(b, dict):
+                winners.append((a, ""))
+            elif not isinstance(a, dict):
+                winners.append((b, ""))
+            else:
+                winner = a if rng.random() < 0.55 else b
+                winners.append((winner, random_score(rng, retired=rng.random() < 0.03)))
+        results.append(winners)
+        alive = [w for w, _ in winners]
+    return {"slots": slots, "results": results, "size": size, "rounds": rounds}
+
+
+def main_round_labels(size, rounds):
+    labels = []
+    for r in range(rounds):
+        remaining = size >> r
+        labels.append({8: "Quarterfinals", 4: "Semifinals", 2: "Final"}.get(remaining, f"Round of {remaining}"))
+    return labels
+
+
+def qualifying_round_labels(rounds):
+    return [f"Q{r + 1}" for r in range(rounds - 1)] + ["Qualifier"]
+
+
+def _player_lines(pos, slot, style):
+    entry = slot.get("entry", "") if isinstance(slot, dict) else ""
+    position = f"{pos} {entry}".strip() if entry and style != "combined" else str(pos)
+    if slot in ("Bye", "Qualifier"):
+        return [position, slot]
+    name = f"{slot['last'].upper()}, {slot['first']}"
+    seed = slot.get("seed", "")
+    if style == "combined" and entry:
+        return [f"{pos} {entry} {seed} {name}".replace("  ", " "), slot["country"]]
+    if style == "inline":
+        return [position, f"{seed} {name}{slot['country']}".strip()]
+    return [position, f"{seed} {name}".strip(), slot["country"]]
+
+
+def _page_lines(draw, page, pages, labels, rng):
+    size = draw["size"]
+    per_page = size // pages
+    lines = []
+    for pos in range(page * per_page + 1, (page + 1) * per_page + 1):
+        roll = rng.random()
+        style = "combined" if roll < 0.1 else "inline" if roll < 0.15 else "lines"
+        lines += _player_lines(pos, draw["slots"][pos - 1], style)
+    r1_per_page = size // (2 * pages)
+    for r, winners in enumerate(draw["results"]):
+        count = r1_per_page >> r
+        if count < 1:
+            break
+        for player, score in winners[page * count:(page + 1) * count]:
+            lines.append(winner_label(player))
+            if score:
+                lines.append(score)
+    return lines + labels
+
+
+def render_draw_pdf(draw, header, pages=1, seed=0):
+    """PDF bytes of `draw` (see build_draw) on `pages` pages.
+
+    `header` is (tournament name, location, "dates | prize | surface", draw title,
+    round labels). Layout details (combined or inline player lines) vary with
+    `seed` the way they do between real PDFs.
+    """
+    name, location, info, title, labels = header
+    rng = random.Random(seed)
+    doc = fitz.open()
+    for page in range(pages):
+        lines = _page_lines(draw, page, pages, labels, rng)
+        if page == 0:
+            lines = [name, location, info, title, "RELEASED"] + lines
+        lines += ["WTA Supervisor: A. Referee", "Seeded players are listed in bold"]
+        pdf_page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+        x, y = MARGIN, MARGIN
+        for line in lines:
+            pdf_page.insert_text((x, y), line, fontsize=FONT_SIZE)
+            y += LINE_HEIGHT
+            if y > PAGE_HEIGHT - MARGIN:
+                x, y = x + COLUMN_WIDTH, MARGIN
+    pdf_bytes = doc.tobytes(garbage=4, deflate=True, clean=True, no_new_id=True)
+    doc.close()
+    return pdf_bytes
@@ -3,6 +3,7 @@ from datetime import datetime, timedelta
 
 from config import CONTINENT_KEYS
 from utils import get_continent, get_calendar_column, get_tournament_sort_order
+from week_index import monday_of, shift_week
 
 
 def get_next_monday():
@@ -36,9 +37,7 @@ def format_week_label(monday_date):
 
 
 def get_monday_offset(date_str, weeks_back):
-    dt = pd.to_datetime(date_str)
-    monday = dt - timedelta(days=dt.weekday())
-    return (monday - timedelta(weeks=weeks_back)).strftime('%Y-%m-%d')
+    return shift_week(monday_of(date_str), -weeks_back)
 
 
 def generate_dynamic_monday_map(num_weeks=4):
@@ -1,149 +1,16 @@
 import os
-import json
-import unicodedata
+
+from names import repair_name_text, load_player_mapping, get_name_index
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(BASE_DIR, "data")
 PLAYER_ALIASES_WTA_ITF_FILE = os.path.join(DATA_DIR, "player_aliases_wta_itf.json")
 
-_MOJIBAKE_REPLACEMENTS = {
-    "\u00ed\u00a1": "á",
-    "\u00ed\u00a8": "è",
-    "\u00ed\u00a9": "é",
-    "\u00ed\u00b1": "ñ",
-    "\u00ed\u00b3": "ó",
-    "\u00ed\u00bc": "ü",
-    "\u00ed\u02c6": "È",
-}
-
-
-def repair_name_text(value):
-    text = str(value or "")
-    if not text:
-        return ""
-
-    repaired = text
-
-    # Handle the more common UTF-8-decoded-as-Latin-1 mojibake first.
-    if any(token in repaired for token in ("Ã", "Â", "â€", "â€™", "â€œ", "â€\x9d")):
-        for source_encoding in ("latin-1", "cp1252"):
-            try:
-                repaired = repaired.encode(source_encoding).decode("utf-8")
-                break
-            except (UnicodeEncodeError, UnicodeDecodeError):
-                continue
-
-    # Then patch the OEM-codepage style sequences present in player_aliases_wta_itf.json.
-    for bad, good in _MOJIBAKE_REPLACEMENTS.items():
-        repaired = repaired.replace(bad, good)
-
-    return repaired
-
-def _compact_spaces(value):
-    return " ".join(repair_name_text(value).strip().split())
-
-
-def _fold_accents(value):
-    if not value:
-        return ""
-    nfkd = unicodedata.normalize("NFKD", value)
-    return "".join(ch for ch in nfkd if not unicodedata.combining(ch))
-
-
-def _add_unique(target_list, value):
-    v = _compact_spaces(value)
-    if v and v not in target_list:
-        target_list.append(v)
-
-
-def _lookup_keys(value):
-    base = _compact_spaces(value).upper()
-    if not base:
-        return []
-    keys = [base]
-
-    folded = _fold_accents(base)
-    if folded and folded not in keys:
-        keys.append(folded)
-
-    dehyphen = _compact_spaces(base.replace("-", " "))
-    if dehyphen and dehyphen not in keys:
-        keys.append(dehyphen)
-
-    folded_dehyphen = _fold_accents(dehyphen)
-    if folded_dehyphen and folded_dehyphen not in keys:
-        keys.append(folded_dehyphen)
-
-    return keys
-
-
-def load_player_mapping(filename=PLAYER_ALIASES_WTA_ITF_FILE):
-    if not os.path.exists(filename):
-        print(f"Alerta: No se encontro {filename}.")
-        return {}
-    try:
-        with open(filename, "r", encoding="utf-8-sig") as f:
-            raw = json.load(f)
-    except Exception as e:
-        print(f"Alerta: error leyendo {filename}: {e}")
-        return {}
-
-    mapping = {}
-
-    # Backward compatibility: if legacy dict mapping is passed, keep it usable.
-    if isinstance(raw, dict):
-        for display_name, aliases in raw.items():
-            display = _compact_spaces(display_name)
-            if not display:
-                continue
-            bucket = mapping.setdefault(display, [])
-            _add_unique(bucket, display)
-            if isinstance(aliases, list):
-                for alias in aliases:
-                    _add_unique(bucket, alias)
-        return mapping
-
-    if not isinstance(raw, list):
-        return {}
-
-    for item in raw:
-        if not isinstance(item, dict):
-            continue
-
-        display = _compact_spaces(
-            item.get("display_name")
-            or item.get("wta_name")
-            or item.get("itf_name")
-            or item.get("bjkc_name")
-        )
-        if not display:
-            continue
-
-        bucket = mapping.setdefault(display, [])
-        for key in ("display_name", "wta_name", "itf_name", "bjkc_name"):
-            _add_unique(bucket, item.get(key))
-
-        extra_aliases = item.get("aliases")
-        if isinstance(extra_aliases, list):
-            for alias in extra_aliases:
-                _add_unique(bucket, alias)
-
-    return mapping
-
-
-PLAYER_MAPPING = load_player_mapping()
-
-NAME_LOOKUP = {}
-for display_name, aliases in PLAYER_MAPPING.items():
-    display_upper = _compact_spaces(display_name).upper()
-    if not display_upper:
-        continue
-    for key in _lookup_keys(display_upper):
-        NAME_LOOKUP[key] = display_upper
-
-    for alias in aliases:
-        for key in _lookup_keys(alias):
-            NAME_LOOKUP[key] = display_upper
+# Name normalisation lives in names.py; PLAYER_MAPPING / NAME_LOOKUP come from its
+# compiled (pickled, content-hashed) index instead of re-folding every alias here.
+_NAME_INDEX = get_name_index()
+PLAYER_MAPPING = _NAME_INDEX.player_mapping
+NAME_LOOKUP = _NAME_INDEX.name_lookup
 
 WTA_RANKINGS_CSV = os.path.join(DATA_DIR, "wta_rankings_20_29.csv")
 WTA_RANKINGS_CSV_10_19 = os.path.join(DATA_DIR, "wta_rankings_10_19.csv")
@@ -151,6 +18,47 @@ WTA_RANKINGS_CSV_00_09 = os.path.join(DATA_DIR, "wta_rankings_00_09.csv")
 WTA_RANKINGS_CSV_83_99 = os.path.join(DATA_DIR, "wta_rankings_83_99.csv")
 ITF_CACHE_FILE = os.path.join(DATA_DIR, "itf_rankings_cache.json")
 ENTRY_LISTS_CACHE_FILE = os.path.join(DATA_DIR, "entry_lists_cache.json")
+DRAW_PDF_HTTP_CACHE_FILE = os.path.join(DATA_DIR, "draw_pdf_http_cache.json")
+ITF_TOURNAMENT_IDS_FILE = os.path.join(DATA_DIR, "itf_tournament_ids.json")
+
+# Draws stage: concurrent PDF downloads (per-host throttled) + process-pool parsing.
+DRAWS_FETCH_WORKERS = 8
+DRAWS_PARSE_WORKERS = 4
+DRAWS_HOST_MIN_INTERVAL = 0.25  # seconds between request starts to the same host
+ITF_DRAWS_FETCH_WORKERS = 6
+ITF_DRAWS_MAX_RETRIES = 3
+
+# ITF JSON APIs: harvest anti-bot cookies with Chrome once, then use a pooled
+# requests.Session (falls back to Selenium page loads if the session gets blocked).
+ITF_HTTP_SESSION_MODE = True
+ITF_HTTP_WORKERS = 6
+
+# main.py runs its steps as a stage DAG (stages.py); independent stages overlap.
+PIPELINE_STAGE_WORKERS = 6
+
+# Columnar rankings store rebuilt from the rankings CSVs (rankings_store.py); kept
+# via actions/cache, not committed.
+RANKINGS_STORE_DIR = os.path.join(BASE_DIR, ".cache", "rankings_store")
+
+# Derived match-history caches (normalized rows per source CSV, per-week WTA ranks
+# of history rows); kept via actions/cache, not committed, rebuilt when missing.
+HISTORY_CACHE_DIR = os.path.join(BASE_DIR, ".cache", "history")
+HISTORY_STORE_FILE = os.path.join(HISTORY_CACHE_DIR, "match_history_store.json")
+HISTORY_RANKS_CACHE_FILE = os.path.join(HISTORY_CACHE_DIR, "history_ranks_cache.json")
+
+# Shared WTA tournament-matches response cache (persisted between workflow runs via
+# actions/cache, not committed). Finished tournaments never expire.
+WTA_MATCHES_CACHE_DIR = os.path.join(BASE_DIR, ".cache", "wta_matches")
+WTA_MATCHES_CACHE_TTL = 10 * 60  # seconds, for tournaments still in progress
+
+# Rendered page sections keyed by an input fingerprint (also kept via actions/cache,
+# not committed): sections whose inputs did not change are reused as-is.
+RENDER_CACHE_FILE = os.path.join(BASE_DIR, ".cache", "render", "sections.json")
+
+# Per-run timings / HTTP / memory telemetry of the workflow scripts (run_metrics.py),
+# kept across runs via actions/cache; generate_run_report.py summarises it.
+RUN_METRICS_FILE = os.path.join(BASE_DIR, ".cache", "metrics", "run_metrics.json")
+RUN_METRICS_HISTORY_RUNS = 300
 
 API_URL = "https://api.wtatennis.com/tennis/players/ranked"
 HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36"}
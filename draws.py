@@ -1,10 +1,22 @@
 """Parse WTA draw PDFs and ITF draw JSON data."""
 
+import hashlib
 import math
 import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
+
 import requests
 import fitz
 
+from config import (
+    DRAWS_FETCH_WORKERS, DRAWS_PARSE_WORKERS, DRAWS_HOST_MIN_INTERVAL,
+    ITF_DRAWS_FETCH_WORKERS, ITF_DRAWS_MAX_RETRIES
+)
+from run_metrics import count_retry
+
 
 _DRAW_TYPES = [
     ("MDS", "Main Draw"),
@@ -13,21 +25,77 @@ _DRAW_TYPES = [
 
 _PDF_BASE = "https://wtafiles.wtatennis.com/pdf/draws/{year}/{tid}/{dtype}.pdf"
 
+# Shared keep-alive session; the pool is sized for the concurrent draws stage.
+_PDF_SESSION = requests.Session()
+_PDF_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=max(10, DRAWS_FETCH_WORKERS)))
+
+
+class _HostRateLimiter:
+    """Space out request starts to the same host by at least `min_interval` seconds."""
+
+    def __init__(self, min_interval):
+        self.min_interval = max(0.0, float(min_interval or 0))
+        self._lock = threading.Lock()
+        self._next_slot = {}
+
+    def wait(self, host):
+        if self.min_interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
 
 def _extract_tournament_id(url):
     m = re.search(r'/tournaments/(\d+)/', url)
     return m.group(1) if m else None
 
 
-def fetch_draw_pdf_bytes(tournament_id, year, draw_type="MDS"):
+def draw_pdf_cache_key(year, tournament_id, draw_type):
+    """Key of a draw PDF in the conditional-GET cache (draw_pdf_http_cache.json)."""
+    return f"{year}/{tournament_id}/{draw_type}"
+
+
+def fetch_draw_pdf_conditional(tournament_id, year, draw_type="MDS", cache_entry=None):
+    """Download a draw PDF, revalidating against a previous cache entry.
+
+    cache_entry is {"etag", "last_modified", "sha256"} from an earlier download.
+    Returns (pdf_bytes, new_cache_entry, unchanged):
+      - 304 Not Modified -> (None, cache_entry, True)
+      - 200 with a valid PDF -> (bytes, fresh entry, True if the content hash matches)
+      - anything else -> (None, None, False)
+    """
     url = _PDF_BASE.format(year=year, tid=tournament_id, dtype=draw_type)
+    headers = {}
+    if cache_entry:
+        if cache_entry.get("etag"):
+            headers["If-None-Match"] = cache_entry["etag"]
+        if cache_entry.get("last_modified"):
+            headers["If-Modified-Since"] = cache_entry["last_modified"]
     try:
-        resp = requests.get(url, timeout=15)
-        if resp.status_code == 200 and len(resp.content) > 500 and resp.content[:5] == b'%PDF-':
-            return resp.content
-        return None
+        resp = _PDF_SESSION.get(url, headers=headers, timeout=15)
     except Exception:
-        return None
+        return None, None, False
+    if resp.status_code == 304 and cache_entry:
+        return None, cache_entry, True
+    content = resp.content
+    if resp.status_code != 200 or len(content) <= 500 or content[:5] != b'%PDF-':
+        return None, None, False
+    new_entry = {
+        "etag": resp.headers.get("ETag") or "",
+        "last_modified": resp.headers.get("Last-Modified") or "",
+        "sha256": hashlib.sha256(content).hexdigest(),
+    }
+    unchanged = bool(cache_entry) and cache_entry.get("sha256") == new_entry["sha256"]
+    return content, new_entry, unchanged
+
+
+def fetch_draw_pdf_bytes(tournament_id, year, draw_type="MDS"):
+    pdf_bytes, _, _ = fetch_draw_pdf_conditional(tournament_id, year, draw_type)
+    return pdf_bytes
 
 
 def _is_score(text):
@@ -363,6 +431,120 @@ def fetch_tournament_draws(tournament_url, year):
     return draws
 
 
+def _parse_draw_pdf_safe(pdf_bytes):
+    """Process-pool entry point: never raises, returns (draw_data, error_message)."""
+    try:
+        return parse_draw_pdf(pdf_bytes), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _open_parse_pool(parse_workers):
+    if parse_workers <= 1:
+        return None
+    try:
+        return ProcessPoolExecutor(max_workers=parse_workers)
+    except Exception as e:
+        print(f"Draw parse pool unavailable, parsing inline: {e}")
+        return None
+
+
+def fetch_tournament_draws_many(tournament_urls, year,
+                                previous_draws=None, http_cache=None,
+                                max_workers=DRAWS_FETCH_WORKERS,
+                                parse_workers=DRAWS_PARSE_WORKERS,
+                                min_host_interval=DRAWS_HOST_MIN_INTERVAL):
+    """Fetch and parse WTA draws for many tournaments at once.
+
+    PDFs are downloaded on a thread pool (request starts throttled per host) and
+    handed to a process pool for parsing as soon as each download completes.
+    Returns {tournament_url: draws}, where draws has the same shape as
+    fetch_tournament_draws(); tournaments with nothing available map to {}.
+
+    previous_draws ({tournament_url: draws}, e.g. from draws_store_cache.json)
+    and http_cache ({draw_pdf_cache_key: entry}, updated in place) enable
+    conditional GETs: a PDF that is not modified, or whose bytes hash the same
+    as last time, reuses the previously parsed draw instead of being parsed.
+    """
+    previous_draws = previous_draws or {}
+    if http_cache is None:
+        http_cache = {}
+    results = {url: {} for url in tournament_urls}
+    pdf_jobs = []
+    for url in results:
+        tid = _extract_tournament_id(url)
+        if not tid:
+            continue
+        for dtype_code, dtype_label in _DRAW_TYPES:
+            pdf_jobs.append((url, tid, dtype_code, dtype_label))
+    if not pdf_jobs:
+        return results
+
+    limiter = _HostRateLimiter(min_host_interval)
+    host = urlparse(_PDF_BASE).netloc
+
+    def _download(tid, dtype_code, cache_entry):
+        limiter.wait(host)
+        return fetch_draw_pdf_conditional(tid, year, dtype_code, cache_entry)
+
+    parse_pool = _open_parse_pool(parse_workers)
+    pending = []  # (job, pdf_bytes, parse future or None)
+    reused = 0
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as fetch_pool:
+            download_futures = {}
+            for job in pdf_jobs:
+                url, tid, dtype_code, _ = job
+                # Only revalidate when there is a parsed draw to fall back on.
+                prev_parsed = (previous_draws.get(url) or {}).get(dtype_code)
+                cache_entry = http_cache.get(draw_pdf_cache_key(year, tid, dtype_code)) if prev_parsed else None
+                download_futures[fetch_pool.submit(_download, tid, dtype_code, cache_entry)] = job
+            for fut in as_completed(download_futures):
+                url, tid, dtype_code, _ = download_futures[fut]
+                pdf_bytes, cache_entry, unchanged = fut.result()
+                if unchanged:
+                    if cache_entry:
+                        http_cache[draw_pdf_cache_key(year, tid, dtype_code)] = cache_entry
+                    results[url][dtype_code] = previous_draws[url][dtype_code]
+                    reused += 1
+                    continue
+                if not pdf_bytes:
+                    continue
+                parse_fut = parse_pool.submit(_parse_draw_pdf_safe, pdf_bytes) if parse_pool else None
+                pending.append((download_futures[fut], pdf_bytes, cache_entry, parse_fut))
+
+        for (url, tid, dtype_code, dtype_label), pdf_bytes, cache_entry, parse_fut in pending:
+            draw_data = err = None
+            if parse_fut is not None:
+                try:
+                    draw_data, err = parse_fut.result()
+                except Exception:
+                    parse_fut = None  # broken worker process: parse in-process below
+            if parse_fut is None:
+                draw_data, err = _parse_draw_pdf_safe(pdf_bytes)
+            cache_key = draw_pdf_cache_key(year, tid, dtype_code)
+            if err:
+                print(f"Error parsing {dtype_label} draw for {tid}: {err}")
+                # Drop the validators so the next run downloads and parses this PDF again
+                # instead of treating it as unchanged and reusing the older draw.
+                http_cache.pop(cache_key, None)
+                continue
+            if cache_entry:
+                http_cache[cache_key] = cache_entry
+            results[url][dtype_code] = draw_data
+    finally:
+        if parse_pool is not None:
+            parse_pool.shutdown()
+
+    print(f"  Draw PDFs: {reused} unchanged (parse skipped), {len(pending)} downloaded and parsed")
+
+    # Keep the MDS-then-QS key order that fetch_tournament_draws() produces.
+    return {
+        url: {code: draws[code] for code, _ in _DRAW_TYPES if code in draws}
+        for url, draws in results.items()
+    }
+
+
 # ── ITF draw support ──────────────────────────────────────────────────────────
 
 _ITF_DRAW_TYPES = [
@@ -383,8 +565,15 @@ _ITF_ENTRY_MAP = {
 }
 
 
-def _fetch_itf_drawsheet(tournament_id, classification, week_number=0):
-    """Fetch an ITF drawsheet via POST API (no Selenium needed)."""
+_ITF_SESSION = requests.Session()
+_ITF_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=max(10, ITF_DRAWS_FETCH_WORKERS)))
+
+
+def _fetch_itf_drawsheet(tournament_id, classification, week_number=0, max_retries=ITF_DRAWS_MAX_RETRIES):
+    """Fetch an ITF drawsheet via POST API (no Selenium needed).
+
+    Throttling (429) and transient server errors are retried with exponential backoff.
+    """
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36",
         "Referer": f"https://www.itftennis.com/en/tournament/draws-and-results/print/?tournamentId={tournament_id}&circuitCode=WT",
@@ -399,12 +588,24 @@ def _fetch_itf_drawsheet(tournament_id, classification, week_number=0):
         "tournamentId": str(tournament_id),
         "weekNumber": week_number,
     }
-    try:
-        resp = requests.post(_ITF_DRAWSHEET_URL, json=payload, headers=headers, timeout=15)
-        resp.raise_for_status()
-        return resp.json()
-    except Exception:
-        return None
+    for attempt in range(max_retries + 1):
+        if attempt:
+            count_retry(_ITF_DRAWSHEET_URL)
+        try:
+            resp = _ITF_SESSION.post(_ITF_DRAWSHEET_URL, json=payload, headers=headers, timeout=15)
+            if resp.status_code in (429, 500, 502, 503, 504):
+                raise requests.HTTPError(f"HTTP {resp.status_code}")
+            resp.raise_for_status()
+            return resp.json()
+        except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as e:
+            status = getattr(getattr(e, "response", None), "status_code", None)
+            if status is not None and status < 500 and status != 429:
+                return None
+            if attempt < max_retries:
+                time.sleep(min(30.0, 1.0 * (2 ** attempt)))
+        except Exception:
+            return None
+    return None
 
 
 def _parse_itf_score(teams, winner_idx):
@@ -605,32 +806,62 @@ def _parse_itf_draw(data):
     }
 
 
+def _itf_draw_requests(is_multiweek):
+    week_number = 1 if is_multiweek else 0
+    return [(classification, dtype_code, dtype_label, week_number)
+            for classification, dtype_code, dtype_label in _ITF_DRAW_TYPES]
+
+
+def _parse_itf_drawsheet_into(draws, raw, tournament_id, dtype_code, dtype_label):
+    if raw and raw.get("koGroups"):
+        try:
+            parsed = _parse_itf_draw(raw)
+            if parsed and parsed["players"]:
+                draws[dtype_code] = parsed
+        except Exception as e:
+            print(f"Error parsing ITF {dtype_label} for {tournament_id}: {e}")
+
+
 def fetch_itf_tournament_draws(tournament_id, is_multiweek=False):
     """Fetch and parse ITF draws for a tournament. Returns dict like WTA draws."""
     draws = {}
-    for classification, dtype_code, dtype_label in _ITF_DRAW_TYPES:
-        week_number = 1 if is_multiweek else 0
+    for classification, dtype_code, dtype_label, week_number in _itf_draw_requests(is_multiweek):
         raw = _fetch_itf_drawsheet(tournament_id, classification, week_number)
-        if raw and raw.get("koGroups"):
-            try:
-                parsed = _parse_itf_draw(raw)
-                if parsed and parsed["players"]:
-                    draws[dtype_code] = parsed
-            except Exception as e:
-                print(f"Error parsing ITF {dtype_label} for {tournament_id}: {e}")
+        _parse_itf_drawsheet_into(draws, raw, tournament_id, dtype_code, dtype_label)
     return draws
 
 
+def fetch_itf_tournament_draws_many(tournaments, max_workers=ITF_DRAWS_FETCH_WORKERS):
+    """Fetch and parse ITF draws for many tournaments at once.
+
+    tournaments is a list of (tournament_id, is_multiweek). Every
+    (tournamentId, classification, weekNumber) drawsheet POST for the run is
+    fanned out over one pooled session with at most max_workers in flight.
+    Returns {tournament_id: draws} like fetch_itf_tournament_draws().
+    """
+    requests_to_make = []
+    for tournament_id, is_multiweek in tournaments:
+        for classification, dtype_code, dtype_label, week_number in _itf_draw_requests(is_multiweek):
+            requests_to_make.append((tournament_id, classification, dtype_code, dtype_label, week_number))
+
+    raw_by_request = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        futures = {
+            pool.submit(_fetch_itf_drawsheet, req[0], req[1], req[4]): req
+            for req in requests_to_make
+        }
+        for fut in as_completed(futures):
+            raw_by_request[futures[fut]] = fut.result()
+
+    results = {tournament_id: {} for tournament_id, _ in tournaments}
+    # Parse in request order so each tournament keeps the MDS-then-QS key order.
+    for req in requests_to_make:
+        tournament_id, _, dtype_code, dtype_label, _ = req
+        _parse_itf_drawsheet_into(results[tournament_id], raw_by_request.get(req), tournament_id, dtype_code, dtype_label)
+    return results
+
+
 def get_itf_tournament_id(tournament_key, driver):
-    """Get ITF tournamentId from tournamentKey via Selenium."""
-    api_url = f"https://www.itftennis.com/tennis/api/TournamentApi/GetEventFilters?tournamentKey={tournament_key}"
-    try:
-        driver.get(api_url)
-        import time
-        time.sleep(1)
-        raw = driver.find_element("tag name", "body").text.strip()
-        import json
-        data = json.loads(raw)
-        return data.get("tournamentId")
-    except Exception:
-        return None
+    """Get ITF tournamentId from tournamentKey (HTTP session, Selenium fallback)."""
+    from itf import get_itf_tournament_id as _get_itf_tournament_id
+    return _get_itf_tournament_id(tournament_key, driver)
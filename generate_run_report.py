@@ -2,15 +2,26 @@ import argparse
 import csv
 import json
 import os
-import unicodedata
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
+from statistics import median
 
 from config import repair_name_text
+from names import normalize_key, name_variants, is_itf_id
+from rankings_store import open_store
+from week_index import monday_of
 
 MAX_MATCH_LINES_PER_FILE = 50
 RANKINGS_CSV_FILES = ["wta_rankings_83_99.csv", "wta_rankings_00_09.csv", "wta_rankings_10_19.csv", "wta_rankings_20_29.csv"]
 ALIASES_JSON_FILE = "player_aliases_wta_itf.json"
 
+# Run metrics (run_metrics.py): the latest run is compared with the median of the
+# previous METRICS_BASELINE_RUNS runs.
+METRICS_BASELINE_RUNS = 10
+METRICS_SLOWDOWN_FACTOR = 1.5
+METRICS_MIN_SLOWDOWN_SECONDS = 30
+RATE_LIMIT_STORM_429S = 20
+MAX_METRICS_STAGE_LINES = 8
+
 
 def repair_nested_strings(value):
     if isinstance(value, dict):
@@ -57,27 +68,8 @@ def normalize_country(value):
     return (value or "").strip().upper()
 
 
-def strip_accents(text):
-    s = repair_name_text(text).strip()
-    if not s:
-        return ""
-    return "".join(ch for ch in unicodedata.normalize("NFKD", s) if not unicodedata.combining(ch))
-
-
 def normalize_rank_key(value):
-    s = strip_accents(value).upper()
-    s = " ".join(s.split())
-    return s
-
-
-def name_variants(value):
-    base = normalize_rank_key(value)
-    if not base:
-        return set()
-    out = {base}
-    if "-" in base:
-        out.add(" ".join(base.replace("-", " ").split()))
-    return out
+    return normalize_key(value)
 
 
 def load_rankings_name_set(dir_path):
@@ -100,22 +92,7 @@ def load_rankings_name_set(dir_path):
 
 
 def monday_from_date_str(value):
-    s = (value or "").strip()
-    if not s:
-        return ""
-    if len(s) >= 10:
-        s = s[:10]
-    try:
-        d = datetime.strptime(s, "%Y-%m-%d").date()
-    except Exception:
-        return ""
-    monday = d - timedelta(days=d.weekday())
-    return monday.strftime("%Y-%m-%d")
-
-
-def is_itf_id(value):
-    s = (value or "").strip()
-    return s.isdigit() and (len(s) >= 9 or s.startswith("800"))
+    return monday_of(value) or ""
 
 
 def is_wta_id(value):
@@ -189,18 +166,16 @@ def load_rankings_by_week(dir_path, weeks):
         if not os.path.exists(path):
             continue
         try:
-            with open(path, "r", encoding="utf-8-sig", newline="") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    week = (row.get("week_date") or row.get("week") or "").strip()
-                    if week not in weeks:
-                        continue
-                    pid = (row.get("id") or row.get("player_id") or row.get("playerId") or "").strip()
-                    rank = (row.get("rank") or row.get("Rank") or "").strip()
-                    player = (row.get("player") or row.get("Player") or "").strip()
+            store = open_store(path)
+            for week in sorted(weeks):
+                if week not in store:
+                    continue
+                for pid, player, _country, _dob, rank, _points in store.week_rows(week):
+                    pid = pid.strip()
+                    player = player.strip()
                     if not pid:
                         continue
-                    by_week[week][pid] = {"rank": rank, "player": player}
+                    by_week[week][pid] = {"rank": "" if rank is None else str(rank), "player": player}
                     for v in name_variants(player):
                         name_to_id[week].setdefault(v, pid)
                     exact = normalize_exact_name(player)
@@ -623,6 +598,74 @@ def compute_report(before_dir, after_dir):
     return report
 
 
+def _script_429s(metrics):
+    return int(((metrics.get("http") or {}).get("status") or {}).get("429", 0))
+
+
+def summarize_run_metrics(metrics):
+    """Latest run of run_metrics.json, with its slowdowns and rate-limit storms vs earlier runs."""
+    runs = [r for r in ((metrics or {}).get("runs") or []) if isinstance(r, dict) and r.get("scripts")]
+    if not runs:
+        return None
+    latest = runs[-1]
+    previous = runs[-1 - METRICS_BASELINE_RUNS:-1]
+
+    scripts = []
+    alerts = []
+    for name, m in latest["scripts"].items():
+        past = [r["scripts"][name] for r in previous if name in r["scripts"]]
+        baseline = median(p.get("seconds", 0) for p in past) if past else None
+        http = m.get("http") or {}
+        n429 = _script_429s(m)
+        scripts.append({
+            "name": name,
+            "seconds": m.get("seconds", 0),
+            "baseline_seconds": baseline,
+            "requests": http.get("requests", 0),
+            "retries": http.get("retries", 0),
+            "errors": http.get("errors", 0),
+            "429": n429,
+            "mb": round(http.get("bytes", 0) / (1024 * 1024), 1),
+            "page_loads": (m.get("selenium") or {}).get("loads", 0),
+            "sleep_seconds": (m.get("sleep") or {}).get("seconds", 0),
+            "peak_rss_mb": m.get("peak_rss_mb"),
+        })
+        if (baseline and m.get("seconds", 0) > baseline * METRICS_SLOWDOWN_FACTOR
+                and m.get("seconds", 0) - baseline >= METRICS_MIN_SLOWDOWN_SECONDS):
+            alerts.append(f"{name} took {m['seconds']:.0f}s (median of previous runs: {baseline:.0f}s)")
+        if n429 >= RATE_LIMIT_STORM_429S:
+            hosts = sorted(((h, v.get("429", 0)) for h, v in (http.get("hosts") or {}).items() if v.get("429")),
+                           key=lambda hv: hv[1], reverse=True)
+            alerts.append(f"{name} got {n429} HTTP 429 responses ("
+                          + ", ".join(f"{h} {n}" for h, n in hosts) + ")")
+
+    stages = []
+    main_metrics = latest["scripts"].get("main.py") or {}
+    for name, t in sorted((main_metrics.get("stages") or {}).items(), key=lambda kv: kv[1].get("seconds", 0), reverse=True):
+        past = [r["scripts"]["main.py"]["stages"][name]["seconds"] for r in previous
+                if name in ((r["scripts"].get("main.py") or {}).get("stages") or {})]
+        stages.append({"name": name, "seconds": t.get("seconds", 0),
+                       "baseline_seconds": median(past) if past else None})
+
+    history = []
+    for r in runs[-METRICS_BASELINE_RUNS:]:
+        history.append({
+            "started": r.get("started", ""),
+            "seconds": round(sum(m.get("seconds", 0) for m in r["scripts"].values()), 1),
+            "429": sum(_script_429s(m) for m in r["scripts"].values()),
+        })
+
+    return {
+        "run_id": latest.get("run_id", ""),
+        "started": latest.get("started", ""),
+        "scripts": scripts,
+        "stages": stages[:MAX_METRICS_STAGE_LINES],
+        "critical_path": main_metrics.get("critical_path") or [],
+        "alerts": alerts,
+        "history": history,
+    }
+
+
 def render_email_markdown(report):
     now_utc = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
     lines = []
@@ -735,6 +778,33 @@ def render_markdown(report):
             )
         lines.append("")
 
+    metrics = report.get("run_metrics")
+    if metrics:
+        lines.append(f"## 6) Run Performance ({metrics['started']})")
+        for alert in metrics["alerts"]:
+            lines.append(f"- WARNING: {alert}")
+        for item in metrics["scripts"]:
+            baseline = f" (median {item['baseline_seconds']:.0f}s)" if item["baseline_seconds"] else ""
+            rss = f", peak RSS {item['peak_rss_mb']:.0f} MB" if item["peak_rss_mb"] else ""
+            lines.append(
+                f"- {item['name']}: {item['seconds']:.0f}s{baseline} | {item['requests']} requests, "
+                f"{item['retries']} retries, {item['errors']} errors, {item['429']} x 429, {item['mb']} MB | "
+                f"{item['page_loads']} page loads | {item['sleep_seconds']:.0f} thread-seconds sleeping{rss}"
+            )
+        if metrics["stages"]:
+            lines.append("- Slowest main.py stages: " + ", ".join(
+                f"{item['name']} {item['seconds']:.1f}s"
+                + (f" (median {item['baseline_seconds']:.1f}s)" if item["baseline_seconds"] is not None else "")
+                for item in metrics["stages"]
+            ))
+        if metrics["critical_path"]:
+            lines.append("- Critical path: " + " -> ".join(metrics["critical_path"]))
+        if len(metrics["history"]) > 1:
+            lines.append("- Recent runs (total seconds / 429s): " + ", ".join(
+                f"{item['seconds']:.0f}/{item['429']}" for item in metrics["history"]
+            ))
+        lines.append("")
+
     return "\n".join(lines)
 
 
@@ -744,9 +814,12 @@ def main():
     parser.add_argument("--after", required=True, help="Directory with post-run data files")
     parser.add_argument("--output", required=True, help="Output report markdown file")
     parser.add_argument("--email-output", help="Optional output markdown file for email alerts")
+    parser.add_argument("--metrics", help="Optional run_metrics.json to summarise run performance from")
     args = parser.parse_args()
 
     report = compute_report(args.before, args.after)
+    if args.metrics:
+        report["run_metrics"] = summarize_run_metrics(load_json(args.metrics))
     markdown = render_markdown(report)
     email_markdown = render_email_markdown(report) if args.email_output else None
 
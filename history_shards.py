@@ -0,0 +1,198 @@
+"""Per-player match-history shards for the site's Match History tab.
+
+Selecting a player used to download `data/history_data.json` (every ARG match)
+and scan it in the browser. Instead, each player in the selector gets
+`data/history_players/<hash>.json` with only the matches where she is the
+PLAYER side, column-oriented:
+
+  {"f": [field...], "c": [[value per match]...], "facets": {...}}
+
+Columns that are empty for the whole shard are dropped. `_opponent` carries the
+opponent's display name, and `facets` the sorted filter values (surfaces,
+rounds, results, years, tournaments, categories, opponents, opponent countries,
+entries, match types), so the page fills its filters without scanning rows.
+The `history` tab payload carries the {PLAYER NAME: hash} index. The "All
+players" view still reads history_data.json.
+"""
+
+import os
+
+from config import DATA_DIR, NAME_LOOKUP, PLAYER_MAPPING
+from names import fold_accents
+from utils import write_hashed_json_files
+
+HISTORY_SHARDS_DIR = os.path.join(DATA_DIR, "history_players")
+HISTORY_SHARDS_URL_PREFIX = "data/history_players/"
+
+# Row fields read by the history tab (see renderFilteredMatches / applyHistoryFilters).
+HISTORY_SHARD_FIELDS = [
+    "DATE", "TOURNAMENT", "CATEGORY", "SURFACE", "MATCH_TYPE", "ROUND", "SCORE",
+    "_winnerName", "_loserName", "_winnerCountry", "_loserCountry", "_winnerEntry", "_loserEntry",
+    "_winnerSeed", "_loserSeed", "_winnerRank", "_loserRank", "_resultStatusDesc",
+]
+
+RESULT_ORDER = ["Wins", "Losses", "Wins by RET", "Losses by RET", "Wins by DEF", "Losses by DEF"]
+ROUND_FILTER_ORDER = {
+    "QR1": 1, "QR2": 2, "QR3": 3, "QR4": 4,
+    "1st Round": 5, "2nd Round": 6, "3rd Round": 7, "4th Round": 8, "5th Round": 9,
+    "Quarter-finals": 10, "Semi-finals": 11, "Final": 12,
+    "Team - Round Robin": 13, "Team - Last 32": 14, "Team - Last 16": 15,
+    "Team - Quarter Finals": 16, "Team - Semi Finals": 17, "Team - Final": 18,
+}
+_ITF_TOURNAMENT_MARKERS = ("ITF", "W15", "W25", "W35", "W50", "W60", "W75", "W100")
+
+_DISPLAY_CASE = {name.upper(): name for name in PLAYER_MAPPING}
+
+
+def _text(value):
+    return "" if value is None else str(value)
+
+
+def _title_case(upper_name):
+    # Same fallback as the page's getDisplayName for names without an alias entry.
+    def cap(part):
+        return part[:1].upper() + part[1:].lower()
+    return " ".join("-".join(cap(p) for p in w.split("-")) if "-" in w else cap(w)
+                    for w in upper_name.split(" "))
+
+
+def display_name(name):
+    """Display name of a history name (alias-resolved, as the page shows it)."""
+    name_upper = _text(name).strip().upper()
+    if not name_upper:
+        return ""
+    resolved = NAME_LOOKUP.get(name_upper)
+    if resolved:
+        return _DISPLAY_CASE.get(resolved) or _title_case(resolved)
+    return _title_case(name_upper)
+
+
+def _display_upper(name):
+    name_upper = _text(name).strip().upper()
+    return NAME_LOOKUP.get(name_upper, name_upper)
+
+
+def is_doubles_row(row):
+    return "/" in _text(row.get("_winnerName")) or "/" in _text(row.get("_loserName"))
+
+
+def is_winner_side(row, player_upper):
+    """True if `player_upper` (or, for non-player-specific rows, the ARG side) is the winner."""
+    winner_country = _text(row.get("_winnerCountry")).strip().upper()
+    loser_country = _text(row.get("_loserCountry")).strip().upper()
+    if winner_country == "ARG" and loser_country != "ARG":
+        return True
+    if loser_country == "ARG" and winner_country != "ARG":
+        return False
+    if _display_upper(row.get("_winnerName")) == player_upper:
+        return True
+    return _display_upper(row.get("_loserName")) != player_upper
+
+
+def row_match_type(row):
+    explicit = _text(row.get("MATCH_TYPE")).strip()
+    if explicit:
+        return explicit
+    tournament = _text(row.get("TOURNAMENT"))
+    return "ITF" if any(m in tournament for m in _ITF_TOURNAMENT_MARKERS) else "WTA"
+
+
+def result_label(row, is_winner):
+    status = _text(row.get("_resultStatusDesc")).lower()
+    score = _text(row.get("SCORE")).lower()
+    suffix = ""
+    if "retired" in status or "ret." in status or "ret." in score:
+        suffix = " by RET"
+    elif "default" in status or "def." in status or "def." in score:
+        suffix = " by DEF"
+    return ("Wins" if is_winner else "Losses") + suffix
+
+
+def round_filter_label(row):
+    round_name = _text(row.get("ROUND")).strip()
+    if not round_name:
+        return ""
+    category = _text(row.get("CATEGORY"))
+    tournament = _text(row.get("TOURNAMENT"))
+    is_team_event = (_text(row.get("MATCH_TYPE")) == "Fed/BJK Cup" or "Fed/BJK Cup" in category
+                     or "BJK" in tournament or "Fed Cup" in tournament)
+    if is_team_event and not round_name.startswith("Team - "):
+        return f"Team - {round_name}"
+    return round_name
+
+
+# Punctuation in the order localeCompare (ICU root collation) sorts it, ahead of digits and letters.
+_COLLATION_PUNCTUATION = str.maketrans({ch: chr(1 + i) for i, ch in enumerate(" _-,;:!?.'\"()[]{}@*/\\&#%`^+<=>|~$")})
+
+
+def _alpha_key(value):
+    # Approximates the page's localeCompare: accent/case-insensitive, lowercase first on ties.
+    return (fold_accents(value).casefold().translate(_COLLATION_PUNCTUATION), value.swapcase())
+
+
+def player_facets(rows, sides):
+    """Filter options for one player's matches, in the order the page lists them."""
+    sets = {k: set() for k in ("surfaces", "rounds", "results", "years", "tournaments", "categories",
+                               "opponents", "opponentCountries", "playerEntries", "matchTypes")}
+    for row, is_winner in zip(rows, sides):
+        sets["results"].add(result_label(row, is_winner))
+        sets["surfaces"].add(_text(row.get("SURFACE")))
+        sets["rounds"].add(round_filter_label(row))
+        year = _text(row.get("DATE")).strip()[:4]
+        sets["years"].add(year if year.isdigit() else "")
+        sets["tournaments"].add(_text(row.get("TOURNAMENT")))
+        sets["categories"].add(_text(row.get("CATEGORY")))
+        sets["opponents"].add(row["_opponent"])
+        sets["opponentCountries"].add(_text(row.get("_loserCountry" if is_winner else "_winnerCountry")))
+        sets["playerEntries"].add(_text(row.get("_winnerEntry" if is_winner else "_loserEntry")))
+        sets["matchTypes"].add(row_match_type(row))
+    sets = {k: {v for v in values if v} for k, values in sets.items()}
+    return {
+        "surfaces": sorted(sets["surfaces"]),
+        "rounds": sorted(sets["rounds"], key=lambda r: (ROUND_FILTER_ORDER.get(r, 99), _alpha_key(r))),
+        "results": [r for r in RESULT_ORDER if r in sets["results"]],
+        "years": sorted(sets["years"], reverse=True),
+        "tournaments": sorted(sets["tournaments"], key=_alpha_key),
+        "categories": sorted(sets["categories"], key=_alpha_key),
+        "opponents": sorted(sets["opponents"]),
+        "opponentCountries": sorted(sets["opponentCountries"]),
+        "playerEntries": sorted(sets["playerEntries"]),
+        "matchTypes": sorted(sets["matchTypes"]),
+    }
+
+
+def shard_payload(rows, sides):
+    fields = [f for f in HISTORY_SHARD_FIELDS + ["_opponent"] if any(_text(r.get(f)) for r in rows)]
+    return {
+        "f": fields,
+        "c": [[_text(r.get(f)) for r in rows] for f in fields],
+        "facets": player_facets(rows, sides),
+    }
+
+
+def write_history_shards(cleaned_history, players):
+    """Bring data/history_players/ up to date. Returns the index {PLAYER NAME (upper): hash}."""
+    wanted = {p.upper() for p in players}
+    by_player = {p: ([], []) for p in wanted}
+    for row in cleaned_history:
+        if is_doubles_row(row):
+            continue
+        for name_field in ("_winnerName", "_loserName"):
+            player = _display_upper(row.get(name_field))
+            if player not in by_player:
+                continue
+            is_winner = is_winner_side(row, player)
+            # Only rows where she is the rendered PLAYER side (nationality-switch rows
+            # where she is the opponent stay in the "All players" view only).
+            if (name_field == "_winnerName") != is_winner:
+                continue
+            rows, sides = by_player[player]
+            opponent = row.get("_loserName" if is_winner else "_winnerName")
+            rows.append(dict(row, _opponent=display_name(opponent)))
+            sides.append(is_winner)
+
+    payloads = (
+        (player, shard_payload(*by_player[player]))
+        for player in sorted(wanted) if by_player[player][0]
+    )
+    return write_hashed_json_files(HISTORY_SHARDS_DIR, payloads, label="History shards")
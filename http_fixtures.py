@@ -0,0 +1,292 @@
+"""Record/replay of the pipeline's HTTP traffic, for offline end-to-end runs.
+
+    python http_fixtures.py record DIR main.py          # live run, saves every response
+    python http_fixtures.py replay DIR main.py          # offline run from DIR
+    python http_fixtures.py replay DIR tstrength:build_tstrength_data
+
+Record mode wraps `requests.Session.request` (which `requests.get/post` go
+through too) and Selenium's `driver.get`, and saves each response into DIR:
+`index.json` maps a request key (method, URL with its query, body) to status,
+content type and a file under `bodies/` holding the raw bytes. Conditional
+request headers are dropped while recording so every body is stored in full.
+Selenium loads are stored as the page's body text, which is what the ITF API
+scrapes read.
+
+Replay mode serves the same responses without network or Chrome: requests get
+a `requests.Response` built from the fixture after `latency` seconds, and
+`webdriver.Chrome` is replaced by `ReplayDriver`. A request that was not
+recorded is matched to a recording of the same endpoint and the same body with
+the most query parameters in common (date-dependent queries drift between
+days); a body is never matched loosely, so e.g. an ITF drawsheet POST for one
+tournament never gets another tournament's response. Anything else gets a
+404. `sleep_scale` scales the scripts' own pacing sleeps (0 skips them); the
+skipped time is added to `time.monotonic()`, so rate limiters that check the
+clock do not busy-wait.
+
+The target runs as `__main__` (a script path) or is called (`module:function`)
+inside a run_metrics run, so its stage timings land in run_metrics.json.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import runpy
+import sys
+import threading
+import time
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+_CONDITIONAL_HEADERS = ("If-None-Match", "If-Modified-Since")
+_real_sleep = time.sleep  # replay latency is not affected by sleep_scale
+_BROWSER = "BROWSER"
+
+_lock = threading.Lock()
+_mode = None
+_dir = None
+_latency = 0.0
+_index = {}
+_by_endpoint = {}
+_stats = {"recorded": 0, "replayed": 0, "fuzzy": 0, "missed": 0}
+
+
+def _request_key(method, url, body=""):
+    return hashlib.sha1(f"{method.upper()} {url}\n{body}".encode("utf-8")).hexdigest()[:20]
+
+
+def _endpoint(method, url):
+    parts = urlsplit(url)
+    return f"{method.upper()} {parts.netloc}{parts.path}"
+
+
+def _full_url(method, url, kwargs):
+    """URL with `params` merged in, and the body as text, as the server would see them."""
+    prepared = requests.Request(method.upper(), url, params=kwargs.get("params"),
+                                json=kwargs.get("json"), data=kwargs.get("data")).prepare()
+    body = prepared.body or ""
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", "replace")
+    return prepared.url, body
+
+
+def _load_index():
+    try:
+        with open(os.path.join(_dir, "index.json"), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_index():
+    with _lock:
+        index = {**_load_index(), **_index}
+        tmp = os.path.join(_dir, "index.json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(dict(sorted(index.items())), f, ensure_ascii=False, indent=1)
+        os.replace(tmp, os.path.join(_dir, "index.json"))
+    print(f"HTTP fixtures: {_stats['recorded']} responses recorded into {_dir}")
+
+
+def _record(method, url, body, status, content_type, content):
+    key = _request_key(method, url, body)
+    path = os.path.join(_dir, "bodies", key)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(content or b"")
+    os.replace(tmp, path)
+    with _lock:
+        _index[key] = {"method": method.upper(), "url": url, "body": body,
+                       "status": status, "content_type": content_type}
+        _stats["recorded"] += 1
+
+
+def _lookup(method, url, body=""):
+    """Fixture entry for a request (exact, else the closest of the same endpoint and body), or None."""
+    entry = _index.get(_request_key(method, url, body))
+    if entry is not None:
+        kind = "replayed"
+    else:
+        query = set(parse_qsl(urlsplit(url).query))
+        candidates = [e for e in _by_endpoint.get(_endpoint(method, url)) or [] if e["body"] == body]
+        entry = max(candidates, key=lambda e: len(query & set(parse_qsl(urlsplit(e["url"]).query))), default=None)
+        kind = "fuzzy" if entry is not None else "missed"
+    with _lock:
+        _stats[kind] += 1
+    if entry is None:
+        print(f"HTTP fixtures: no recording for {method.upper()} {url}")
+    return entry
+
+
+def _read_body(entry):
+    with open(os.path.join(_dir, "bodies", entry["key"]), "rb") as f:
+        return f.read()
+
+
+def _install_record():
+    original_request = requests.Session.request
+
+    def request(self, method, url, *args, **kwargs):
+        headers = {k: v for k, v in (kwargs.get("headers") or {}).items() if k.title() not in _CONDITIONAL_HEADERS}
+        kwargs["headers"] = headers
+        resp = original_request(self, method, url, *args, **kwargs)
+        if not kwargs.get("stream"):
+            full_url, body = _full_url(method, url, kwargs)
+            _record(method, full_url, body, resp.status_code, resp.headers.get("content-type", ""), resp.content)
+        return resp
+
+    requests.Session.request = request
+
+    try:
+        from selenium.webdriver.remote.webdriver import WebDriver
+    except ImportError:
+        return
+    original_get = WebDriver.get
+
+    def get(self, url):
+        result = original_get(self, url)
+        try:
+            text = self.find_element("tag name", "body").text
+        except Exception:
+            return result
+        _record(_BROWSER, url, "", 200, "text/plain", text.encode("utf-8"))
+        return result
+
+    WebDriver.get = get
+
+
+class _ReplayElement:
+    def __init__(self, text):
+        self.text = text
+
+
+class ReplayDriver:
+    """Stand-in for `webdriver.Chrome` that serves recorded page bodies."""
+
+    def __init__(self, *args, **kwargs):
+        self._text = ""
+
+    def get(self, url):
+        _real_sleep(_latency)
+        entry = _lookup(_BROWSER, url)
+        self._text = _read_body(entry).decode("utf-8") if entry else ""
+
+    def find_element(self, by=None, value=None):
+        return _ReplayElement(self._text)
+
+    def get_cookies(self):
+        return []
+
+    def execute_script(self, script, *args):
+        return "Mozilla/5.0 (replay)" if "userAgent" in script else None
+
+    def quit(self):
+        pass
+
+
+def _install_replay(sleep_scale):
+    def request(self, method, url, *args, **kwargs):
+        full_url, body = _full_url(method, url, kwargs)
+        _real_sleep(_latency)
+        entry = _lookup(method, full_url, body)
+        resp = requests.Response()
+        resp.url = full_url
+        resp.status_code = entry["status"] if entry else 404
+        resp.reason = "OK" if resp.status_code < 400 else "Replay"
+        resp.headers = CaseInsensitiveDict({"content-type": entry["content_type"]} if entry else {})
+        resp._content = _read_body(entry) if entry else b""
+        resp.encoding = "utf-8"
+        return resp
+
+    requests.Session.request = request
+
+    from selenium import webdriver
+    from webdriver_manager.chrome import ChromeDriverManager
+    webdriver.Chrome = ReplayDriver
+    ChromeDriverManager.install = lambda self: "chromedriver (replay)"
+
+    # The part of a sleep that is skipped still passes on the clock the pacing
+    # code reads (tstrength's token bucket, draws' per-host limiter), so they
+    # let the next request through instead of spinning until real time catches up.
+    real_monotonic = time.monotonic
+    skipped = [0.0]
+
+    def monotonic():
+        return real_monotonic() + skipped[0]
+
+    def sleep(seconds):
+        seconds = max(0.0, seconds)
+        with _lock:
+            skipped[0] += seconds * (1 - min(1.0, sleep_scale))
+        _real_sleep(seconds * sleep_scale)
+
+    time.monotonic = monotonic
+    time.sleep = sleep
+
+
+def install(mode, fixtures_dir, latency=0.0, sleep_scale=1.0):
+    """Start recording into / replaying from `fixtures_dir` for the rest of the process."""
+    global _mode, _dir, _latency
+    if mode not in ("record", "replay"):
+        raise ValueError(f"Unknown HTTP fixtures mode: {mode}")
+    _mode, _dir, _latency = mode, os.path.abspath(fixtures_dir), max(0.0, float(latency))
+    if mode == "record":
+        os.makedirs(os.path.join(_dir, "bodies"), exist_ok=True)
+        _install_record()
+        atexit.register(_save_index)
+        return
+    for key, entry in _load_index().items():
+        entry = {**entry, "key": key}
+        _index[key] = entry
+        _by_endpoint.setdefault(_endpoint(entry["method"], entry["url"]), []).append(entry)
+    print(f"HTTP fixtures: replaying {len(_index)} responses from {_dir} ({_latency * 1000:.0f} ms latency)")
+    _install_replay(float(sleep_scale))
+
+
+def stats():
+    with _lock:
+        return dict(_stats)
+
+
+def run_target(target):
+    """Run a script path as __main__, or call `module:function` inside a run_metrics run."""
+    import run_metrics
+    if ":" not in target:
+        sys.argv = [target]
+        runpy.run_path(target, run_name="__main__")
+        return
+    module_name, func_name = target.split(":", 1)
+    run_metrics.start_run(target)
+    module = __import__(module_name, fromlist=[func_name])
+    with run_metrics.stage_timer(func_name):
+        getattr(module, func_name)()
+
+
+def main():
+    import argparse
+    import run_metrics
+
+    parser = argparse.ArgumentParser(description="Run a pipeline script recording or replaying its HTTP traffic.")
+    parser.add_argument("mode", choices=["record", "replay"])
+    parser.add_argument("fixtures", help="Fixture directory")
+    parser.add_argument("target", help="Script path (e.g. main.py) or module:function")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every replayed response")
+    parser.add_argument("--sleep-scale", type=float, default=1.0, help="Scale of the scripts' own sleeps in replay")
+    args = parser.parse_args()
+
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, base_dir)
+    install(args.mode, args.fixtures, args.latency, args.sleep_scale)
+    try:
+        run_target(args.target)
+    finally:
+        run_metrics.record(http_fixtures={"mode": args.mode, "latency": _latency, **stats()})
+        if args.mode == "replay":
+            s = stats()
+            print(f"HTTP fixtures: {s['replayed']} replayed, {s['fuzzy']} matched by endpoint, {s['missed']} missed")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,101 @@
 import time
 import json
 import random
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
-from config import NAME_LOOKUP, ITF_CACHE_FILE
+from config import NAME_LOOKUP, ITF_CACHE_FILE, ITF_HTTP_SESSION_MODE, ITF_HTTP_WORKERS
 from utils import get_cached_rankings
 from calendar_builder import get_next_monday
+from itf_tournament_ids import get_tournament_id, record_tournament_ids, resolve_tournament_ids
+from run_metrics import count_retry
+
+
+_ITF_SITE_URL = "https://www.itftennis.com/en/"
+_itf_session = None  # requests.Session carrying cookies harvested from Chrome
+_itf_session_blocked = False
+_itf_session_lock = threading.Lock()
+_driver_lock = threading.Lock()  # a WebDriver must only be used by one thread at a time
+
+
+def _harvest_itf_session(driver):
+    """Load the ITF site once in Chrome and copy its cookies + User-Agent into a pooled session."""
+    global _itf_session
+    with _driver_lock:
+        driver.get(_ITF_SITE_URL)
+        time.sleep(random.uniform(3, 5))
+        cookies = driver.get_cookies()
+        user_agent = driver.execute_script("return navigator.userAgent")
+    session = requests.Session()
+    session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=max(10, ITF_HTTP_WORKERS)))
+    session.headers.update({
+        "User-Agent": user_agent,
+        "Accept": "application/json, text/plain, */*",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Referer": _ITF_SITE_URL,
+    })
+    for c in cookies:
+        session.cookies.set(c["name"], c["value"], domain=c.get("domain"), path=c.get("path", "/"))
+    _itf_session = session
+    return session
+
+
+def _fetch_itf_text_selenium(url, driver, wait_range):
+    with _driver_lock:
+        driver.get(url)
+        time.sleep(random.uniform(*wait_range))
+        return driver.find_element("tag name", "body").text
+
+
+def _fetch_itf_text_session(url, driver):
+    """Return the body via the harvested session, or None if the request looks blocked."""
+    with _itf_session_lock:
+        session = _itf_session or _harvest_itf_session(driver)
+    r = session.get(url, timeout=20)
+    text = r.text.strip()
+    ctype = (r.headers.get("content-type") or "").lower()
+    # The anti-bot layer answers with 401/403/429 or an HTML challenge page.
+    if r.status_code in (401, 403, 429) or "text/html" in ctype:
+        print(f"ITF session request blocked (HTTP {r.status_code}) for {url}")
+        return None
+    return text
+
+
+def fetch_itf_api_text(url, driver, wait_range=(1, 2)):
+    """Fetch an ITF JSON API response body as text.
+
+    Uses the cookie-harvested HTTP session when enabled (re-harvesting once if
+    it gets blocked), otherwise -- or once blocked for good -- loads the URL in
+    Selenium and waits `wait_range` seconds like the original page scrapes.
+    """
+    global _itf_session, _itf_session_blocked
+    if ITF_HTTP_SESSION_MODE and not _itf_session_blocked and driver is not None:
+        for attempt in range(2):
+            if attempt:
+                count_retry(url)
+            try:
+                text = _fetch_itf_text_session(url, driver)
+                if text is not None:
+                    return text
+            except Exception as e:
+                print(f"ITF session request failed for {url}: {e}")
+            if attempt == 0:
+                with _itf_session_lock:
+                    _itf_session = None  # re-harvest cookies and try once more
+        print("ITF HTTP session disabled for this run; falling back to Selenium")
+        _itf_session_blocked = True
+    return _fetch_itf_text_selenium(url, driver, wait_range)
+
+
+def _map_concurrently(func, items):
+    """Run func over items on the ITF worker pool (serialised when Selenium is the transport)."""
+    items = list(items)
+    if not ITF_HTTP_SESSION_MODE or len(items) <= 1:
+        return [func(it) for it in items]
+    with ThreadPoolExecutor(max_workers=max(1, ITF_HTTP_WORKERS)) as pool:
+        return list(pool.map(func, items))
 
 
 def get_itf_level(tournament_name):
@@ -119,9 +208,7 @@ def _fetch_itf_calendar_raw(driver):
     while True:
         url = f"https://www.itftennis.com/tennis/api/TournamentApi/GetCalendar?circuitCode=WT&dateFrom={date_from}&dateTo={date_to}&skip={skip}&take={take}"
         try:
-            driver.get(url)
-            time.sleep(random.uniform(3, 5))
-            raw_content = driver.find_element("tag name", "body").text
+            raw_content = fetch_itf_api_text(url, driver, wait_range=(3, 5))
             data = json.loads(raw_content)
             items = data.get('items', [])
             if not items:
@@ -136,10 +223,21 @@ def _fetch_itf_calendar_raw(driver):
             print(f"Error fetching full ITF calendar (skip={skip}): {e}")
             break
 
+    # Keep any tournamentId the calendar already carries (saves GetEventFilters calls later).
+    record_tournament_ids({_calendar_item_key(item): item.get('tournamentId') for item in all_items})
+
     _itf_calendar_raw = all_items
     return _itf_calendar_raw
 
 
+def _calendar_item_key(item):
+    key = item.get('tournamentKey') or ''
+    if not key:
+        link = item.get('tournamentLink', '')
+        key = link.rstrip('/').split('/')[-1] if link else ''
+    return key
+
+
 def get_full_itf_calendar(driver):
     """Get all ITF tournaments for the full year. Numbers duplicates across the whole year."""
     today = datetime.now()
@@ -186,41 +284,60 @@ def get_full_itf_calendar(driver):
     return tournaments
 
 
-def get_itf_players(tournament_key, driver):
+_itf_players_cache = {}  # tournament_key -> (entry classifications, name map), filled by prefetch
+
+
+def _parse_itf_acceptance_list(raw_content):
+    start = raw_content.find('[')
+    end = raw_content.rfind(']') + 1
+    if start == -1: return [], {}
+
+    data = json.loads(raw_content[start:end])
+
+    root_data = data[0].get("entryClassifications", []) if data else []
+
+    name_map = {}
+    for classification in root_data:
+        desc = classification.get("entryClassification", "").upper()
+        code = classification.get("entryClassificationCode", "")
+        if "WITHDRAWAL" in desc: continue
+
+        for entry in classification.get("entries") or []:
+            pos = entry.get("positionDisplay", "")
+            suffix = "" if code in ("MDA", "JR", "SE", "WC") else (f" (ALT {pos})" if code == "ALT" or "ALTERNATE" in desc else " (Q)")
+            players = entry.get("players") or []
+            for p in players:
+                full_name = f"{p.get('givenName', '')} {p.get('familyName', '')}".strip().upper()
+                matched_name = NAME_LOOKUP.get(full_name, full_name)
+                name_map[matched_name] = suffix
+
+    return root_data, name_map
+
+
+def _fetch_itf_players(tournament_key, driver):
     url = f"https://www.itftennis.com/tennis/api/TournamentApi/GetAcceptanceList?tournamentKey={tournament_key}&circuitCode=WT"
     try:
-        driver.get(url)
-        time.sleep(random.uniform(4, 6))
-        raw_content = driver.find_element("tag name", "body").text
-        start = raw_content.find('[')
-        end = raw_content.rfind(']') + 1
-        if start == -1: return [], {}
-
-        data = json.loads(raw_content[start:end])
-
-        root_data = data[0].get("entryClassifications", []) if data else []
-
-        name_map = {}
-        for classification in root_data:
-            desc = classification.get("entryClassification", "").upper()
-            code = classification.get("entryClassificationCode", "")
-            if "WITHDRAWAL" in desc: continue
-
-            for entry in classification.get("entries") or []:
-                pos = entry.get("positionDisplay", "")
-                suffix = "" if code in ("MDA", "JR", "SE", "WC") else (f" (ALT {pos})" if code == "ALT" or "ALTERNATE" in desc else " (Q)")
-                players = entry.get("players") or []
-                for p in players:
-                    full_name = f"{p.get('givenName', '')} {p.get('familyName', '')}".strip().upper()
-                    matched_name = NAME_LOOKUP.get(full_name, full_name)
-                    name_map[matched_name] = suffix
-
-        return root_data, name_map
+        raw_content = fetch_itf_api_text(url, driver, wait_range=(4, 6))
+        return _parse_itf_acceptance_list(raw_content)
     except Exception as e:
         print(f"Error en {tournament_key}: {e}")
         return [], {}
 
 
+def prefetch_itf_players(tournament_keys, driver):
+    """Fetch the acceptance lists of many ITF tournaments concurrently for get_itf_players."""
+    keys = [k for k in dict.fromkeys(tournament_keys) if k not in _itf_players_cache]
+    results = _map_concurrently(lambda k: _fetch_itf_players(k, driver), keys)
+    for key, result in zip(keys, results):
+        _itf_players_cache[key] = result
+
+
+def get_itf_players(tournament_key, driver):
+    if tournament_key in _itf_players_cache:
+        return _itf_players_cache[tournament_key]
+    return _fetch_itf_players(tournament_key, driver)
+
+
 def get_dynamic_itf_calendar(driver, num_weeks=3):
     """Get ITF calendar for the next N weeks, filtered from the full-year cache."""
     next_monday = get_next_monday()
@@ -243,7 +360,8 @@ def get_draws_itf_tournament_list(driver):
     Show current + next week. Only include last week if the event is multi-week.
 
     Returns dict: week_label -> {tournamentKey -> {name, level, tournamentId, ...}}
-    Requires Selenium driver to fetch tournamentIds via GetEventFilters.
+    tournamentIds come from the persistent registry; only tournaments never seen
+    before need a GetEventFilters call (through the driver's session).
     """
     from calendar_builder import format_week_label
 
@@ -294,25 +412,16 @@ def get_draws_itf_tournament_list(driver):
         else:
             item['_display_name'] = t_name
 
-    # Fetch tournamentIds
+    # Resolve tournamentIds (registry first, GetEventFilters for new keys only)
     for item in tournaments:
-        key = item.get('tournamentKey') or ''
-        if not key:
-            link = item.get('tournamentLink', '')
-            key = link.rstrip('/').split('/')[-1] if link else ''
-        if not key:
-            item['_tid'] = None
-            continue
-        item['_key'] = key
-        api_url = f"https://www.itftennis.com/tennis/api/TournamentApi/GetEventFilters?tournamentKey={key}"
-        try:
-            driver.get(api_url)
-            time.sleep(1)
-            raw = driver.find_element("tag name", "body").text.strip()
-            data = json.loads(raw)
-            item['_tid'] = data.get("tournamentId")
-        except Exception:
-            item['_tid'] = None
+        item['_key'] = _calendar_item_key(item)
+    tids = resolve_tournament_ids(
+        [item['_key'] for item in tournaments],
+        lambda key: _fetch_itf_tournament_id(key, driver),
+        map_func=_map_concurrently,
+    )
+    for item in tournaments:
+        item['_tid'] = tids.get(item['_key'])
 
     # Build result grouped by week
     result = {}
@@ -341,6 +450,26 @@ def get_draws_itf_tournament_list(driver):
     return result
 
 
+def get_itf_tournament_id(tournament_key, driver):
+    """Get ITF tournamentId from tournamentKey (registry, else the GetEventFilters API)."""
+    tid = get_tournament_id(tournament_key)
+    if tid:
+        return tid
+    tid = _fetch_itf_tournament_id(tournament_key, driver)
+    record_tournament_ids({tournament_key: tid})
+    return tid
+
+
+def _fetch_itf_tournament_id(tournament_key, driver):
+    api_url = f"https://www.itftennis.com/tennis/api/TournamentApi/GetEventFilters?tournamentKey={tournament_key}"
+    try:
+        raw = fetch_itf_api_text(api_url, driver, wait_range=(1, 1)).strip()
+        data = json.loads(raw)
+        return data.get("tournamentId")
+    except Exception:
+        return None
+
+
 def get_itf_rankings(nationality="ARG"):
     all_players = []
     skip = 0
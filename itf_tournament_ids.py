@@ -0,0 +1,121 @@
+"""Persistent ITF tournamentKey -> tournamentId registry.
+
+The ITF draw and drawsheet APIs want the numeric tournamentId, while the
+calendar only gives the tournamentKey (e.g. "w-itf-arg-2026-004"); the
+GetEventFilters API maps one to the other. An id never changes once assigned,
+so every id learnt is kept in `data/itf_tournament_ids.json` ({key: id},
+sorted, one per line) and the lookup is only made for keys never seen before.
+
+The registry is seeded from `itf_tournament_list_cache.json` (written by
+populate_data/tournament_sizes_full.py) the first time it is loaded, and the
+populate loaders record the ids they fetch.
+"""
+
+import json
+import os
+import threading
+
+from config import DATA_DIR, ITF_TOURNAMENT_IDS_FILE
+
+_SEED_FILES = [os.path.join(DATA_DIR, "itf_tournament_list_cache.json")]
+
+_registry = None
+_dirty = False
+_lock = threading.Lock()
+
+
+def _clean_id(value):
+    """tournamentId as int, or None (ids come as int, float or string depending on the source)."""
+    try:
+        tid = int(float(value))
+    except (TypeError, ValueError):
+        return None
+    return tid if tid > 0 else None
+
+
+def _seed_from_list_cache(registry):
+    added = 0
+    for path in _SEED_FILES:
+        try:
+            with open(path, encoding="utf-8") as f:
+                items = json.load(f)
+        except Exception:
+            continue
+        for item in items if isinstance(items, list) else []:
+            key = (item.get("tournamentKey") or "").strip().lower()
+            tid = _clean_id(item.get("tournamentId"))
+            if key and tid and key not in registry:
+                registry[key] = tid
+                added += 1
+    return added
+
+
+def _load():
+    global _registry, _dirty
+    if _registry is not None:
+        return _registry
+    registry = {}
+    try:
+        with open(ITF_TOURNAMENT_IDS_FILE, encoding="utf-8") as f:
+            registry = {k: v for k, v in json.load(f).items() if _clean_id(v)}
+    except Exception:
+        pass
+    if _seed_from_list_cache(registry):
+        _dirty = True
+    _registry = registry
+    return registry
+
+
+def get_tournament_id(tournament_key):
+    """Registered tournamentId of `tournament_key`, or None if it was never seen."""
+    if not tournament_key:
+        return None
+    with _lock:
+        return _load().get(tournament_key.strip().lower())
+
+
+def record_tournament_ids(ids, save=True):
+    """Register {tournamentKey: tournamentId} pairs (falsy ids are ignored)."""
+    global _dirty
+    with _lock:
+        registry = _load()
+        for key, value in ids.items():
+            key = (key or "").strip().lower()
+            tid = _clean_id(value)
+            if key and tid and registry.get(key) != tid:
+                registry[key] = tid
+                _dirty = True
+    if save:
+        save_registry()
+
+
+def save_registry():
+    """Write the registry if anything was added since it was loaded."""
+    global _dirty
+    with _lock:
+        if not _dirty:
+            return
+        body = json.dumps(dict(sorted(_registry.items())), indent=0)
+        tmp = ITF_TOURNAMENT_IDS_FILE + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(body + "\n")
+        os.replace(tmp, ITF_TOURNAMENT_IDS_FILE)
+        _dirty = False
+
+
+def resolve_tournament_ids(tournament_keys, fetch_id, map_func=map):
+    """Ids of many tournaments: registry hits first, `fetch_id(key)` only for the misses.
+
+    Misses are fetched through `map_func` (e.g. a thread pool map) and recorded
+    in one save. Returns {tournamentKey: tournamentId or None}.
+    """
+    keys = [k for k in dict.fromkeys(tournament_keys) if k]
+    result = {k: get_tournament_id(k) for k in keys}
+    missing = [k for k, tid in result.items() if not tid]
+    if missing:
+        fetched = dict(zip(missing, map_func(fetch_id, missing)))
+        record_tournament_ids(fetched)
+        result.update(fetched)
+        found = sum(1 for tid in fetched.values() if tid)
+        print(f"ITF tournament ids: {len(keys) - len(missing)} known, {found}/{len(missing)} fetched")
+    return result
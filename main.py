@@ -1,16 +1,14 @@
 import os
 import json
-import pandas as pd
-import csv
-from datetime import datetime, timedelta
+import hashlib
+from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 
-from config import ENTRY_LISTS_CACHE_FILE, NAME_LOOKUP, repair_name_text
+from config import ENTRY_LISTS_CACHE_FILE, DRAW_PDF_HTTP_CACHE_FILE, HISTORY_RANKS_CACHE_FILE, NAME_LOOKUP
 from utils import (
-    fix_encoding, fix_encoding_keep_accents,
     load_cache, save_cache, merge_entry_list,
     save_json_file,
     normalize_country_overrides, load_csv_rows
@@ -22,17 +20,23 @@ from calendar_builder import (
 from wta import (
     build_tournament_groups, get_full_wta_calendar,
     get_wta_rankings_cached, scrape_tournament_players,
-    get_draws_tournament_list, _load_wta_csv
+    get_draws_tournament_list, get_wta_rankings
 )
 from itf import (
     get_full_itf_calendar, get_itf_players,
     get_dynamic_itf_calendar, get_itf_rankings_cached,
     get_itf_level, parse_itf_entry_list,
-    get_draws_itf_tournament_list
+    get_draws_itf_tournament_list, prefetch_itf_players
 )
 from html_generator import generate_html
-from draws import fetch_tournament_draws, fetch_itf_tournament_draws
+from draws import fetch_tournament_draws_many, fetch_itf_tournament_draws_many, _extract_tournament_id
 from tstrength import build_tstrength_data
+from match_history import load_match_history, write_history_data
+from names import get_name_index, index_variants
+from stages import Stage, run_stages, CRITICAL_PATH
+from render import RENDER_TIMINGS, CACHED_SECTIONS
+import run_metrics
+from week_index import monday_of
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(BASE_DIR, "data")
@@ -42,37 +46,12 @@ PLAYER_ALIASES_WTA_ITF_FILE = os.path.join(DATA_DIR, "player_aliases_wta_itf.jso
 DRAWS_STORE_CACHE_FILE = os.path.join(DATA_DIR, "draws_store_cache.json")
 
 
-def _normalize_name_for_lookup(name):
-    """Normalize names for cross-source lookups (case/accents/whitespace)."""
-    if not name:
-        return ""
-    return " ".join(fix_encoding(str(name)).strip().upper().split())
-
-
-def _map_to_display_name_upper(name):
-    """Map aliases to display_name (from `player_aliases_wta_itf.json`) when possible."""
-    if not name:
-        return ""
-    raw_upper = " ".join(str(name).strip().upper().split())
-    if not raw_upper:
-        return ""
-    # Try raw first, then encoding/accents-normalised key (common in older datasets).
-    alt_upper = _normalize_name_for_lookup(raw_upper)
-    return NAME_LOOKUP.get(raw_upper) or NAME_LOOKUP.get(alt_upper) or raw_upper
-
-
-def _monday_from_date_str(date_str):
-    if not date_str:
-        return None
-    base = str(date_str).strip()
-    if len(base) >= 10:
-        base = base[:10]
+def _file_sha1(path):
     try:
-        d = datetime.strptime(base, "%Y-%m-%d")
-    except Exception:
-        return None
-    monday = d - timedelta(days=d.weekday())
-    return monday.strftime("%Y-%m-%d")
+        with open(path, "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return ""
 
 
 def enrich_history_with_wta_ranks(cleaned_history):
@@ -80,90 +59,19 @@ def enrich_history_with_wta_ranks(cleaned_history):
     if not cleaned_history:
         return cleaned_history
 
-    # Optional: map ITF-side names to WTA-side names (to resolve rankings even when
-    # the match dataset uses ITF spelling while rankings CSV uses WTA spelling).
-    aliases_lookup = {}
-    itf_id_to_wta_id = {}
-    if os.path.exists(PLAYER_ALIASES_WTA_ITF_FILE):
-        try:
-            with open(PLAYER_ALIASES_WTA_ITF_FILE, "r", encoding="utf-8-sig") as f:
-                items = json.load(f)
-            if not isinstance(items, list):
-                items = []
-        except Exception:
-            items = []
-        for it in items:
-            if not isinstance(it, dict):
-                continue
-            itf_name = repair_name_text(it.get("itf_name")).strip()
-            # New format: {display_name,wta_id,wta_name,itf_id,itf_name,bjkc_name}
-            itf_id = (it.get("itf_id") or "").strip()
-            wta_id = (it.get("wta_id") or "").strip()
-            wta_name = repair_name_text(it.get("wta_name")).strip()
-            display_name = repair_name_text(it.get("display_name")).strip()
-            if itf_id and wta_id and itf_id not in itf_id_to_wta_id:
-                itf_id_to_wta_id[itf_id] = wta_id
-            cand_norms = []
-            for n in [wta_name, display_name]:
-                n = str(n or "").strip()
-                if not n:
-                    continue
-                n_norm = _normalize_name_for_lookup(n)
-                if n_norm and n_norm not in cand_norms:
-                    cand_norms.append(n_norm)
-                disp_norm = _normalize_name_for_lookup(_map_to_display_name_upper(n))
-                if disp_norm and disp_norm not in cand_norms:
-                    cand_norms.append(disp_norm)
-            if not itf_name or not cand_norms:
-                continue
-            # Allow lookups by raw ITF name or by our display-mapped key.
-            for k in {_normalize_name_for_lookup(itf_name), _normalize_name_for_lookup(_map_to_display_name_upper(itf_name))}:
-                if not k:
-                    continue
-                if k not in aliases_lookup:
-                    aliases_lookup[k] = []
-                for cn in cand_norms:
-                    if cn not in aliases_lookup[k]:
-                        aliases_lookup[k].append(cn)
-
-    csv_by_week = _load_wta_csv() or {}
-    week_index_cache = {}
-
-    def _is_itf_id(value):
-        s = str(value or "").strip()
-        if not s.isdigit():
-            return False
-        return len(s) >= 9 or s.startswith("800")
-
-    def _index_variants(name):
-        """Generate additional lookup keys for common WTA naming variants (e.g., married-name hyphens)."""
-        if not name:
-            return []
-        base_upper = " ".join(str(name).strip().upper().split())
-        if not base_upper:
-            return []
-        out = []
-        for cand in [base_upper, base_upper.replace("-", " ")]:
-            norm = _normalize_name_for_lookup(cand)
-            if norm and norm not in out:
-                out.append(norm)
-        parts = base_upper.split()
-        if len(parts) >= 2 and any("-" in p for p in parts[1:]):
-            stripped = parts[:]
-            for i in range(1, len(stripped)):
-                if "-" in stripped[i]:
-                    stripped[i] = stripped[i].split("-")[0]
-            norm = _normalize_name_for_lookup(" ".join(stripped))
-            if norm and norm not in out:
-                out.append(norm)
-        return out
+    # ITF-side names/ids are mapped to WTA-side ones through the shared compiled
+    # alias index (names.py), so rankings resolve even with ITF spellings.
+    name_index = get_name_index()
+    rankings = get_wta_rankings()
+
+    # Week tables are built from the raw ranking names, so normalising each
+    # distinct ranking name once is enough across all weeks.
+    ranking_name_keys = {}
 
     def week_index(week_date):
-        if week_date in week_index_cache:
-            return week_index_cache[week_date]
         idx_by_name = {}
         idx_by_id = {}
-        for p in (csv_by_week.get(week_date) or []):
+        for p in (rankings.get(week_date) or []):
             r = p.get("Rank", "")
             if r is None or r == "":
                 continue
@@ -172,59 +80,94 @@ def enrich_history_with_wta_ranks(cleaned_history):
             pid = str(p.get("Id") or "").strip()
             if pid:
                 idx_by_id[pid] = rank_str
-            for key_name in [raw, _map_to_display_name_upper(raw)]:
-                for k in _index_variants(key_name):
-                    idx_by_name[k] = rank_str
-        week_index_cache[week_date] = (idx_by_name, idx_by_id)
+            keys = ranking_name_keys.get(raw)
+            if keys is None:
+                keys = ranking_name_keys[raw] = [
+                    k for key_name in [raw, name_index.display_name_upper(raw)] for k in index_variants(key_name)
+                ]
+            for k in keys:
+                idx_by_name[k] = rank_str
         return idx_by_name, idx_by_id
 
-    def resolve_rank(name_raw, idx):
-        """Resolve a ranking for a raw name using direct and alias-based lookups."""
-        if not name_raw:
-            return ""
-        raw_norm = _normalize_name_for_lookup(name_raw)
-        disp_norm = _normalize_name_for_lookup(_map_to_display_name_upper(name_raw))
-        rank = idx.get(disp_norm) or idx.get(raw_norm) or ""
-        if rank:
-            return rank
-        # Alias-based lookup: try ITF name -> WTA name candidates.
-        for k in (disp_norm, raw_norm):
-            if not k:
-                continue
-            for cand in (aliases_lookup.get(k) or []):
-                rank = idx.get(cand) or ""
-                if rank:
-                    return rank
-        return ""
-
-    def resolve_rank_by_ids(name_raw, player_id_raw, idx_by_name, idx_by_id):
-        """Resolve rank preferring WTA id lookups (direct or ITF-id->WTA-id via aliases JSON)."""
-        pid = str(player_id_raw or "").strip()
-        wta_id = ""
-        if pid.isdigit():
-            if _is_itf_id(pid):
-                wta_id = itf_id_to_wta_id.get(pid, "")
-            else:
-                wta_id = pid
+    # Per distinct (name, id): WTA id to join on, then name keys in lookup order
+    # (display name, raw name, then ITF->WTA alias candidates of each).
+    player_keys_cache = {}
+
+    def player_keys(name_raw, player_id_raw):
+        cache_key = (name_raw, player_id_raw)
+        if cache_key in player_keys_cache:
+            return player_keys_cache[cache_key]
+        wta_id = name_index.wta_id_for(player_id_raw)
+        name_keys = name_index.name_keys(name_raw)
+        player_keys_cache[cache_key] = (wta_id, name_keys)
+        return wta_id, name_keys
+
+    def resolve_rank(name_raw, player_id_raw, idx_by_name, idx_by_id):
+        """Resolve rank preferring WTA id lookups (direct or ITF-id->WTA-id via aliases JSON), then names."""
+        wta_id, name_keys = player_keys(name_raw, player_id_raw)
         if wta_id:
             rank = idx_by_id.get(wta_id) or ""
             if rank:
                 return rank
-        return resolve_rank(name_raw, idx_by_name)
+        for k in name_keys:
+            rank = idx_by_name.get(k) or ""
+            if rank:
+                return rank
+        return ""
+
+    def row_hash(row):
+        ident = "\x1f".join(str(row.get(k) or "") for k in ("DATE", "_winnerId", "_winnerName", "_loserId", "_loserName"))
+        return hashlib.sha1(ident.encode("utf-8")).hexdigest()[:16]
 
+    # One pass: group rows by ranking week (dates repeat a lot, so memoise the Monday).
+    monday_by_date = {}
+    rows_by_week = {}
     for row in cleaned_history:
         row["_winnerRank"] = ""
         row["_loserRank"] = ""
-        week_date = _monday_from_date_str(row.get("DATE", ""))
-        if not week_date or week_date not in csv_by_week:
+        date_str = row.get("DATE", "")
+        if date_str not in monday_by_date:
+            monday_by_date[date_str] = monday_of(date_str)
+        week_date = monday_by_date[date_str]
+        if week_date and week_date in rankings:
+            rows_by_week.setdefault(week_date, []).append(row)
+
+    # Historical ranks never change: reuse results per week while the week's
+    # rankings content and the aliases file are unchanged.
+    aliases_version = _file_sha1(PLAYER_ALIASES_WTA_ITF_FILE)
+    ranks_cache = load_cache(HISTORY_RANKS_CACHE_FILE)
+    if ranks_cache.get("aliases_version") != aliases_version:
+        ranks_cache = {}
+    cached_weeks = ranks_cache.get("weeks") or {}
+    new_weeks = {}
+    reused = 0
+    for week_date, rows in rows_by_week.items():
+        version = rankings.week_version(week_date)
+        cached = cached_weeks.get(week_date) if version else None
+        hashes = [row_hash(row) for row in rows]
+        if cached and cached.get("version") == version and all(h in cached["rows"] for h in hashes):
+            for row, h in zip(rows, hashes):
+                row["_winnerRank"], row["_loserRank"] = cached["rows"][h]
+            new_weeks[week_date] = cached
+            reused += 1
             continue
         idx_by_name, idx_by_id = week_index(week_date)
-        row["_winnerRank"] = resolve_rank_by_ids(
-            row.get("_winnerName", ""), row.get("_winnerId", ""), idx_by_name, idx_by_id
-        )
-        row["_loserRank"] = resolve_rank_by_ids(
-            row.get("_loserName", ""), row.get("_loserId", ""), idx_by_name, idx_by_id
-        )
+        week_rows = {}
+        for row, h in zip(rows, hashes):
+            row["_winnerRank"] = resolve_rank(row.get("_winnerName", ""), row.get("_winnerId", ""), idx_by_name, idx_by_id)
+            row["_loserRank"] = resolve_rank(row.get("_loserName", ""), row.get("_loserId", ""), idx_by_name, idx_by_id)
+            week_rows[h] = [row["_winnerRank"], row["_loserRank"]]
+        if version:
+            new_weeks[week_date] = {"version": version, "rows": week_rows}
+
+    print(f"  History ranks: {reused}/{len(rows_by_week)} weeks reused from cache")
+    if new_weeks != cached_weeks:
+        try:
+            os.makedirs(os.path.dirname(HISTORY_RANKS_CACHE_FILE), exist_ok=True)
+            with open(HISTORY_RANKS_CACHE_FILE, "w", encoding="utf-8") as f:
+                json.dump({"aliases_version": aliases_version, "weeks": new_weeks}, f, separators=(",", ":"))
+        except Exception as e:
+            print(f"Error writing {HISTORY_RANKS_CACHE_FILE}: {e}")
 
     return cleaned_history
 
@@ -252,8 +195,7 @@ def build_all_tournament_groups(driver):
         t_name = item['tournamentName']
         if 'cancel' in t_name.lower():
             continue
-        s_date = pd.to_datetime(item['startDate'])
-        monday_date = (s_date - timedelta(days=s_date.weekday())).strftime('%Y-%m-%d')
+        monday_date = monday_of(item['startDate'])
         if monday_date in itf_monday_map:
             week_label = itf_monday_map[monday_date]
             tournament_groups[week_label][item['tournamentKey'].lower()] = {
@@ -282,8 +224,7 @@ def build_all_tournament_groups(driver):
 
 def fetch_arg_players():
     """Fetch WTA+ITF rankings and return deduplicated ARG player list."""
-    today = datetime.now()
-    ranking_monday = (today - timedelta(days=today.weekday())).strftime("%Y-%m-%d")
+    ranking_monday = monday_of(datetime.now())
 
     all_wta_players = get_wta_rankings_cached(ranking_monday, nationality=None)
     normalize_country_overrides(all_wta_players, "Player", "Country")
@@ -309,6 +250,16 @@ def process_tournaments(driver, tournament_groups, monday_map, arg_names_set, en
 
     mondays = sorted(monday_map.keys())
     total_weeks = len(mondays) or 4
+    today_str = datetime.now().strftime("%Y-%m-%d")
+    current_monday = monday_of(today_str)
+
+    # Fetch every ITF acceptance list up front (concurrently when the HTTP session is in use).
+    itf_keys = []
+    for week_monday in mondays:
+        for key, t_info in tournament_groups.get(monday_map.get(week_monday), {}).items():
+            if not key.startswith("http") and 'cancel' not in t_info["name"].lower():
+                itf_keys.append(key)
+    prefetch_itf_players(itf_keys, driver)
 
     for i, week_monday in enumerate(mondays, start=1):
         print(f"Processing Tournaments ({i}/{total_weeks})")
@@ -317,17 +268,14 @@ def process_tournaments(driver, tournament_groups, monday_map, arg_names_set, en
             continue
         tourneys = tournament_groups.get(week, {})
 
+        # Ranking weeks used for entry: 4 weeks before (MD) / 3 weeks before (Q),
+        # capped at the current week.
         md_date = get_monday_offset(week_monday, 4)
         q_date = get_monday_offset(week_monday, 3)
-
-        today_date = datetime.now()
-        md_datetime = datetime.strptime(md_date, "%Y-%m-%d")
-        q_datetime = datetime.strptime(q_date, "%Y-%m-%d")
-
-        if md_datetime > today_date:
-            md_date = (today_date - timedelta(days=today_date.weekday())).strftime("%Y-%m-%d")
-        if q_datetime > today_date:
-            q_date = (today_date - timedelta(days=today_date.weekday())).strftime("%Y-%m-%d")
+        if md_date > today_str:
+            md_date = current_monday
+        if q_date > today_str:
+            q_date = current_monday
 
         if md_date not in ranking_cache:
             ranking_cache[md_date] = get_wta_rankings_cached(md_date, nationality=None)
@@ -424,101 +372,6 @@ def process_tournaments(driver, tournament_groups, monday_map, arg_names_set, en
     return schedule_map, tournament_store, entry_cache, unranked_schedule
 
 
-def load_match_history():
-    """Read all match CSV files and return raw + cleaned/normalized rows."""
-    match_history_data = []
-    matches_files = [
-        os.path.join(DATA_DIR, 'itf_matches_arg.csv'),
-        os.path.join(DATA_DIR, 'wta_matches_arg.csv'),
-        os.path.join(DATA_DIR, 'gs_matches_arg.csv'),
-        os.path.join(DATA_DIR, 'og_matches_arg.csv'),
-        os.path.join(DATA_DIR, 'bjkc_matches_arg.csv'),
-        os.path.join(DATA_DIR, 'united_cup_matches_arg.csv'),
-        os.path.join(DATA_DIR, 'manually_added_matches.csv'),
-    ]
-    for file_path in matches_files:
-        try:
-            with open(file_path, 'r', encoding='utf-8-sig') as file_obj:
-                reader = csv.DictReader(file_obj, delimiter=',')
-                for row in reader:
-                    match_history_data.append(row)
-        except Exception as e:
-            print(f"Error reading matches data from {file_path}: {e}")
-
-    cleaned_history = []
-    for m in match_history_data:
-        fecha = (m.get('date') or m.get('Date') or m.get('matchDate') or
-                m.get('match_date') or m.get('FECHA') or '')
-
-        winner_entry = m.get('winnerEntry') or m.get('winner_entry') or m.get('WinnerEntry') or ''
-        loser_entry = m.get('loserEntry') or m.get('loser_entry') or m.get('LoserEntry') or ''
-        winner_entry = '' if winner_entry == 'DA' else winner_entry
-        loser_entry = '' if loser_entry == 'DA' else loser_entry
-
-        raw_round = m.get('roundName') or m.get('round_name') or m.get('RoundName') or ''
-        draw_type = m.get('draw') or m.get('Draw') or m.get('DRAW') or ''
-        match_type_value = (m.get('matchType') or m.get('MatchType') or m.get('MATCH_TYPE') or '').strip()
-        tournament_category_value = (m.get('tournamentCategory') or m.get('tournament_category') or m.get('TournamentCategory') or '').strip()
-        tournament_name_value = (m.get('tournamentName') or m.get('tournament_name') or m.get('TournamentName') or '').strip()
-
-        final_round = raw_round
-
-        raw_surface = m.get('surface') or m.get('Surface') or ''
-        in_or_outdoor = m.get('inOrOutdoor') or m.get('InOrOutdoor') or ''
-        if raw_surface.startswith('I.'):
-            formatted_surface = 'Ind. ' + raw_surface[2:].capitalize()
-        elif in_or_outdoor == 'I':
-            formatted_surface = 'Ind. ' + raw_surface
-        else:
-            formatted_surface = raw_surface
-
-        tournament_id_value = (m.get('tournamentId') or m.get('tournament_id') or m.get('TournamentId') or '').strip()
-        winner_id_value = (m.get('winnerId') or m.get('winner_id') or m.get('WinnerId') or '').strip()
-        loser_id_value = (m.get('loserId') or m.get('loser_id') or m.get('LoserId') or '').strip()
-
-        cleaned_history.append({
-            'DATE': fecha,
-            'TOURNAMENT': fix_encoding(tournament_name_value),
-            'TOURNAMENT_ID': tournament_id_value,
-            'CATEGORY': fix_encoding(tournament_category_value),
-            'SURFACE': formatted_surface,
-            'MATCH_TYPE': match_type_value,
-            'DRAW': draw_type,
-            'ROUND': final_round,
-            'PLAYER': '',
-            'ENTRY': '',
-            'SEED': '',
-            'RESULT': '',
-            'SCORE': m.get('result') or m.get('Result') or '',
-            'RIVAL_ENTRY': '',
-            'RIVAL_SEED': '',
-            'RIVAL': '',
-            'RIVAL_COUNTRY': '',
-            '_winnerId': winner_id_value,
-            '_loserId': loser_id_value,
-            '_winnerName': fix_encoding_keep_accents(m.get('winnerName') or m.get('winner_name') or m.get('WinnerName') or ''),
-            '_loserName': fix_encoding_keep_accents(m.get('loserName') or m.get('loser_name') or m.get('LoserName') or ''),
-            '_winnerCountry': m.get('winnerCountry') or m.get('winner_country') or m.get('WinnerCountry') or '',
-            '_loserCountry': m.get('loserCountry') or m.get('loser_country') or m.get('LoserCountry') or '',
-            '_winnerEntry': winner_entry,
-            '_loserEntry': loser_entry,
-            '_winnerSeed': m.get('winnerSeed') or m.get('winner_seed') or m.get('WinnerSeed') or '',
-            '_loserSeed': m.get('loserSeed') or m.get('loser_seed') or m.get('LoserSeed') or '',
-            '_resultStatusDesc': m.get('resultStatusDesc') or m.get('result_status_desc') or m.get('ResultStatusDesc') or ''
-        })
-
-    def parse_match_date(item):
-        d = item.get('DATE') or "1900-01-01"
-        try:
-            return pd.to_datetime(d, dayfirst=False)
-        except:
-            return pd.to_datetime("1900-01-01")
-
-    cleaned_history.sort(key=parse_match_date, reverse=True)
-
-    return match_history_data, cleaned_history
-
-
 def build_calendar_snapshot(calendar_data):
     """Deduplicate calendar data into snapshot list and save JSON."""
     calendar_snapshot = []
@@ -547,58 +400,51 @@ def build_calendar_snapshot(calendar_data):
     save_json_file(CALENDAR_SNAPSHOT_FILE, calendar_snapshot)
 
 
-def main():
-    driver = create_driver()
+def load_entry_lists(driver, tournament_groups, monday_map, players_data, arg_names_set):
+    """Scrape entry lists (cached), and add unranked ARG players found in them.
+
+    Returns (players, schedule_map, tournament_store); players_data is not modified.
+    """
+    entry_cache = load_cache(ENTRY_LISTS_CACHE_FILE)
+    schedule_map, tournament_store, entry_cache, unranked_schedule = process_tournaments(
+        driver, tournament_groups, monday_map, arg_names_set, entry_cache
+    )
+    save_cache(ENTRY_LISTS_CACHE_FILE, entry_cache)
+
+    # Add unranked ARG players found in entry lists to players and schedule_map
+    players = list(players_data)
+    existing_player_keys = {p['Player'] for p in players}
+    for name_upper, weeks in unranked_schedule.items():
+        schedule_map[name_upper] = weeks
+        if name_upper not in existing_player_keys:
+            players.append({
+                'Player': name_upper,
+                'Key': name_upper,
+                'Rank': '-'
+            })
+    return players, schedule_map, tournament_store
+
+
+def load_history():
+    """Load match history, add WTA ranks and write history_data.json."""
+    match_history_data, cleaned_history = load_match_history()
+    enrich_history_with_wta_ranks(cleaned_history)
+    # history_data.json is written here only (generate_html no longer rewrites it)
     try:
-        # 1. Fetch full-year ITF calendar first (populates cache for dynamic subset)
-        full_itf = get_full_itf_calendar(driver)
-
-        # 2. Build tournament groups (WTA + ITF) — uses cached ITF data
-        tournament_groups, monday_map = build_all_tournament_groups(driver)
-
-        # 3. Fetch ARG player rankings
-        players_data, arg_names_set, all_wta_players = fetch_arg_players()
-
-        # 4. Process tournament entry lists
-        entry_cache = load_cache(ENTRY_LISTS_CACHE_FILE)
-        schedule_map, tournament_store, entry_cache, unranked_schedule = process_tournaments(
-            driver, tournament_groups, monday_map, arg_names_set, entry_cache
-        )
-        save_cache(ENTRY_LISTS_CACHE_FILE, entry_cache)
-
-        # Add unranked ARG players found in entry lists to players_data and schedule_map
-        existing_player_keys = {p['Player'] for p in players_data}
-        for name_upper, weeks in unranked_schedule.items():
-            schedule_map[name_upper] = weeks
-            if name_upper not in existing_player_keys:
-                players_data.append({
-                    'Player': name_upper,
-                    'Key': name_upper,
-                    'Rank': '-'
-                })
-
-        # 5. Load match history
-        match_history_data, cleaned_history = load_match_history()
-        enrich_history_with_wta_ranks(cleaned_history)
-        # Always rebuild history_data.json on each run
-        try:
-            history_data_path = os.path.join(DATA_DIR, "history_data.json")
-            with open(history_data_path, "w", encoding="utf-8") as f:
-                json.dump(cleaned_history or [], f, ensure_ascii=False, separators=(",", ":"))
-        except Exception as e:
-            print(f"Error writing history_data.json: {e}")
+        write_history_data(cleaned_history)
+    except Exception as e:
+        print(f"Error writing history_data.json: {e}")
+    return match_history_data, cleaned_history
 
-        # 5b. Fetch ITF draws tournament list (needs Selenium for GetEventFilters)
-        print("Fetching ITF draws tournament list...")
-        itf_draws_tournaments = get_draws_itf_tournament_list(driver)
-    finally:
-        driver.quit()
 
-    # 6. Fetch draws (WTA + ITF). Keep a persistent cache so draws don't "disappear"
-    # when a fetch fails temporarily.
+def load_draws_store():
     draws_store = load_cache(DRAWS_STORE_CACHE_FILE) or {}
-    if not isinstance(draws_store, dict):
-        draws_store = {}
+    return draws_store if isinstance(draws_store, dict) else {}
+
+
+def fetch_wta_draws():
+    """Fetch WTA draws of the current draws window. Returns (jobs, {t_key: draws})."""
+    draws_store = load_draws_store()
     draws_tournaments = get_draws_tournament_list()
     current_year = str(datetime.now().year)
     wta_draw_jobs = []
@@ -606,26 +452,34 @@ def main():
         for t_key, t_info in (tourneys or {}).items():
             wta_draw_jobs.append((week, t_key, t_info))
 
-    total_wta_draws = len(wta_draw_jobs) or 1
-    for i, (week, t_key, t_info) in enumerate(wta_draw_jobs, start=1):
-        print(f"Fetching WTA Draws ({i}/{total_wta_draws})")
-        prev = draws_store.get(t_key) if isinstance(draws_store.get(t_key), dict) else {}
-        prev_draws = (prev or {}).get("draws") or {}
-        t_draws = fetch_tournament_draws(t_key, current_year) or {}
-        merged_draws = t_draws if t_draws else prev_draws
-        if merged_draws:
-            if not t_draws and prev_draws:
-                print(f"  Using cached WTA draws for: {t_info.get('name','')}")
-            draws_store[t_key] = {
-                "name": t_info["name"],
-                "level": t_info.get("level", ""),
-                "week": week,
-                "startDate": t_info.get("startDate"),
-                "endDate": t_info.get("endDate"),
-                "draws": merged_draws,
-            }
+    print(f"Fetching WTA Draws ({len(wta_draw_jobs)} tournaments)")
+    draw_pdf_http_cache = load_cache(DRAW_PDF_HTTP_CACHE_FILE) or {}
+    previous_wta_draws = {
+        t_key: (draws_store.get(t_key) or {}).get("draws") or {}
+        for _, t_key, _ in wta_draw_jobs
+        if isinstance(draws_store.get(t_key), dict)
+    }
+    fetched_wta_draws = fetch_tournament_draws_many(
+        [t_key for _, t_key, _ in wta_draw_jobs], current_year,
+        previous_draws=previous_wta_draws, http_cache=draw_pdf_http_cache,
+    )
+    # Only keep validators for PDFs of tournaments still being tracked.
+    live_prefixes = {f"{current_year}/{_extract_tournament_id(t_key)}/" for _, t_key, _ in wta_draw_jobs}
+    save_cache(DRAW_PDF_HTTP_CACHE_FILE, {
+        k: v for k, v in draw_pdf_http_cache.items()
+        if k[:k.rfind("/") + 1] in live_prefixes
+    })
+    return wta_draw_jobs, fetched_wta_draws
+
+
+def load_itf_draws_list(driver):
+    """ITF draws tournament list (ids from the registry; Selenium only for new keys)."""
+    print("Fetching ITF draws tournament list...")
+    return get_draws_itf_tournament_list(driver)
+
 
-    # 6b. Fetch ITF draws (uses requests.post, no Selenium needed)
+def fetch_itf_draws(itf_draws_tournaments):
+    """Fetch ITF draws (uses requests.post, no Selenium needed). Returns (jobs, {tournamentId: draws})."""
     itf_draw_jobs = []
     for week, tourneys in (itf_draws_tournaments or {}).items():
         for t_key, t_info in (tourneys or {}).items():
@@ -634,26 +488,39 @@ def main():
                 continue
             itf_draw_jobs.append((week, t_key, t_info))
 
-    total_itf_draws = len(itf_draw_jobs) or 1
-    for i, (week, t_key, t_info) in enumerate(itf_draw_jobs, start=1):
-        print(f"Fetching ITF Draws ({i}/{total_itf_draws})")
-        tid = t_info.get("tournamentId")
-        is_multiweek = t_info.get("is_multiweek", False)
-        prev = draws_store.get(t_key) if isinstance(draws_store.get(t_key), dict) else {}
-        prev_draws = (prev or {}).get("draws") or {}
-        t_draws = fetch_itf_tournament_draws(tid, is_multiweek=is_multiweek) or {}
-        merged_draws = t_draws if t_draws else prev_draws
-        if merged_draws:
-            if not t_draws and prev_draws:
-                print(f"  Using cached ITF draws for: {t_info.get('name','')}")
-            draws_store[t_key] = {
-                "name": t_info["name"],
-                "level": t_info.get("level", ""),
-                "week": week,
-                "startDate": t_info.get("startDate"),
-                "endDate": t_info.get("endDate"),
-                "draws": merged_draws,
-            }
+    print(f"Fetching ITF Draws ({len(itf_draw_jobs)} tournaments)")
+    fetched_itf_draws = fetch_itf_tournament_draws_many([
+        (t_info.get("tournamentId"), t_info.get("is_multiweek", False))
+        for _, _, t_info in itf_draw_jobs
+    ])
+    return itf_draw_jobs, fetched_itf_draws
+
+
+def update_draws_store(wta_draw_jobs, fetched_wta_draws, itf_draw_jobs, fetched_itf_draws):
+    """Merge fetched draws into the persistent draws cache, so draws don't "disappear"
+    when a fetch fails temporarily. Returns the draws store."""
+    draws_store = load_draws_store()
+    sources = [
+        ("WTA", wta_draw_jobs, lambda t_key, t_info: fetched_wta_draws.get(t_key)),
+        ("ITF", itf_draw_jobs, lambda t_key, t_info: fetched_itf_draws.get(t_info.get("tournamentId"))),
+    ]
+    for source, jobs, fetched_draws in sources:
+        for week, t_key, t_info in jobs:
+            prev = draws_store.get(t_key) if isinstance(draws_store.get(t_key), dict) else {}
+            prev_draws = (prev or {}).get("draws") or {}
+            t_draws = fetched_draws(t_key, t_info) or {}
+            merged_draws = t_draws if t_draws else prev_draws
+            if merged_draws:
+                if not t_draws and prev_draws:
+                    print(f"  Using cached {source} draws for: {t_info.get('name','')}")
+                draws_store[t_key] = {
+                    "name": t_info["name"],
+                    "level": t_info.get("level", ""),
+                    "week": week,
+                    "startDate": t_info.get("startDate"),
+                    "endDate": t_info.get("endDate"),
+                    "draws": merged_draws,
+                }
 
     # Prune draws for tournaments that are definitely over (endDate < today).
     today = datetime.now().date()
@@ -684,22 +551,27 @@ def main():
             "types": list(tdata.get("draws", {}).keys()),
         }
     save_json_file(os.path.join(DATA_DIR, "draws_snapshot.json"), draws_snapshot)
+    return draws_store
 
-    # 7. Build calendar — uses cached WTA data
-    full_wta = get_full_wta_calendar()
+
+def build_calendar(full_wta, full_itf):
     calendar_data = build_calendar_data(full_wta + full_itf)
     build_calendar_snapshot(calendar_data)
+    return calendar_data
+
 
-    # 7b. Build tournament strength data (cached)
+def build_tstrength():
     print("Processing WTA Tournament Strength")
-    tstrength_data = build_tstrength_data()
+    return build_tstrength_data()
 
-    # 8. Generate HTML
+
+def write_site(tournament_groups, tournament_store, players, schedule_map, cleaned_history,
+               calendar_data, match_history_data, all_wta_players, draws_store, tstrength_data):
     national_team_data = load_csv_rows(os.path.join(DATA_DIR, 'national_team_order.csv'), delimiter=';')
     captains_data = load_csv_rows(os.path.join(DATA_DIR, 'captains.csv'))
 
     generate_html(
-        tournament_groups, tournament_store, players_data, schedule_map,
+        tournament_groups, tournament_store, players, schedule_map,
         cleaned_history, calendar_data, match_history_data, all_wta_players,
         national_team_data=national_team_data,
         captains_data=captains_data,
@@ -708,5 +580,61 @@ def main():
     )
 
 
+def pipeline_stages(driver):
+    """The update run as a stage DAG (see stages.py).
+
+    Stages that use the Selenium driver share it (itf.py serialises page loads).
+    `after` orders stages that share a module-level cache or file without
+    passing a value: the ITF and WTA calendar fetches are cached per process.
+    The rankings are not thread-safe: fetch_arg_players and load_entry_lists
+    read the shared WtaRankings and may append a week to the rankings CSV
+    (fetching ranking weeks missing from it), load_history reads the same
+    WtaRankings and build_tstrength reads the CSV's store, so the last two run
+    after entry_lists (which itself waits for arg_players).
+    """
+    return [
+        # Full-year ITF calendar (populates the cache the dynamic subset reads)
+        Stage("itf_calendar", lambda: get_full_itf_calendar(driver), outputs=["full_itf"]),
+        # WTA tournaments until the end of the year (cached for groups, draws and calendar)
+        Stage("wta_calendar", get_full_wta_calendar, outputs=["full_wta"]),
+        Stage("tournament_groups", lambda: build_all_tournament_groups(driver),
+              outputs=["tournament_groups", "monday_map"], after=["itf_calendar", "wta_calendar"]),
+        Stage("arg_players", fetch_arg_players,
+              outputs=["players_data", "arg_names_set", "all_wta_players"]),
+        Stage("entry_lists", lambda *args: load_entry_lists(driver, *args),
+              inputs=["tournament_groups", "monday_map", "players_data", "arg_names_set"],
+              outputs=["players", "schedule_map", "tournament_store"]),
+        Stage("match_history", load_history,
+              outputs=["match_history_data", "cleaned_history"], after=["entry_lists"]),
+        Stage("itf_draws_list", lambda: load_itf_draws_list(driver),
+              outputs=["itf_draws_tournaments"], after=["itf_calendar"]),
+        Stage("wta_draws", fetch_wta_draws,
+              outputs=["wta_draw_jobs", "fetched_wta_draws"], after=["wta_calendar"]),
+        Stage("itf_draws", fetch_itf_draws,
+              inputs=["itf_draws_tournaments"], outputs=["itf_draw_jobs", "fetched_itf_draws"]),
+        Stage("draws_store", update_draws_store,
+              inputs=["wta_draw_jobs", "fetched_wta_draws", "itf_draw_jobs", "fetched_itf_draws"],
+              outputs=["draws_store"]),
+        Stage("calendar", build_calendar, inputs=["full_wta", "full_itf"], outputs=["calendar_data"]),
+        Stage("tstrength", build_tstrength, outputs=["tstrength_data"], after=["entry_lists"]),
+        Stage("html", write_site,
+              inputs=["tournament_groups", "tournament_store", "players", "schedule_map", "cleaned_history",
+                      "calendar_data", "match_history_data", "all_wta_players", "draws_store", "tstrength_data"]),
+    ]
+
+
+def main():
+    driver = create_driver()
+    try:
+        run_stages(pipeline_stages(driver))
+    finally:
+        driver.quit()
+    run_metrics.record(
+        critical_path=list(CRITICAL_PATH),
+        render={"ms": dict(RENDER_TIMINGS), "cached": sorted(CACHED_SECTIONS)},
+    )
+
+
 if __name__ == "__main__":
+    run_metrics.start_run("main.py")
     main()
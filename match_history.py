@@ -0,0 +1,223 @@
+"""Incremental match-history builder.
+
+Normalized rows are persisted in `.cache/history/match_history_store.json`
+(HISTORY_STORE_FILE; kept via actions/cache, not committed), per source CSV:
+its sha1, the raw rows, the normalized rows and a precomputed date sort key.
+Unchanged CSVs are reused as is; for changed CSVs only rows that were not seen
+before are re-normalized. Each file's rows are kept sorted by date, so the full
+history is a k-way merge instead of a full re-sort.
+"""
+
+import csv
+import hashlib
+import heapq
+import io
+import json
+import os
+import re
+
+import pandas as pd
+
+from config import DATA_DIR, HISTORY_STORE_FILE
+from utils import fix_encoding, fix_encoding_keep_accents, write_text_if_changed
+
+MATCH_HISTORY_FILES = [
+    os.path.join(DATA_DIR, 'itf_matches_arg.csv'),
+    os.path.join(DATA_DIR, 'wta_matches_arg.csv'),
+    os.path.join(DATA_DIR, 'gs_matches_arg.csv'),
+    os.path.join(DATA_DIR, 'og_matches_arg.csv'),
+    os.path.join(DATA_DIR, 'bjkc_matches_arg.csv'),
+    os.path.join(DATA_DIR, 'united_cup_matches_arg.csv'),
+    os.path.join(DATA_DIR, 'manually_added_matches.csv'),
+]
+HISTORY_DATA_FILE = os.path.join(DATA_DIR, "history_data.json")
+
+_STORE_VERSION = 1
+_MISSING_DATE_KEY = "1900-01-01T00:00:00"
+_ISO_DAY_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+CLEAN_FIELDS = [
+    'DATE', 'TOURNAMENT', 'TOURNAMENT_ID', 'CATEGORY', 'SURFACE', 'MATCH_TYPE', 'DRAW', 'ROUND',
+    'PLAYER', 'ENTRY', 'SEED', 'RESULT', 'SCORE', 'RIVAL_ENTRY', 'RIVAL_SEED', 'RIVAL', 'RIVAL_COUNTRY',
+    '_winnerId', '_loserId', '_winnerName', '_loserName', '_winnerCountry', '_loserCountry',
+    '_winnerEntry', '_loserEntry', '_winnerSeed', '_loserSeed', '_resultStatusDesc',
+]
+
+
+def normalize_match_row(m):
+    """Map a raw match CSV row (any of the known column spellings) to a history row."""
+    fecha = (m.get('date') or m.get('Date') or m.get('matchDate') or
+            m.get('match_date') or m.get('FECHA') or '')
+
+    winner_entry = m.get('winnerEntry') or m.get('winner_entry') or m.get('WinnerEntry') or ''
+    loser_entry = m.get('loserEntry') or m.get('loser_entry') or m.get('LoserEntry') or ''
+    winner_entry = '' if winner_entry == 'DA' else winner_entry
+    loser_entry = '' if loser_entry == 'DA' else loser_entry
+
+    raw_round = m.get('roundName') or m.get('round_name') or m.get('RoundName') or ''
+    draw_type = m.get('draw') or m.get('Draw') or m.get('DRAW') or ''
+    match_type_value = (m.get('matchType') or m.get('MatchType') or m.get('MATCH_TYPE') or '').strip()
+    tournament_category_value = (m.get('tournamentCategory') or m.get('tournament_category') or m.get('TournamentCategory') or '').strip()
+    tournament_name_value = (m.get('tournamentName') or m.get('tournament_name') or m.get('TournamentName') or '').strip()
+
+    final_round = raw_round
+
+    raw_surface = m.get('surface') or m.get('Surface') or ''
+    in_or_outdoor = m.get('inOrOutdoor') or m.get('InOrOutdoor') or ''
+    if raw_surface.startswith('I.'):
+        formatted_surface = 'Ind. ' + raw_surface[2:].capitalize()
+    elif in_or_outdoor == 'I':
+        formatted_surface = 'Ind. ' + raw_surface
+    else:
+        formatted_surface = raw_surface
+
+    tournament_id_value = (m.get('tournamentId') or m.get('tournament_id') or m.get('TournamentId') or '').strip()
+    winner_id_value = (m.get('winnerId') or m.get('winner_id') or m.get('WinnerId') or '').strip()
+    loser_id_value = (m.get('loserId') or m.get('loser_id') or m.get('LoserId') or '').strip()
+
+    return {
+        'DATE': fecha,
+        'TOURNAMENT': fix_encoding(tournament_name_value),
+        'TOURNAMENT_ID': tournament_id_value,
+        'CATEGORY': fix_encoding(tournament_category_value),
+        'SURFACE': formatted_surface,
+        'MATCH_TYPE': match_type_value,
+        'DRAW': draw_type,
+        'ROUND': final_round,
+        'PLAYER': '',
+        'ENTRY': '',
+        'SEED': '',
+        'RESULT': '',
+        'SCORE': m.get('result') or m.get('Result') or '',
+        'RIVAL_ENTRY': '',
+        'RIVAL_SEED': '',
+        'RIVAL': '',
+        'RIVAL_COUNTRY': '',
+        '_winnerId': winner_id_value,
+        '_loserId': loser_id_value,
+        '_winnerName': fix_encoding_keep_accents(m.get('winnerName') or m.get('winner_name') or m.get('WinnerName') or ''),
+        '_loserName': fix_encoding_keep_accents(m.get('loserName') or m.get('loser_name') or m.get('LoserName') or ''),
+        '_winnerCountry': m.get('winnerCountry') or m.get('winner_country') or m.get('WinnerCountry') or '',
+        '_loserCountry': m.get('loserCountry') or m.get('loser_country') or m.get('LoserCountry') or '',
+        '_winnerEntry': winner_entry,
+        '_loserEntry': loser_entry,
+        '_winnerSeed': m.get('winnerSeed') or m.get('winner_seed') or m.get('WinnerSeed') or '',
+        '_loserSeed': m.get('loserSeed') or m.get('loser_seed') or m.get('LoserSeed') or '',
+        '_resultStatusDesc': m.get('resultStatusDesc') or m.get('result_status_desc') or m.get('ResultStatusDesc') or ''
+    }
+
+
+def date_sort_key(date_str):
+    """ISO timestamp string for a match date; sorts like pd.to_datetime, missing/bad dates -> 1900-01-01."""
+    if date_str and _ISO_DAY_RE.match(date_str):
+        return date_str + "T00:00:00"
+    try:
+        return pd.to_datetime(date_str or "1900-01-01", dayfirst=False).isoformat()
+    except Exception:
+        return _MISSING_DATE_KEY
+
+
+def _load_store():
+    try:
+        with open(HISTORY_STORE_FILE, "r", encoding="utf-8") as f:
+            store = json.load(f)
+        if store.get("version") == _STORE_VERSION:
+            return store
+    except Exception:
+        pass
+    return {"version": _STORE_VERSION, "files": {}}
+
+
+def _save_store(store):
+    os.makedirs(os.path.dirname(HISTORY_STORE_FILE), exist_ok=True)
+    tmp = HISTORY_STORE_FILE + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(store, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp, HISTORY_STORE_FILE)
+
+
+def _build_file_entry(content, sha1, previous):
+    """Parse one CSV; reuse normalized rows from the previous entry for rows seen before."""
+    reader = csv.DictReader(io.StringIO(content), delimiter=',')
+    rows = list(reader)
+    fieldnames = reader.fieldnames or []
+
+    known = {}
+    if previous and previous.get("fieldnames") == fieldnames:
+        for raw, clean, key in zip(previous["raw"], previous["clean"], previous["keys"]):
+            known[tuple(raw)] = (clean, key)
+
+    entries = []
+    normalized = 0
+    for row in rows:
+        raw = [row.get(k) or "" for k in fieldnames]
+        hit = known.get(tuple(raw))
+        if hit is None:
+            cleaned = normalize_match_row(row)
+            hit = ([cleaned[k] for k in CLEAN_FIELDS], date_sort_key(cleaned['DATE']))
+            normalized += 1
+        entries.append((raw, hit[0], hit[1]))
+
+    # Stable sort, newest first: ties keep CSV order, like the old full-history sort.
+    entries.sort(key=lambda e: e[2], reverse=True)
+    entry = {
+        "sha1": sha1,
+        "fieldnames": fieldnames,
+        "raw": [e[0] for e in entries],
+        "clean": [e[1] for e in entries],
+        "keys": [e[2] for e in entries],
+    }
+    return entry, normalized
+
+
+def load_match_history():
+    """Read all match CSV files and return raw + cleaned/normalized rows (newest first)."""
+    store = _load_store()
+    files = {}
+    changed = False
+    for file_path in MATCH_HISTORY_FILES:
+        name = os.path.basename(file_path)
+        try:
+            with open(file_path, 'rb') as file_obj:
+                data = file_obj.read()
+        except Exception as e:
+            print(f"Error reading matches data from {file_path}: {e}")
+            continue
+        sha1 = hashlib.sha1(data).hexdigest()
+        previous = store["files"].get(name)
+        if previous and previous.get("sha1") == sha1:
+            files[name] = previous
+            continue
+        entry, normalized = _build_file_entry(data.decode('utf-8-sig'), sha1, previous)
+        print(f"  {name}: {normalized} new/changed rows normalized ({len(entry['keys'])} total)")
+        files[name] = entry
+        changed = True
+
+    if changed or set(files) != set(store["files"]):
+        try:
+            _save_store({"version": _STORE_VERSION, "files": files})
+        except Exception as e:
+            print(f"Error writing {HISTORY_STORE_FILE}: {e}")
+
+    match_history_data = []
+    per_file_sorted = []
+    for file_path in MATCH_HISTORY_FILES:
+        entry = files.get(os.path.basename(file_path))
+        if not entry:
+            continue
+        fieldnames = entry["fieldnames"]
+        match_history_data.extend(dict(zip(fieldnames, raw)) for raw in entry["raw"])
+        per_file_sorted.append(zip(entry["keys"], entry["clean"]))
+
+    # Files are merged in source order, so equal dates keep the original file order.
+    cleaned_history = [
+        dict(zip(CLEAN_FIELDS, clean))
+        for _key, clean in heapq.merge(*per_file_sorted, key=lambda e: e[0], reverse=True)
+    ]
+    return match_history_data, cleaned_history
+
+
+def write_history_data(cleaned_history):
+    """Write history_data.json, the lazily-loaded history payload of the site (skipped if unchanged)."""
+    body = json.dumps(cleaned_history or [], ensure_ascii=False, separators=(",", ":"))
+    write_text_if_changed(HISTORY_DATA_FILE, body)
@@ -0,0 +1,345 @@
+"""Player-name normalisation and alias resolution shared by every module.
+
+`player_aliases_wta_itf.json` is compiled once into a `NameIndex` (display-name
+mapping, variant-key lookup, ITF/WTA id maps and ITF->WTA name candidates) and
+pickled under `.cache/names/` (not committed; the workflow restores it with
+actions/cache), together with the sha1 of the aliases file. Later processes load the pickle instead of
+re-parsing and re-folding every alias; the index is rebuilt whenever the
+aliases file content changes.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import unicodedata
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(BASE_DIR, "data")
+PLAYER_ALIASES_WTA_ITF_FILE = os.path.join(DATA_DIR, "player_aliases_wta_itf.json")
+NAME_INDEX_DIR = os.path.join(BASE_DIR, ".cache", "names")
+
+_INDEX_VERSION = 1
+
+_MOJIBAKE_REPLACEMENTS = {
+    "\u00ed\u00a1": "á",
+    "\u00ed\u00a8": "è",
+    "\u00ed\u00a9": "é",
+    "\u00ed\u00b1": "ñ",
+    "\u00ed\u00b3": "ó",
+    "\u00ed\u00bc": "ü",
+    "\u00ed\u02c6": "È",
+}
+
+
+def repair_name_text(value):
+    text = str(value or "")
+    if not text:
+        return ""
+
+    repaired = text
+
+    # Handle the more common UTF-8-decoded-as-Latin-1 mojibake first.
+    if any(token in repaired for token in ("Ã", "Â", "â€", "â€™", "â€œ", "â€\x9d")):
+        for source_encoding in ("latin-1", "cp1252"):
+            try:
+                repaired = repaired.encode(source_encoding).decode("utf-8")
+                break
+            except (UnicodeEncodeError, UnicodeDecodeError):
+                continue
+
+    # Then patch the OEM-codepage style sequences present in player_aliases_wta_itf.json.
+    for bad, good in _MOJIBAKE_REPLACEMENTS.items():
+        repaired = repaired.replace(bad, good)
+
+    return repaired
+
+
+def compact_spaces(value):
+    return " ".join(repair_name_text(value).strip().split())
+
+
+def fold_accents(value):
+    if not value:
+        return ""
+    nfkd = unicodedata.normalize("NFKD", value)
+    return "".join(ch for ch in nfkd if not unicodedata.combining(ch))
+
+
+def normalize_key(value):
+    """Canonical matching key: mojibake repaired, accents folded, uppercase, single spaces."""
+    return " ".join(fold_accents(repair_name_text(value)).upper().split())
+
+
+def lookup_keys(value):
+    """Keys under which a name is registered in NAME_LOOKUP (raw, folded, de-hyphenated)."""
+    base = compact_spaces(value).upper()
+    if not base:
+        return []
+    keys = [base]
+
+    folded = fold_accents(base)
+    if folded and folded not in keys:
+        keys.append(folded)
+
+    dehyphen = compact_spaces(base.replace("-", " "))
+    if dehyphen and dehyphen not in keys:
+        keys.append(dehyphen)
+
+    folded_dehyphen = fold_accents(dehyphen)
+    if folded_dehyphen and folded_dehyphen not in keys:
+        keys.append(folded_dehyphen)
+
+    return keys
+
+
+def name_variants(value):
+    """normalize_key() of a name plus its de-hyphenated form."""
+    base = normalize_key(value)
+    if not base:
+        return set()
+    out = {base}
+    if "-" in base:
+        out.add(" ".join(base.replace("-", " ").split()))
+    return out
+
+
+def index_variants(name):
+    """Lookup keys for common WTA naming variants (e.g., married-name hyphens), in priority order."""
+    if not name:
+        return []
+    base_upper = " ".join(str(name).strip().upper().split())
+    if not base_upper:
+        return []
+    out = []
+    for cand in [base_upper, base_upper.replace("-", " ")]:
+        norm = normalize_key(cand)
+        if norm and norm not in out:
+            out.append(norm)
+    parts = base_upper.split()
+    if len(parts) >= 2 and any("-" in p for p in parts[1:]):
+        stripped = parts[:]
+        for i in range(1, len(stripped)):
+            if "-" in stripped[i]:
+                stripped[i] = stripped[i].split("-")[0]
+        norm = normalize_key(" ".join(stripped))
+        if norm and norm not in out:
+            out.append(norm)
+    return out
+
+
+def is_itf_id(value):
+    s = str(value or "").strip()
+    return s.isdigit() and (len(s) >= 9 or s.startswith("800"))
+
+
+def _add_unique(target_list, value):
+    v = compact_spaces(value)
+    if v and v not in target_list:
+        target_list.append(v)
+
+
+def build_player_mapping(raw):
+    """display_name -> [aliases] from the parsed aliases JSON (list format or legacy dict)."""
+    mapping = {}
+
+    # Backward compatibility: if legacy dict mapping is passed, keep it usable.
+    if isinstance(raw, dict):
+        for display_name, aliases in raw.items():
+            display = compact_spaces(display_name)
+            if not display:
+                continue
+            bucket = mapping.setdefault(display, [])
+            _add_unique(bucket, display)
+            if isinstance(aliases, list):
+                for alias in aliases:
+                    _add_unique(bucket, alias)
+        return mapping
+
+    if not isinstance(raw, list):
+        return {}
+
+    for item in raw:
+        if not isinstance(item, dict):
+            continue
+
+        display = compact_spaces(
+            item.get("display_name")
+            or item.get("wta_name")
+            or item.get("itf_name")
+            or item.get("bjkc_name")
+        )
+        if not display:
+            continue
+
+        bucket = mapping.setdefault(display, [])
+        for key in ("display_name", "wta_name", "itf_name", "bjkc_name"):
+            _add_unique(bucket, item.get(key))
+
+        extra_aliases = item.get("aliases")
+        if isinstance(extra_aliases, list):
+            for alias in extra_aliases:
+                _add_unique(bucket, alias)
+
+    return mapping
+
+
+def load_player_mapping(filename=PLAYER_ALIASES_WTA_ITF_FILE):
+    if not os.path.exists(filename):
+        print(f"Alerta: No se encontro {filename}.")
+        return {}
+    try:
+        with open(filename, "r", encoding="utf-8-sig") as f:
+            raw = json.load(f)
+    except Exception as e:
+        print(f"Alerta: error leyendo {filename}: {e}")
+        return {}
+    return build_player_mapping(raw)
+
+
+class NameIndex:
+    """Compiled alias data: name -> display name, ITF id -> WTA id, ITF name -> WTA name keys."""
+
+    def __init__(self, player_mapping, name_lookup, itf_to_wta_id, wta_candidates):
+        self.player_mapping = player_mapping
+        self.name_lookup = name_lookup
+        self.itf_to_wta_id = itf_to_wta_id
+        self.wta_candidates = wta_candidates
+
+    def display_name_upper(self, name):
+        """Map aliases to display_name (uppercase) when possible; otherwise the cleaned name."""
+        if not name:
+            return ""
+        raw_upper = " ".join(str(name).strip().upper().split())
+        if not raw_upper:
+            return ""
+        # Try raw first, then encoding/accents-normalised key (common in older datasets).
+        return self.name_lookup.get(raw_upper) or self.name_lookup.get(normalize_key(raw_upper)) or raw_upper
+
+    def wta_id_for(self, player_id):
+        """WTA id for a WTA or ITF player id ("" if unknown or not numeric)."""
+        pid = str(player_id or "").strip()
+        if not pid.isdigit():
+            return ""
+        if is_itf_id(pid):
+            return self.itf_to_wta_id.get(pid, "")
+        return pid
+
+    def name_keys(self, name):
+        """normalize_key()s to try for a name: display name, raw name, then ITF->WTA alias candidates."""
+        if not name:
+            return []
+        raw_norm = normalize_key(name)
+        disp_norm = normalize_key(self.display_name_upper(name))
+        keys = [k for k in (disp_norm, raw_norm) if k]
+        for k in (disp_norm, raw_norm):
+            if k:
+                keys.extend(self.wta_candidates.get(k) or [])
+        return keys
+
+    def _payload(self):
+        return {
+            "player_mapping": self.player_mapping,
+            "name_lookup": self.name_lookup,
+            "itf_to_wta_id": self.itf_to_wta_id,
+            "wta_candidates": self.wta_candidates,
+        }
+
+
+def compile_name_index(raw):
+    player_mapping = build_player_mapping(raw)
+
+    name_lookup = {}
+    for display_name, aliases in player_mapping.items():
+        display_upper = compact_spaces(display_name).upper()
+        if not display_upper:
+            continue
+        for key in lookup_keys(display_upper):
+            name_lookup[key] = display_upper
+
+        for alias in aliases:
+            for key in lookup_keys(alias):
+                name_lookup[key] = display_upper
+
+    index = NameIndex(player_mapping, name_lookup, {}, {})
+
+    # Map ITF-side names/ids to WTA-side ones (to resolve rankings even when a
+    # dataset uses ITF spelling while the rankings CSV uses WTA spelling).
+    for it in (raw if isinstance(raw, list) else []):
+        if not isinstance(it, dict):
+            continue
+        itf_name = repair_name_text(it.get("itf_name")).strip()
+        itf_id = (it.get("itf_id") or "").strip()
+        wta_id = (it.get("wta_id") or "").strip()
+        if itf_id and wta_id and itf_id not in index.itf_to_wta_id:
+            index.itf_to_wta_id[itf_id] = wta_id
+        cand_norms = []
+        for n in [repair_name_text(it.get("wta_name")).strip(), repair_name_text(it.get("display_name")).strip()]:
+            if not n:
+                continue
+            for norm in (normalize_key(n), normalize_key(index.display_name_upper(n))):
+                if norm and norm not in cand_norms:
+                    cand_norms.append(norm)
+        if not itf_name or not cand_norms:
+            continue
+        # Allow lookups by raw ITF name or by our display-mapped key.
+        for k in {normalize_key(itf_name), normalize_key(index.display_name_upper(itf_name))}:
+            if not k:
+                continue
+            bucket = index.wta_candidates.setdefault(k, [])
+            for cn in cand_norms:
+                if cn not in bucket:
+                    bucket.append(cn)
+
+    return index
+
+
+def index_path_for(aliases_path):
+    stem = os.path.splitext(os.path.basename(aliases_path))[0]
+    return os.path.join(NAME_INDEX_DIR, f"{stem}.index.pkl")
+
+
+def load_name_index(aliases_path=PLAYER_ALIASES_WTA_ITF_FILE):
+    """Load the compiled index for aliases_path, rebuilding (and re-pickling) it if stale."""
+    try:
+        with open(aliases_path, "rb") as f:
+            data = f.read()
+    except OSError:
+        print(f"Alerta: No se encontro {aliases_path}.")
+        return NameIndex({}, {}, {}, {})
+    sha1 = hashlib.sha1(data).hexdigest()
+
+    index_path = index_path_for(aliases_path)
+    try:
+        with open(index_path, "rb") as f:
+            cached = pickle.load(f)
+        if cached.get("version") == _INDEX_VERSION and cached.get("sha1") == sha1:
+            return NameIndex(**cached["index"])
+    except Exception:
+        pass
+
+    try:
+        raw = json.loads(data.decode("utf-8-sig"))
+    except Exception as e:
+        print(f"Alerta: error leyendo {aliases_path}: {e}")
+        return NameIndex({}, {}, {}, {})
+    index = compile_name_index(raw)
+    try:
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        tmp = index_path + ".tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump({"version": _INDEX_VERSION, "sha1": sha1, "index": index._payload()}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, index_path)
+    except Exception as e:
+        print(f"Alerta: no se pudo guardar {index_path}: {e}")
+    return index
+
+
+_name_index = None  # shared process-wide NameIndex for the default aliases file
+
+
+def get_name_index():
+    global _name_index
+    if _name_index is None:
+        _name_index = load_name_index()
+    return _name_index
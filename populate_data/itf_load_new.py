@@ -2,6 +2,7 @@ import json
 import time
 import pandas as pd
 import os
+import sys
 import requests
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -13,6 +14,11 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(BASE_DIR, "..", "data")
 TOURNAMENT_LINK_PREFIX = "/en/tournament/"
 
+sys.path.insert(0, os.path.join(BASE_DIR, ".."))
+
+from itf_tournament_ids import get_tournament_id, record_tournament_ids
+from run_metrics import start_run
+
 def get_week_start_end(today=None):
     if today is None:
         today = datetime.today().date()
@@ -111,17 +117,28 @@ def fetch_itf_ids_to_json(keys_list, driver=None):
     if not keys_list:
         return "[]"
 
+    # Ids already in the registry need no GetEventFilters call.
+    results = []
+    missing = []
+    for key in keys_list:
+        t_id = get_tournament_id(key)
+        if t_id:
+            results.append({"tournamentKey": key, "tournamentId": t_id})
+        else:
+            missing.append(key)
+    if not missing:
+        return json.dumps(results)
+
     owns_driver = driver is None
     if owns_driver:
         driver = create_driver()
 
-    results = []
     try:
         if owns_driver:
             driver.get("https://www.itftennis.com/en/tournament-calendar/womens-world-tennis-tour-calendar/")
             time.sleep(5)
 
-        for key in keys_list:
+        for key in missing:
             api_url = f"https://www.itftennis.com/tennis/api/TournamentApi/GetEventFilters?tournamentKey={key}"
 
             driver.get(api_url)
@@ -142,6 +159,7 @@ def fetch_itf_ids_to_json(keys_list, driver=None):
         if owns_driver:
             driver.quit()
 
+    record_tournament_ids({r["tournamentKey"]: r["tournamentId"] for r in results})
     return json.dumps(results)
 
 def merge_ids_with_pandas(calendar_df, json_ids_string):
@@ -382,6 +400,7 @@ def update_csv_smart(filename, new_data_df, reset_if_not_current_week=False, cur
     final_df.to_csv(file_path, index=False, encoding='utf-8-sig')
 
 if __name__ == "__main__":
+    start_run("itf_load_new.py")
     week_start, week_end = get_week_start_end()
     last_week_start = week_start - timedelta(days=7)
     next_week_start = week_start + timedelta(days=7)
@@ -7,6 +7,7 @@ Incremental update for tournament draw sizes.
 import json
 import time
 import os
+import sys
 import requests
 from datetime import datetime, timedelta
 from selenium import webdriver
@@ -19,6 +20,12 @@ DATA_DIR = os.path.join(BASE_DIR, "..", "data")
 POINTS_DIST_PATH = os.path.join(DATA_DIR, "points_distribution.json")
 OUTPUT_PATH = os.path.join(DATA_DIR, "tournament_draw_sizes.json")
 
+sys.path.insert(0, os.path.join(BASE_DIR, ".."))
+
+from wta_matches_cache import fetch_tournament_matches
+from itf_tournament_ids import get_tournament_id, record_tournament_ids
+from run_metrics import start_run
+
 # ── Shared ─────────────────────────────────────────────────────────────────────
 
 def get_monday(date_str):
@@ -83,11 +90,8 @@ def wta_fetch_tournaments(from_date, to_date):
 
 
 def wta_count_qualifying_players(tournament_id, year):
-    url = f"https://api.wtatennis.com/tennis/tournaments/{tournament_id}/{year}/matches?states=L%2C+C"
     try:
-        r = requests.get(url, headers=WTA_HEADERS, timeout=10)
-        r.raise_for_status()
-        matches = r.json().get("matches", [])
+        matches = fetch_tournament_matches(tournament_id, year, states="L, C", headers=WTA_HEADERS, timeout=10)
     except Exception as e:
         print(f"  Error fetching WTA matches for {tournament_id}/{year}: {e}")
         return 0
@@ -344,8 +348,11 @@ def fetch_itf_updates(from_date, to_date, itf_descs):
                 "isMultiweek": is_multiweek,
             })
 
-        # Fetch tournament IDs
+        # Fetch tournament IDs (registry first, GetEventFilters for new keys only)
         for t in tournaments:
+            t["tournamentId"] = get_tournament_id(t["tournamentKey"])
+            if t["tournamentId"]:
+                continue
             api_url = f"https://www.itftennis.com/tennis/api/TournamentApi/GetEventFilters?tournamentKey={t['tournamentKey']}"
             driver.get(api_url)
             time.sleep(1)
@@ -355,6 +362,7 @@ def fetch_itf_updates(from_date, to_date, itf_descs):
                 t["tournamentId"] = event_data.get("tournamentId")
             except:
                 t["tournamentId"] = None
+        record_tournament_ids({t["tournamentKey"]: t["tournamentId"] for t in tournaments})
 
     except Exception as e:
         print(f"  Error fetching ITF calendar: {e}")
@@ -512,4 +520,5 @@ def main():
 
 
 if __name__ == "__main__":
+    start_run("tournament_sizes_update.py")
     main()
@@ -0,0 +1,17 @@
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from tstrength import build_tstrength_data
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill tstrength_cache.json from a given year through today.")
+    parser.add_argument("from_year", type=int, help="First season to scan (inclusive)")
+    args = parser.parse_args()
+
+    # Safe to re-run after an interruption: progress is replayed from the journal.
+    results = build_tstrength_data(from_year=args.from_year, full_backfill=True)
+    print(f"T-Strength backfill done: {len(results)} entries with players.")
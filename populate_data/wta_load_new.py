@@ -2,11 +2,16 @@ import csv
 import json
 import os
 import re
+import sys
 import time
 import requests
 from datetime import datetime, timedelta
 
-MATCHES_URL = "https://api.wtatennis.com/tennis/tournaments/{tournament_id}/{year}/matches?states=L%2C+C"
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from wta_matches_cache import fetch_tournament_matches
+from run_metrics import start_run
+
 CALENDAR_URL = "https://api.wtatennis.com/tennis/tournaments/?page={page}&pageSize=100&excludeLevels=ITF%2C+Grand%20Slam&from={from_date}&to={to_date}"
 
 HEADERS = {
@@ -198,8 +203,7 @@ def parse_match(m, meta, q_map=None):
 
 
 def fetch_matches(tournament_id, year):
-    url = MATCHES_URL.format(tournament_id=tournament_id, year=year)
-    return fetch_json(url).get("matches", [])
+    return fetch_tournament_matches(tournament_id, year, states="L, C", headers=HEADERS, timeout=None)
 
 
 def fetch_json(url):
@@ -237,6 +241,7 @@ def append_to_csv(new_rows, output_file):
 
 
 if __name__ == "__main__":
+    start_run("wta_load_new.py")
     today = datetime.today().date()
     range_start, range_end = get_week_boundaries(today)
     week_start = today - timedelta(days=today.weekday())
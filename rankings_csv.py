@@ -0,0 +1,281 @@
+"""Week-segmented, append-only access to a weekly rankings CSV.
+
+A decade CSV (`data/wta_rankings_*.csv`) holds one contiguous block of rows per
+week, weeks in ascending order. A sidecar `<csv name>.weeks.json` records the
+byte offset, length, row count and completeness (points and dob filled in) of
+every week block, plus the size, mtime and a hash of the last bytes of the CSV
+it describes. With it:
+
+- a new latest week is appended (single write, fsync, rolled back on error);
+- a corrected or back-filled week only replaces its own block: the rest of the
+  file is byte-copied into a temp file that replaces the CSV, never re-parsed
+  or re-sorted;
+- nothing needs to load the whole CSV to know which weeks exist or are complete.
+
+The sidecar is trusted when the CSV's size and mtime match it; after a fresh
+checkout (new mtime) the size and the hash of the last TAIL_BYTES are checked
+instead. Otherwise it is rebuilt with a byte scan (e.g. the CSV was edited by
+hand or appended to by an older writer).
+"""
+
+import csv
+import hashlib
+import io
+import json
+import os
+import shutil
+
+RANKINGS_CSV_FIELDNAMES = ["week_date", "id", "rank", "points", "player", "country", "dob"]
+
+_INDEX_VERSION = 2
+TAIL_BYTES = 1 << 16
+
+
+def index_path_for(csv_path):
+    return os.path.splitext(csv_path)[0] + ".weeks.json"
+
+
+def _tail_sha1(path, size):
+    """sha1 of the last TAIL_BYTES of the file (the whole file if smaller)."""
+    with open(path, "rb") as f:
+        f.seek(max(0, size - TAIL_BYTES))
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def rows_are_complete(rows):
+    """True if a week's rows have points and dob populated (judged on the first row)."""
+    return bool(rows) and bool(rows[0].get("points")) and bool(rows[0].get("dob"))
+
+
+def _encode_rows(rows, fieldnames):
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=fieldnames, extrasaction="ignore", lineterminator="\r\n")
+    for row in rows:
+        writer.writerow({k: row.get(k, "") for k in fieldnames})
+    return buf.getvalue().encode("utf-8")
+
+
+def _sort_by_rank(rows):
+    try:
+        return sorted(rows, key=lambda r: int(r.get("rank") or 0))
+    except (ValueError, TypeError):
+        return rows
+
+
+class RankingsCsv:
+    """One rankings CSV plus its week sidecar.
+
+    `weeks` maps week -> {"offset", "length", "rows", "complete"} in file order;
+    `in_order` is False when week blocks are out of order or split (the file
+    then needs one full `rewrite()`).
+    """
+
+    def __init__(self, csv_path, fieldnames=RANKINGS_CSV_FIELDNAMES):
+        self.csv_path = csv_path
+        self.index_path = index_path_for(csv_path)
+        self.fieldnames = list(fieldnames)
+        self.header_length = 0
+        self.weeks = {}
+        self.in_order = True
+        self._load_or_scan()
+
+    # -- sidecar ---------------------------------------------------------
+
+    def _load_or_scan(self):
+        if not os.path.exists(self.csv_path):
+            return
+        st = os.stat(self.csv_path)
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                index = json.load(f)
+            if (index.get("version") == _INDEX_VERSION and index.get("size") == st.st_size
+                    and (index.get("mtime_ns") == st.st_mtime_ns
+                         or index.get("tail_sha1") == _tail_sha1(self.csv_path, st.st_size))):
+                self.fieldnames = index["fieldnames"]
+                self.header_length = index["header_length"]
+                self.weeks = index["weeks"]
+                self.in_order = index["in_order"]
+                return
+        except Exception:
+            pass
+        self._scan()
+        self._save_index()
+
+    def _scan(self):
+        """Rebuild the week index from the CSV bytes (lines are only split, not parsed)."""
+        self.weeks, self.in_order = {}, True
+        with open(self.csv_path, "rb") as f:
+            header = f.readline()
+            self.header_length = len(header)
+            if header.strip():
+                self.fieldnames = next(csv.reader([header.decode("utf-8-sig")]))
+            offset = self.header_length
+            current, first_line = None, None
+            for line in f:
+                if not line.strip():
+                    self.in_order = False  # stray blank line: let rewrite() drop it
+                    offset += len(line)
+                    continue
+                week = line.split(b",", 1)[0].decode("utf-8").strip()
+                if week != current:
+                    if current is not None:
+                        self._close_block(current, first_line)
+                        if week < current:
+                            self.in_order = False
+                    if week in self.weeks:
+                        self.in_order = False
+                    block = self.weeks.setdefault(week, {"offset": offset, "length": 0, "rows": 0})
+                    current, first_line = week, line
+                block["length"] += len(line)
+                block["rows"] += 1
+                offset += len(line)
+            if current is not None:
+                self._close_block(current, first_line)
+
+    def _close_block(self, week, first_line):
+        block = self.weeks[week]
+        if "complete" not in block:
+            row = next(csv.DictReader([first_line.decode("utf-8")], fieldnames=self.fieldnames), {})
+            block["complete"] = rows_are_complete([row])
+
+    def _save_index(self):
+        st = os.stat(self.csv_path)
+        index = {
+            "version": _INDEX_VERSION,
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "tail_sha1": _tail_sha1(self.csv_path, st.st_size),
+            "fieldnames": self.fieldnames,
+            "header_length": self.header_length,
+            "in_order": self.in_order,
+            "weeks": self.weeks,
+        }
+        tmp = self.index_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(index, f, separators=(",", ":"))
+        os.replace(tmp, self.index_path)
+
+    # -- reads -----------------------------------------------------------
+
+    def __contains__(self, week):
+        return week in self.weeks
+
+    def latest_week(self):
+        return max(self.weeks) if self.weeks else None
+
+    def incomplete_weeks(self):
+        return sorted(w for w, block in self.weeks.items() if not block.get("complete"))
+
+    def read_week(self, week):
+        """Row dicts of one week, read from its block only."""
+        block = self.weeks.get(week)
+        if not block:
+            return []
+        with open(self.csv_path, "rb") as f:
+            f.seek(block["offset"])
+            data = f.read(block["length"]).decode("utf-8")
+        return list(csv.DictReader(io.StringIO(data), fieldnames=self.fieldnames))
+
+    # -- writes ----------------------------------------------------------
+
+    def _ensure_file(self):
+        if os.path.exists(self.csv_path) and self.header_length:
+            with open(self.csv_path, "rb+") as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\r\n")  # terminate the last row before appending after it
+                    self._scan()
+            return
+        header = (",".join(self.fieldnames) + "\r\n").encode("utf-8")
+        with open(self.csv_path, "wb") as f:
+            f.write(header)
+        self.header_length = len(header)
+        self.weeks, self.in_order = {}, True
+
+    def put_week(self, week, rows):
+        """Store a week's rows (sorted by rank): append, or replace only that week's block.
+
+        Returns "appended", "inserted" or "replaced".
+        """
+        self._ensure_file()
+        if not self.in_order:
+            self.rewrite()
+        payload = _encode_rows(_sort_by_rank(rows), self.fieldnames)
+        block = self.weeks.get(week)
+        later = sorted(w for w in self.weeks if w > week)
+
+        if block is None and not later:
+            self._append(payload)
+            action = "appended"
+            start = os.path.getsize(self.csv_path) - len(payload)
+        else:
+            if block is not None:
+                start, old_length = block["offset"], block["length"]
+            else:
+                start, old_length = self.weeks[later[0]]["offset"], 0
+            self._splice(start, old_length, payload)
+            delta = len(payload) - old_length
+            for w in later:
+                self.weeks[w]["offset"] += delta
+            action = "replaced" if block is not None else "inserted"
+
+        self.weeks[week] = {"offset": start, "length": len(payload), "rows": len(rows),
+                            "complete": rows_are_complete(rows)}
+        self.weeks = dict(sorted(self.weeks.items(), key=lambda kv: kv[1]["offset"]))
+        self._save_index()
+        return action
+
+    def _append(self, payload):
+        size = os.path.getsize(self.csv_path)
+        try:
+            with open(self.csv_path, "ab") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+        except BaseException:
+            # Never leave a half-written week behind.
+            with open(self.csv_path, "r+b") as f:
+                f.truncate(size)
+            raise
+
+    def _splice(self, start, old_length, payload):
+        """Replace bytes [start, start + old_length) with payload; the rest is byte-copied.
+
+        Written to a temp file that replaces the CSV, so an interrupted write
+        (also of the last block) leaves the old CSV in place.
+        """
+        tmp = self.csv_path + ".tmp"
+        try:
+            with open(self.csv_path, "rb") as src, open(tmp, "wb") as dst:
+                remaining = start
+                while remaining > 0:
+                    chunk = src.read(min(remaining, 1 << 20))
+                    if not chunk:
+                        break
+                    dst.write(chunk)
+                    remaining -= len(chunk)
+                dst.write(payload)
+                src.seek(start + old_length)
+                shutil.copyfileobj(src, dst, 1 << 20)
+                dst.flush()
+                os.fsync(dst.fileno())
+            os.replace(tmp, self.csv_path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def rewrite(self):
+        """Full rewrite sorted by (week_date, rank); only needed when `in_order` is False."""
+        by_week = {}
+        with open(self.csv_path, encoding="utf-8-sig", newline="") as f:
+            for row in csv.DictReader(f):
+                by_week.setdefault(row["week_date"], []).append(row)
+        tmp = self.csv_path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write((",".join(self.fieldnames) + "\r\n").encode("utf-8"))
+            for week in sorted(by_week):
+                f.write(_encode_rows(_sort_by_rank(by_week[week]), self.fieldnames))
+        os.replace(tmp, self.csv_path)
+        self._scan()
+        self._save_index()
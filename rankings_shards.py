@@ -0,0 +1,100 @@
+"""Per-week rankings shards for the site's rankings tab.
+
+Each ranking week is written as `data/rankings_weeks/<week>.<hash>.json`, a
+column-oriented object with short keys (values of one kind stay adjacent,
+which compresses well):
+
+  {"w": week, "r": [rank...], "p": [points...], "n": [name...], "c": [country...], "d": [dob...]}
+
+The page gets a manifest (week -> hash) through the `rankings` tab payload and
+downloads only the week the user picks. Shards are regenerated only for weeks
+whose CSV block changed since the last build: the rankings store keeps a content
+hash of every week over all its columns (`week_digest`, read from the store
+meta without touching the rows), tracked per week in `build_state.json`. Weeks
+added during the run (no stored hash) are rebuilt and only rewritten when their
+shard hash changed.
+"""
+
+import glob
+import hashlib
+import json
+import os
+
+from config import DATA_DIR
+from wta import get_wta_rankings
+
+SHARDS_DIR = os.path.join(DATA_DIR, "rankings_weeks")
+SHARDS_STATE_FILE = os.path.join(SHARDS_DIR, "build_state.json")
+SHARDS_URL_PREFIX = "data/rankings_weeks/"
+
+_STATE_VERSION = 1
+
+
+def shard_payload(week, players):
+    """Columnar shard body for one week of player dicts (as returned by WtaRankings.get)."""
+    return {
+        "w": week,
+        "r": [p.get("Rank") for p in players],
+        "p": [p.get("Points") or 0 for p in players],
+        "n": [p.get("OfficialPlayer") or p.get("Player") or "" for p in players],
+        "c": [p.get("Country") or "" for p in players],
+        "d": [(p.get("DOB") or "").split("T")[0] for p in players],
+    }
+
+
+def _load_state():
+    try:
+        with open(SHARDS_STATE_FILE, encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("version") == _STATE_VERSION:
+            return state
+    except Exception:
+        pass
+    return {"version": _STATE_VERSION, "weeks": {}}
+
+
+def _shard_path(week, digest):
+    return os.path.join(SHARDS_DIR, f"{week}.{digest}.json")
+
+
+def write_rankings_shards():
+    """Bring data/rankings_weeks/ up to date. Returns the manifest {week: hash}, ascending by week."""
+    rankings = get_wta_rankings()
+    os.makedirs(SHARDS_DIR, exist_ok=True)
+    previous = _load_state()["weeks"]
+    weeks_state = {}
+    written = 0
+
+    for week in rankings.weeks():
+        version = rankings.week_version(week)
+        old = previous.get(week)
+        if version and old and old.get("version") == version and os.path.exists(_shard_path(week, old["hash"])):
+            weeks_state[week] = old
+            continue
+        players = rankings.get(week) or []
+        if not players:
+            continue
+        body = json.dumps(shard_payload(week, players), ensure_ascii=False, separators=(",", ":"))
+        digest = hashlib.sha1(body.encode("utf-8")).hexdigest()[:10]
+        path = _shard_path(week, digest)
+        if not os.path.exists(path):
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(body)
+            written += 1
+        weeks_state[week] = {"version": version, "hash": digest}
+
+    keep = {os.path.basename(_shard_path(w, s["hash"])) for w, s in weeks_state.items()}
+    removed = 0
+    for path in glob.glob(os.path.join(SHARDS_DIR, "*-*-*.*.json")):
+        if os.path.basename(path) not in keep:
+            os.remove(path)
+            removed += 1
+
+    tmp = SHARDS_STATE_FILE + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"version": _STATE_VERSION, "weeks": weeks_state}, f, separators=(",", ":"))
+    os.replace(tmp, SHARDS_STATE_FILE)
+
+    if written or removed:
+        print(f"Rankings shards: {written} written, {removed} removed ({len(weeks_state)} weeks)")
+    return {week: s["hash"] for week, s in weeks_state.items()}
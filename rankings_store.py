@@ -0,0 +1,286 @@
+"""Columnar, memory-mapped store for the weekly WTA rankings CSVs.
+
+Every decade CSV (`data/wta_rankings_*.csv`) gets a directory under
+`.cache/rankings_store/` (RANKINGS_STORE_DIR; not committed, the workflow keeps
+it via actions/cache and it can always be rebuilt from the CSV) holding:
+
+  meta.json     source fingerprint, CSV header, weeks, the week -> row-range index
+                and a content hash of every week (all columns)
+  players.json  interned [id, player, country, dob] tuples
+  player.npy    int32 index into players.json, one entry per ranking row
+  rank.npy      int32 rank (-1 when the CSV has none)
+  points.npy    int32 points
+
+Rows are grouped by week, so a single week is one contiguous slice of the
+memory-mapped columns. When the CSV only grew (same bytes up to the previous
+size, e.g. `load_weekly_ranking.py` appended a week), only the new tail is
+parsed and appended; any other change triggers a full rebuild.
+"""
+
+import csv
+import hashlib
+import json
+import os
+from collections.abc import MutableMapping
+
+import numpy as np
+
+from config import RANKINGS_STORE_DIR
+
+_STORE_VERSION = 2
+_NO_RANK = -1
+_COLUMNS = ("player", "rank", "points")
+
+
+def store_dir_for(csv_path):
+    """Store directory of a CSV; the CSV's directory is part of the name, so copies of
+    a CSV elsewhere (e.g. the run report's pre-run snapshot) get their own store."""
+    stem = os.path.splitext(os.path.basename(csv_path))[0]
+    source_dir = hashlib.sha1(os.path.dirname(os.path.abspath(csv_path)).encode("utf-8")).hexdigest()[:8]
+    return os.path.join(RANKINGS_STORE_DIR, f"{stem}-{source_dir}")
+
+
+def _prefix_sha1(path, size):
+    h = hashlib.sha1()
+    remaining = size
+    with open(path, "rb") as f:
+        while remaining > 0:
+            chunk = f.read(min(remaining, 1 << 20))
+            if not chunk:
+                break
+            h.update(chunk)
+            remaining -= len(chunk)
+    return h.hexdigest()
+
+
+def _to_int(value, default):
+    try:
+        return int(str(value).strip())
+    except (TypeError, ValueError):
+        return default
+
+
+def _normalize_row(row):
+    """Return (week, (id, player, country, dob), rank, points) for a CSV row dict."""
+    week = (row.get("week_date") or "").strip()
+    pid = (row.get("id") or row.get("player_id") or row.get("playerId") or "").strip()
+    player_key = (
+        pid,
+        row.get("player") or "",
+        row.get("country") or "",
+        row.get("dob") or "",
+    )
+    rank = _to_int(row.get("rank"), _NO_RANK) if row.get("rank") else _NO_RANK
+    points = _to_int(row.get("points"), 0) if row.get("points") else 0
+    return week, player_key, rank, points
+
+
+def _group_by_week(reader):
+    by_week = {}
+    for row in reader:
+        week, player_key, rank, points = _normalize_row(row)
+        if not week:
+            continue
+        by_week.setdefault(week, []).append((player_key, rank, points))
+    return by_week
+
+
+def _load_meta(store_dir):
+    try:
+        with open(os.path.join(store_dir, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        return meta if meta.get("version") == _STORE_VERSION else None
+    except Exception:
+        return None
+
+
+def _write_store(store_dir, meta, players, columns):
+    os.makedirs(store_dir, exist_ok=True)
+    for name in _COLUMNS:
+        tmp = os.path.join(store_dir, f"{name}.npy.tmp")
+        with open(tmp, "wb") as f:
+            np.save(f, np.asarray(columns[name], dtype=np.int32))
+        os.replace(tmp, os.path.join(store_dir, f"{name}.npy"))
+    for fname, payload in (("players.json", players), ("meta.json", meta)):
+        tmp = os.path.join(store_dir, fname + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, os.path.join(store_dir, fname))
+
+
+def _week_sha1(rows):
+    """Content hash of one week's rows, over every column the store keeps."""
+    h = hashlib.sha1()
+    for player_key, rank, points in rows:
+        h.update("\x1f".join((*player_key, str(rank), str(points))).encode("utf-8") + b"\n")
+    return h.hexdigest()
+
+
+def _append_weeks(by_week, players, player_ids, columns, weeks, week_starts, week_sha1):
+    for week in sorted(by_week):
+        weeks.append(week)
+        week_sha1[week] = _week_sha1(by_week[week])
+        for player_key, rank, points in by_week[week]:
+            idx = player_ids.get(player_key)
+            if idx is None:
+                idx = player_ids[player_key] = len(players)
+                players.append(list(player_key))
+            columns["player"].append(idx)
+            columns["rank"].append(rank)
+            columns["points"].append(points)
+        week_starts.append(len(columns["player"]))
+
+
+def _rebuild(csv_path, store_dir, source_size):
+    with open(csv_path, encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        by_week = _group_by_week(reader)
+        fieldnames = reader.fieldnames or []
+    players, columns, weeks, week_starts, week_sha1 = [], {c: [] for c in _COLUMNS}, [], [0], {}
+    _append_weeks(by_week, players, {}, columns, weeks, week_starts, week_sha1)
+    meta = {
+        "version": _STORE_VERSION,
+        "source_size": source_size,
+        "source_sha1": _prefix_sha1(csv_path, source_size),
+        "fieldnames": fieldnames,
+        "weeks": weeks,
+        "week_starts": week_starts,
+        "week_sha1": week_sha1,
+    }
+    _write_store(store_dir, meta, players, columns)
+
+
+def _append_tail(csv_path, store_dir, meta, source_size):
+    """Parse only the bytes appended since the last build. Returns False if a rebuild is needed."""
+    with open(csv_path, "rb") as f:
+        f.seek(meta["source_size"])
+        tail = f.read(source_size - meta["source_size"]).decode("utf-8")
+    by_week = _group_by_week(csv.DictReader(tail.splitlines(), fieldnames=meta["fieldnames"]))
+    existing_weeks = set(meta["weeks"])
+    if any(w in existing_weeks for w in by_week):
+        return False  # appended rows extend an existing week: week slices must be rebuilt
+
+    with open(os.path.join(store_dir, "players.json"), encoding="utf-8") as f:
+        players = json.load(f)
+    player_ids = {tuple(p): i for i, p in enumerate(players)}
+    columns = {c: np.load(os.path.join(store_dir, f"{c}.npy")).tolist() for c in _COLUMNS}
+    weeks, week_starts, week_sha1 = list(meta["weeks"]), list(meta["week_starts"]), dict(meta["week_sha1"])
+    _append_weeks(by_week, players, player_ids, columns, weeks, week_starts, week_sha1)
+
+    new_meta = dict(meta, weeks=weeks, week_starts=week_starts, week_sha1=week_sha1, source_size=source_size,
+                    source_sha1=_prefix_sha1(csv_path, source_size))
+    _write_store(store_dir, new_meta, players, columns)
+    return True
+
+
+def update_store(csv_path):
+    """Bring the store for csv_path up to date. Returns the store directory, or None without a CSV."""
+    if not os.path.exists(csv_path):
+        return None
+    store_dir = store_dir_for(csv_path)
+    source_size = os.path.getsize(csv_path)
+    meta = _load_meta(store_dir)
+    if meta and meta.get("source_size") == source_size:
+        if meta.get("source_sha1") == _prefix_sha1(csv_path, source_size):
+            return store_dir
+    elif meta and meta.get("source_size", 0) < source_size:
+        if meta.get("source_sha1") == _prefix_sha1(csv_path, meta["source_size"]):
+            if _append_tail(csv_path, store_dir, meta, source_size):
+                return store_dir
+    _rebuild(csv_path, store_dir, source_size)
+    return store_dir
+
+
+class RankingsStore:
+    """Read-only view of one store; columns are memory-mapped, weeks are sliced on demand."""
+
+    def __init__(self, store_dir):
+        with open(os.path.join(store_dir, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(os.path.join(store_dir, "players.json"), encoding="utf-8") as f:
+            self.players = [tuple(p) for p in json.load(f)]
+        self.weeks = meta["weeks"]
+        starts = meta["week_starts"]
+        self._ranges = {w: (starts[i], starts[i + 1]) for i, w in enumerate(self.weeks)}
+        self._week_sha1 = meta["week_sha1"]
+        self._columns = {c: np.load(os.path.join(store_dir, f"{c}.npy"), mmap_mode="r") for c in _COLUMNS}
+
+    def __contains__(self, week):
+        return week in self._ranges
+
+    def week_rows(self, week):
+        """Rows of a week as (id, player, country, dob, rank or None, points) tuples, in CSV order."""
+        lo, hi = self._ranges[week]
+        player_idx = self._columns["player"][lo:hi].tolist()
+        ranks = self._columns["rank"][lo:hi].tolist()
+        points = self._columns["points"][lo:hi].tolist()
+        players = self.players
+        return [
+            (*players[pi], (rk if rk != _NO_RANK else None), pts)
+            for pi, rk, pts in zip(player_idx, ranks, points)
+        ]
+
+    def week_digest(self, week):
+        """Content fingerprint of a week over every column (id, player, country, dob,
+        rank, points), computed when the week was stored; stable across store rebuilds."""
+        return self._week_sha1[week]
+
+
+def open_store(csv_path):
+    """Update (if needed) and open the store for csv_path; None when the CSV does not exist."""
+    store_dir = update_store(csv_path)
+    return RankingsStore(store_dir) if store_dir else None
+
+
+class LazyWeekMapping(MutableMapping):
+    """week -> value mapping over one or more stores, built per week on first access.
+
+    Stores are given in priority order: a week present in several stores is read
+    from the first one. row_factory turns a store's week_rows() into the value.
+    Assigned weeks (e.g. freshly fetched from the API) are kept in memory only.
+    """
+
+    def __init__(self, stores, row_factory):
+        self._row_factory = row_factory
+        self._source = {}
+        for store in stores:
+            for week in store.weeks:
+                self._source.setdefault(week, store)
+        self._values = {}
+        self._assigned = set()
+
+    def __getitem__(self, week):
+        if week not in self._values:
+            store = self._source[week]
+            self._values[week] = self._row_factory(store.week_rows(week))
+        return self._values[week]
+
+    def week_version(self, week):
+        """Fingerprint of a store-backed week, or None for weeks assigned in memory."""
+        store = self._source.get(week)
+        if store is None or week in self._assigned:
+            return None
+        return store.week_digest(week)
+
+    def __setitem__(self, week, value):
+        self._values[week] = value
+        self._assigned.add(week)
+
+    def __delitem__(self, week):
+        found = self._source.pop(week, None) is not None
+        found = self._values.pop(week, None) is not None or found
+        self._assigned.discard(week)
+        if not found:
+            raise KeyError(week)
+
+    def __contains__(self, week):
+        return week in self._source or week in self._values
+
+    def __iter__(self):
+        yield from self._source
+        for week in self._values:
+            if week not in self._source:
+                yield week
+
+    def __len__(self):
+        return len(self._source) + sum(1 for w in self._values if w not in self._source)
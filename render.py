@@ -0,0 +1,171 @@
+"""Fragment templates and timed section builders for the generated pages.
+
+Templates live in `templates/` and know two constructs:
+
+  {{ name }}                   replaced with str(context["name"])
+  {% include "app/x.html" %}   on a line of its own, replaced by that file
+
+Everything else is literal text, so the page's CSS/JS is stored as-is (no
+doubled braces). A template is read, its includes resolved and its text split
+into literal/slot parts once per process; a fragment without slots renders to
+its cached text. Rendering is a single join over the parts, so its cost is
+linear in the size of the page.
+
+Section builders (the dynamic HTML of each tab) run through `timed_section`,
+which records their wall time in `RENDER_TIMINGS`, or through a `SectionCache`,
+which first fingerprints the section's inputs and reuses the fragment rendered
+by an earlier run when nothing changed.
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from functools import lru_cache
+
+from config import RENDER_CACHE_FILE
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), "templates")
+
+_SLOT_RE = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+_INCLUDE_RE = re.compile(r'^[ \t]*\{%\s*include\s+"([^"]+)"\s*%\}[ \t]*(?:\n|$)', re.M)
+
+# Section name -> milliseconds spent building it in the last generate_html run.
+RENDER_TIMINGS = {}
+# Sections of the last run that were reused from the section cache.
+CACHED_SECTIONS = set()
+
+_CACHE_VERSION = 1
+
+
+class Template:
+    """A template split into literal text (even indices) and slot names (odd indices)."""
+
+    def __init__(self, text, name="<string>"):
+        self.name = name
+        self._parts = _SLOT_RE.split(text)
+        self.slots = frozenset(self._parts[1::2])
+
+    @property
+    def is_static(self):
+        return not self.slots
+
+    def render(self, context=None, **values):
+        if self.is_static:
+            return self._parts[0]
+        if context:
+            values = {**context, **values}
+        missing = self.slots - values.keys()
+        if missing:
+            raise KeyError(f"{self.name}: no value for {', '.join(sorted(missing))}")
+        return "".join(part if i % 2 == 0 else str(values[part]) for i, part in enumerate(self._parts))
+
+
+@lru_cache(maxsize=None)
+def _source(name):
+    path = os.path.join(TEMPLATES_DIR, name)
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    return _INCLUDE_RE.sub(lambda m: _source(m.group(1)), text)
+
+
+@lru_cache(maxsize=None)
+def load_template(name):
+    """Compiled template `name` (path relative to templates/), cached for the process."""
+    return Template(_source(name), name)
+
+
+def render_template(name, context=None, **values):
+    return load_template(name).render(context, **values)
+
+
+def timed_section(name, build, *args, **kwargs):
+    """Run one section builder and record how long it took in RENDER_TIMINGS."""
+    start = time.perf_counter()
+    result = build(*args, **kwargs)
+    RENDER_TIMINGS[name] = round((time.perf_counter() - start) * 1000, 1)
+    return result
+
+
+def fingerprint(*inputs):
+    """sha1 of JSON-serialisable inputs (dict key order does not matter)."""
+    body = json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str, separators=(",", ":"))
+    return hashlib.sha1(body.encode("utf-8")).hexdigest()
+
+
+def file_fingerprint(path):
+    """sha1 of a file's bytes ("" if it does not exist), for sections built from files."""
+    h = hashlib.sha1()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+    except OSError:
+        return ""
+    return h.hexdigest()
+
+
+class SectionCache:
+    """Rendered sections of the previous run, keyed by section name.
+
+    Each entry keeps the fingerprint of the inputs it was built from; `section()`
+    rebuilds only when that fingerprint changed. `code_files` (the modules that
+    build the sections) are part of every fingerprint, so editing them
+    invalidates the whole cache.
+    """
+
+    def __init__(self, code_files, path=RENDER_CACHE_FILE):
+        self.path = path
+        self.code = fingerprint(*(file_fingerprint(p) for p in code_files))
+        self.sections = {}
+        self.dirty = False
+        try:
+            with open(path, encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("version") == _CACHE_VERSION and state.get("code") == self.code:
+                self.sections = state["sections"]
+        except Exception:
+            pass
+
+    def section(self, name, build, *args, inputs=None):
+        """Result of `build(*args)`, reused if `inputs` (default: args) match the cached run.
+
+        Results must be JSON values (tuples come back as lists).
+        """
+        start = time.perf_counter()
+        key = fingerprint(args if inputs is None else inputs)
+        cached = self.sections.get(name)
+        if cached and cached["fp"] == key:
+            RENDER_TIMINGS[name] = round((time.perf_counter() - start) * 1000, 1)
+            CACHED_SECTIONS.add(name)
+            return cached["value"]
+        value = timed_section(name, build, *args)
+        self.sections[name] = {"fp": key, "value": value}
+        self.dirty = True
+        return value
+
+    def save(self):
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": _CACHE_VERSION, "code": self.code, "sections": self.sections},
+                      f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+
+def reset_render_timings():
+    RENDER_TIMINGS.clear()
+    CACHED_SECTIONS.clear()
+
+
+def print_render_timings():
+    if not RENDER_TIMINGS:
+        return
+    total = sum(RENDER_TIMINGS.values())
+    slowest = sorted(RENDER_TIMINGS.items(), key=lambda kv: kv[1], reverse=True)
+    print(f"Render timings ({total:.0f} ms, {len(CACHED_SECTIONS)} cached): " + ", ".join(
+        f"{name} {ms:.0f}ms{' (cached)' if name in CACHED_SECTIONS else ''}" for name, ms in slowest))
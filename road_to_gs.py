@@ -0,0 +1,408 @@
+"""Road to GS points ledger, computed once per run for the Points Breakdown tab.
+
+For every player in the tab's selector this replays the rules the page used to
+apply in the browser over the whole match history:
+
+- the last 52 weeks of results grouped per tournament (best main-draw and
+  qualifying round), turned into points with data/points_distribution.json and
+  the draw sizes in data/tournament_draw_sizes.json;
+- the drop date of each result (53 weeks, 54 for two-week events and the
+  tournaments played during their freeze);
+- the countable best-18 (Grand Slams, best 6 mandatory and best 1 optional WTA
+  1000s, filled up with the best remaining results);
+- the best-18 total accumulated at each Grand Slam's Q and MD entry cutoff.
+
+Each player's ledger is written to `data/roadtogs_players/<hash>.json`; the
+`roadtogs` tab payload only carries the {PLAYER NAME: hash} index, so selecting
+a player downloads a few hundred bytes instead of the full match history.
+"""
+
+import os
+import re
+from datetime import date, timedelta
+
+from config import DATA_DIR, NAME_LOOKUP
+from utils import write_hashed_json_files
+from week_index import monday_of, shift_week
+
+ROADTOGS_DIR = os.path.join(DATA_DIR, "roadtogs_players")
+ROADTOGS_URL_PREFIX = "data/roadtogs_players/"
+
+ROUND_ORDER = {
+    "QR1": 1, "QR2": 2, "QR3": 3, "QR4": 4, "Round Robin": 4.5,
+    "1st Round": 5, "2nd Round": 6, "3rd Round": 7, "4th Round": 8, "5th Round": 9,
+    "Quarter Finals": 10, "Quarter-finals": 10, "Semi-finals": 11, "Final": 12,
+}
+
+# Points distribution description per category when the actual draw size is unknown
+# (uses the smaller main draw of each category).
+CATEGORY_TO_DESC = {
+    "GS": "Grand Slam", "WTA 1000": "WTA 1000 (56M, 32Q)", "WTA 500": "WTA 500 (30/28M, 24/16Q)",
+    "WTA 250": "WTA 250 (32M, 24/16Q)", "WTA 125": "WTA 125 (32M, 8Q)",
+    "125K": "WTA 125 (32M, 8Q)", "125K Series": "WTA 125 (32M, 8Q)",
+    "W100": "W100 (32M, 32Q)", "W75": "W75 (32M, 32Q)", "W50": "W50 (32M, 32Q)",
+    "W35": "W35 (32M, 64/48/32/24Q)", "W15": "W15 (32M, 64/48/32/24Q)",
+}
+CATEGORY_DRAW_SIZE = {
+    "GS": 128, "WTA 1000": 64, "WTA 500": 32, "WTA 250": 32, "WTA 125": 32, "125K": 32,
+    "125K Series": 32, "W100": 32, "W75": 32, "W50": 32, "W35": 32, "W15": 32,
+}
+
+ITF_POINTS_CATEGORIES = ["W100", "W75", "W60", "W50", "W35", "W25", "W15"]
+ITF_CATEGORIES = ["W100", "W75", "W60", "W50", "W40", "W35", "W25", "W15", "W10", "W80"]
+WTA_CATEGORIES = ["WTA 1000", "WTA 500", "WTA 250", "WTA 125", "125K", "125K Series"]
+DELAYED_CATEGORIES = ("W15", "W35")  # points go live one week after the tournament
+
+MANDATORY_1000_NAMES = ["Indian Wells", "Miami", "Madrid", "Rome", "Toronto", "Montreal", "Cincinnati", "Beijing"]
+OPTIONAL_1000_NAMES = ["Doha", "Dubai", "Wuhan"]
+# 2-week tournaments that freeze rankings for 2 consecutive weeks
+TWO_WEEK_NAMES = ["Australian Open", "Roland Garros", "Wimbledon", "US Open", "Indian Wells", "Miami",
+                  "Madrid", "Internazionali", "Rome"]
+
+COUNTABLE_RESULTS = 18
+# Entry points a player needs at the cutoff, subtracted to get the "Est. Need" column.
+GS_ENTRY_POINTS = {"q": 330, "md": 780}
+
+_NEXT_ROUND = {
+    32: {"1st Round": "2nd Round", "2nd Round": "Quarter-finals", "Quarter-finals": "Semi-finals",
+         "Semi-finals": "Final"},
+    64: {"1st Round": "2nd Round", "2nd Round": "3rd Round", "3rd Round": "Quarter-finals",
+         "Quarter-finals": "Semi-finals", "Semi-finals": "Final"},
+    128: {"1st Round": "2nd Round", "2nd Round": "3rd Round", "3rd Round": "4th Round",
+          "4th Round": "Quarter-finals", "Quarter-finals": "Semi-finals", "Semi-finals": "Final"},
+}
+_ROUND_KEYS = {
+    128: {"4th Round": "R16", "3rd Round": "R32", "2nd Round": "R64", "1st Round": "R128"},
+    64: {"3rd Round": "R16", "2nd Round": "R32", "1st Round": "R64"},
+    32: {"2nd Round": "R16", "1st Round": "R32"},
+}
+_ROUND_ABBREVIATIONS = [
+    ("WINNER", "W"), ("Final", "F"), ("Semi-finals", "SF"), ("Quarter-finals", "QF"),
+    ("4th Round", "4th"), ("3rd Round", "3rd"), ("2nd Round", "2nd"), ("1st Round", "1st"),
+]
+_WEEK_SUFFIX_RE = re.compile(r"^(.+?)\s*\(Week \d+\)$")
+_LEADING_INT_RE = re.compile(r"\s*([+-]?\d+)")
+
+
+def _next_round_map(draw_size):
+    return _NEXT_ROUND[128] if draw_size >= 128 else (_NEXT_ROUND[64] if draw_size >= 64 else _NEXT_ROUND[32])
+
+
+def main_draw_point_key(round_name, result, draw_size):
+    """Points column for a main-draw result; a win means the next round is guaranteed."""
+    if round_name == "Final":
+        return "W" if result == "W" else "F"
+    if result == "W":
+        nxt = _next_round_map(draw_size).get(round_name)
+        if nxt:
+            return main_draw_point_key(nxt, "L", draw_size)
+    if round_name == "Semi-finals":
+        return "SF"
+    if round_name == "Quarter-finals":
+        return "QF"
+    return _ROUND_KEYS.get(draw_size, _ROUND_KEYS[32]).get(round_name)
+
+
+def qual_point_key(round_name, result, has_main_draw):
+    return "QLFR" if has_main_draw or result == "W" else round_name
+
+
+def abbrev_round(round_name):
+    for old, new in _ROUND_ABBREVIATIONS:
+        round_name = round_name.replace(old, new, 1)
+    return round_name
+
+
+def _normalize_tournament_id(value):
+    # Same as the site's String(parseInt(id) || id): strip leading zeros.
+    m = _LEADING_INT_RE.match(value or "")
+    return str(int(m.group(1))) if m and int(m.group(1)) else value
+
+
+def _player_key(name):
+    name_upper = str(name or "").strip().upper()
+    return NAME_LOOKUP.get(name_upper, name_upper)
+
+
+def _parse_date(value):
+    try:
+        return date.fromisoformat(str(value or "")[:10])
+    except ValueError:
+        return None
+
+
+class PointsRules:
+    """Lookup tables shared by every player's ledger."""
+
+    def __init__(self, points_distribution, itf_draw_sizes, wta_draw_sizes, history_rows):
+        self.points = {p.get("Description"): p for p in points_distribution}
+        self.itf_draws = {}
+        for t in itf_draw_sizes:
+            info = {"description": t.get("description"), "mainDrawSize": t.get("mainDrawSize") or 0}
+            name, day = t.get("tournamentName") or "", t.get("date") or ""
+            self.itf_draws[f"{name}|{day}"] = info
+            m = _WEEK_SUFFIX_RE.match(name)
+            if m:
+                self.itf_draws[f"{m.group(1).strip()}|{day}"] = info
+        self.wta_draws = {}
+        for t in wta_draw_sizes:
+            if not t.get("description") or not t.get("tournamentId"):
+                continue
+            self.wta_draws[_normalize_tournament_id(str(t["tournamentId"]))] = {
+                "description": t["description"], "mainDrawSize": t.get("mainDrawSize") or 0,
+            }
+        self.freeze_mondays = self._freeze_mondays(history_rows)
+
+    @staticmethod
+    def _freeze_mondays(history_rows):
+        """Main-draw Mondays (and the following week) of genuine 2-week events (GS + WTA 1000)."""
+        mondays = set()
+        for r in history_rows:
+            category = (r.get("CATEGORY") or "").strip()
+            is_two_week = ((r.get("MATCH_TYPE") or "").strip() == "GS"
+                           or category in ("WTA 1000", "Premier Mandatory", "Premier 5"))
+            if not is_two_week or (r.get("DRAW") or "").upper() != "M":
+                continue
+            name = r.get("TOURNAMENT") or ""
+            if any(n in name for n in TWO_WEEK_NAMES):
+                monday = monday_of(r.get("DATE"))
+                if monday:
+                    mondays.add(monday)
+                    mondays.add(shift_week(monday, 1))
+        return mondays
+
+    def draw_info(self, t):
+        """(points table description, main draw size) for a grouped tournament."""
+        category = t["category"]
+        if category in ITF_POINTS_CATEGORIES:
+            info = self.itf_draws.get(f"{t['tournament']}|{t['date']}")
+            if info:
+                return info["description"], 64 if info["mainDrawSize"] > 32 else 32
+        elif category in WTA_CATEGORIES and t["tournamentId"]:
+            info = self.wta_draws.get(_normalize_tournament_id(t["tournamentId"]))
+            if info:
+                size = info["mainDrawSize"]
+                return info["description"], 128 if size > 64 else (64 if size > 32 else 32)
+        return CATEGORY_TO_DESC.get(category, ""), CATEGORY_DRAW_SIZE.get(category, 32)
+
+    def effective_monday(self, t):
+        monday = _parse_date(t["date"])
+        return monday + timedelta(weeks=1) if t["category"] in DELAYED_CATEGORIES else monday
+
+    def drop_date(self, t):
+        effective = self.effective_monday(t)
+        is_two_week = t["isGS"] or (t["category"] not in ITF_CATEGORIES
+                                    and any(n in t["tournament"] for n in TWO_WEEK_NAMES))
+        if is_two_week:
+            return effective + timedelta(weeks=54)
+        if effective.isoformat() in self.freeze_mondays:
+            # Concurrent with a 2-week freeze: share the drop date of that event's first week.
+            previous = effective - timedelta(weeks=1)
+            week1 = previous if previous.isoformat() in self.freeze_mondays else effective
+            return week1 + timedelta(weeks=54)
+        return effective + timedelta(weeks=53)
+
+
+def group_tournaments(player_rows, player_key):
+    """One entry per tournament edition with the player's best main-draw and qualifying rounds."""
+    groups = {}
+    for row in player_rows:
+        name = row.get("TOURNAMENT") or ""
+        day = row.get("DATE") or ""
+        match_type = (row.get("MATCH_TYPE") or "").strip()
+        is_gs = match_type == "GS"
+        is_united_cup = "UNITED CUP" in name.upper()
+        monday = monday_of(day)
+        round_name = row.get("ROUND") or ""
+        order = ROUND_ORDER.get(round_name, 0)
+        result = "W" if _player_key(row.get("_winnerName")) == player_key else "L"
+        tournament_id = (row.get("TOURNAMENT_ID") or "").strip()
+        # Group by tournament id + year so different annual editions stay separate
+        if is_gs or is_united_cup:
+            key = f"{match_type}|{name}"
+        else:
+            key = f"{tournament_id}|{day[:4]}|{name}" if tournament_id else f"{monday}|{name}"
+
+        t = groups.get(key)
+        if t is None:
+            t = groups[key] = {
+                "date": monday, "tournament": name, "tournamentId": tournament_id,
+                "category": (row.get("CATEGORY") or "").strip(), "isGS": is_gs, "isUnitedCup": is_united_cup,
+                "bestMainRound": "", "bestMainOrder": 0, "bestMainResult": "",
+                "bestQualRound": "", "bestQualOrder": 0, "bestQualResult": "",
+                "qualMonday": "", "mainMonday": "", "ucWins": 0, "ucTotal": 0, "ucHasKnockout": False,
+            }
+        if is_united_cup:
+            t["ucTotal"] += 1
+            if result == "W":
+                t["ucWins"] += 1
+                if round_name != "Round Robin":
+                    t["ucHasKnockout"] = True
+        prefix = "Qual" if (row.get("DRAW") or "").upper() == "Q" else "Main"
+        if order > t[f"best{prefix}Order"]:
+            t[f"best{prefix}Round"], t[f"best{prefix}Order"], t[f"best{prefix}Result"] = round_name, order, result
+        week_field = "qualMonday" if prefix == "Qual" else "mainMonday"
+        if not t[week_field] or monday < t[week_field]:
+            t[week_field] = monday
+
+    for t in groups.values():
+        if t["mainMonday"]:
+            t["date"] = t["mainMonday"]  # main-draw week for multi-week tournaments
+        elif t["isGS"] and t["qualMonday"]:
+            t["date"] = shift_week(t["qualMonday"], 1)
+    return [t for t in groups.values() if t["date"]]
+
+
+def tournament_points(t, rules):
+    """Points of one grouped tournament and the round label shown in the table."""
+    if t["isUnitedCup"]:
+        table = rules.points.get("United Cup")
+        label = f"{t['ucWins']}W-{t['ucTotal'] - t['ucWins']}L"
+        if not table:
+            return 0, label
+        wins, knockout = t["ucWins"], t["ucHasKnockout"]
+        if wins >= 5:
+            column = "5W"
+        elif wins in (3, 4):
+            column = f"{wins}W"
+        elif wins in (1, 2):
+            column = f"{wins}W_KO" if knockout else f"{wins}W_RR"
+        else:
+            column = "0W"
+        return table.get(column) or 0, label
+
+    main_round, main_result = t["bestMainRound"], t["bestMainResult"]
+    qual_round = t["bestQualRound"]
+    qualified = bool(qual_round) and t["bestQualResult"] == "W"
+    lucky_loser = bool(qual_round) and t["bestQualResult"] == "L" and bool(main_round)
+    desc, draw_size = rules.draw_info(t)
+
+    qual_display = "QLFR" if qualified else qual_round
+    main_display = "WINNER" if main_round == "Final" and main_result == "W" else main_round
+    if main_result == "W" and main_round and main_round != "Final":
+        # Still in the draw: the next round is guaranteed
+        main_display = _next_round_map(draw_size).get(main_round, main_display)
+    if main_round and qual_round:
+        label = f"{abbrev_round(main_display)} + {qual_display}"
+    else:
+        label = abbrev_round(main_display or qual_display or "")
+
+    table = rules.points.get(desc)
+    points = 0
+    if table:
+        if main_round:
+            # Qualifiers and lucky losers who lost their 1st round only keep qualifying points
+            first_round_loss = main_round == "1st Round" and main_result == "L"
+            if not ((qualified or lucky_loser) and first_round_loss):
+                key = main_draw_point_key(main_round, main_result, draw_size)
+                if key and table.get(key) is not None:
+                    points += table[key]
+        if qual_round:
+            key = qual_round if lucky_loser else qual_point_key(qual_round, t["bestQualResult"], bool(main_round))
+            if key and table.get(key) is not None:
+                points += table[key]
+    return points, label
+
+
+def split_countable(tournaments):
+    """(countable, non-countable) per the best-18 rules, each tier sorted by points."""
+    by_points = lambda t: -t["points"]
+    mandatory_gs, mandatory_1000, optional_1000, rest = [], [], [], []
+    for t in tournaments:
+        has_main = bool(t["bestMainRound"])
+        name = t["tournament"].upper()
+        if t["isGS"] and has_main:
+            mandatory_gs.append(t)
+        elif t["category"] == "WTA 1000" and has_main and any(n.upper() in name for n in MANDATORY_1000_NAMES):
+            mandatory_1000.append(t)
+        elif t["category"] == "WTA 1000" and has_main and any(n.upper() in name for n in OPTIONAL_1000_NAMES):
+            optional_1000.append(t)
+        else:
+            rest.append(t)
+    mandatory_1000.sort(key=by_points)
+    optional_1000.sort(key=by_points)
+    rest.sort(key=by_points)
+
+    counted_1000 = sorted(mandatory_1000[:6] + optional_1000[:1], key=by_points)
+    fill_pool = sorted(mandatory_1000[6:] + optional_1000[1:] + rest, key=by_points)
+    slots = max(0, COUNTABLE_RESULTS - len(mandatory_gs) - len(counted_1000))
+    countable = sorted(mandatory_gs, key=by_points) + counted_1000 + fill_pool[:slots]
+    return countable, fill_pool[slots:]
+
+
+def _score(tournaments, rules):
+    for t in tournaments:
+        t["points"], t["roundDisplay"] = tournament_points(t, rules)
+        t["dropDate"] = rules.drop_date(t).isoformat()
+    return tournaments
+
+
+def current_results(player_rows, player_key, rules, today):
+    """Tournaments counting for the ranking on `today` (last 52 weeks, this week included)."""
+    start = today - timedelta(days=364)
+    rows = [r for r in player_rows if start <= _parse_date(r.get("DATE")) <= today]
+    cutoff_monday = _parse_date(monday_of(today)) - timedelta(days=364)
+    tournaments = [t for t in group_tournaments(rows, player_key)
+                   if rules.effective_monday(t) > cutoff_monday]
+    return _score(tournaments, rules)
+
+
+def best18_at(player_rows, player_key, rules, window_end):
+    """Best-18 total of the results still live on `window_end` (a "YYYY-MM-DD" cutoff)."""
+    end = _parse_date(window_end)
+    # 55 weeks: wide enough for W15/W35 +7 effective date shift
+    start = end - timedelta(days=385)
+    rows = [r for r in player_rows if start <= _parse_date(r.get("DATE")) <= end]
+    tournaments = [t for t in group_tournaments(rows, player_key)
+                   if rules.effective_monday(t) <= end and rules.drop_date(t) > end]
+    countable, _ = split_countable(_score(tournaments, rules))
+    return sum(t["points"] for t in countable)
+
+
+def _ledger_row(t):
+    return {"date": t["date"], "tournament": t["tournament"], "roundDisplay": t["roundDisplay"],
+            "points": t["points"], "dropDate": t["dropDate"]}
+
+
+def player_ledger(player_rows, player_key, rules, gs_data, today):
+    countable, non_countable = split_countable(current_results(player_rows, player_key, rules, today))
+    cutoffs = {}
+    for gs in gs_data:
+        totals = {}
+        for kind, field in (("q", "qCutoff"), ("md", "mdCutoff")):
+            if _parse_date(gs.get(field)):
+                points = best18_at(player_rows, player_key, rules, gs[field])
+                totals[kind] = {"points": points, "est": points - GS_ENTRY_POINTS[kind]}
+        cutoffs[gs["id"]] = totals
+    return {
+        "asOf": today.isoformat(),
+        "points": sum(t["points"] for t in countable),
+        "countable": [_ledger_row(t) for t in countable],
+        "nonCountable": [_ledger_row(t) for t in non_countable],
+        "cutoffs": cutoffs,
+    }
+
+
+def write_roadtogs_ledgers(cleaned_history, players, gs_data, points_distribution,
+                           itf_draw_sizes, wta_draw_sizes, today=None):
+    """Write one ledger file per player; returns the index {PLAYER NAME (upper): hash}."""
+    today = today or date.today()
+    rules = PointsRules(points_distribution, itf_draw_sizes, wta_draw_sizes, cleaned_history)
+    wanted = {p.upper() for p in players}
+
+    # One pass over the history: each player's singles rows (no BJK Cup) with a valid date.
+    rows_by_player = {p: [] for p in wanted}
+    for r in cleaned_history:
+        if (r.get("MATCH_TYPE") or "").strip() == "Fed/BJK Cup" or not _parse_date(r.get("DATE")):
+            continue
+        winner, loser = _player_key(r.get("_winnerName")), _player_key(r.get("_loserName"))
+        if winner in rows_by_player:
+            rows_by_player[winner].append(r)
+        if loser in rows_by_player and loser != winner:
+            rows_by_player[loser].append(r)
+
+    payloads = (
+        (player, player_ledger(rows_by_player[player], player, rules, gs_data, today))
+        for player in sorted(wanted)
+    )
+    return write_hashed_json_files(ROADTOGS_DIR, payloads, label="Road to GS ledgers")
@@ -0,0 +1,230 @@
+"""Run-level performance telemetry for the workflow scripts.
+
+`start_run(script)` (called once from a script's __main__) installs counters
+around every `requests` call, Selenium `driver.get` page load and `time.sleep`,
+and saves this script's numbers into `RUN_METRICS_FILE` when the process exits:
+
+    {"version": 1, "runs": [            # oldest first, RUN_METRICS_HISTORY_RUNS kept
+      {"run_id": "...", "started": "...",
+       "scripts": {"main.py": {"seconds", "peak_rss_mb", "children_peak_rss_mb",
+                               "http": {...}, "selenium": {...}, "sleep": {...},
+                               "stages": {name: {"start", "end", "seconds", "rss_mb"}},
+                               ...extra values passed to record()}}}]}
+
+Scripts of the same workflow run (same GITHUB_RUN_ID) share one run entry.
+`stage_timer(name)` times one step of a script; peak RSS is sampled at the end
+of every stage, so the stage that raised the peak can be told apart. Retry
+loops call `count_retry(url)` before each repeated attempt, so "retries" counts
+real retries only (a page legitimately requested twice is not one). "sleep"
+seconds are time actually slept, summed over threads (thread-seconds).
+generate_run_report.py summarises the file and compares it with earlier runs.
+"""
+
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+
+import requests
+
+from config import RUN_METRICS_FILE, RUN_METRICS_HISTORY_RUNS
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+_METRICS_VERSION = 1
+
+_lock = threading.Lock()
+_script = None
+_started = None
+_t0 = time.perf_counter()
+_http = {"requests": 0, "errors": 0, "retries": 0, "bytes": 0, "seconds": 0.0, "status": {}, "hosts": {}}
+_HOST_STATS = {"requests": 0, "retries": 0, "429": 0, "errors": 0, "bytes": 0, "seconds": 0.0}
+_selenium = {"loads": 0, "errors": 0, "seconds": 0.0}
+_sleep = {"count": 0, "seconds": 0.0}
+_stages = {}
+_extra = {}
+
+
+def _peak_rss_mb(who=None):
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF if who is None else who).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux, in bytes on macOS.
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _host_stats(url):
+    return _http["hosts"].setdefault(urlparse(url).netloc, dict(_HOST_STATS))
+
+
+def count_retry(url):
+    """Record that a retry loop is about to request url again after a failed attempt."""
+    with _lock:
+        _http["retries"] += 1
+        _host_stats(url)["retries"] += 1
+
+
+def _count_request(url, status, nbytes, seconds):
+    with _lock:
+        per_host = _host_stats(url)
+        for stats in (_http, per_host):
+            stats["requests"] += 1
+            stats["bytes"] += nbytes
+            stats["seconds"] += seconds
+            if status is None:
+                stats["errors"] += 1
+        if status is not None:
+            _http["status"][str(status)] = _http["status"].get(str(status), 0) + 1
+            per_host["429"] += status == 429
+
+
+def _instrument_requests():
+    original = requests.Session.request
+
+    # requests.get/post create a Session too, so this covers every call site.
+    def request(self, method, url, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            resp = original(self, method, url, *args, **kwargs)
+        except Exception:
+            _count_request(url, None, 0, time.perf_counter() - start)
+            raise
+        if kwargs.get("stream"):
+            nbytes = int(resp.headers.get("content-length") or 0)
+        else:
+            nbytes = len(resp.content or b"")
+        _count_request(url, resp.status_code, nbytes, time.perf_counter() - start)
+        return resp
+
+    requests.Session.request = request
+
+
+def _instrument_selenium():
+    try:
+        from selenium.webdriver.remote.webdriver import WebDriver
+    except ImportError:
+        return
+    original = WebDriver.get
+
+    def get(self, url):
+        start = time.perf_counter()
+        try:
+            return original(self, url)
+        except Exception:
+            with _lock:
+                _selenium["errors"] += 1
+            raise
+        finally:
+            with _lock:
+                _selenium["loads"] += 1
+                _selenium["seconds"] += time.perf_counter() - start
+
+    WebDriver.get = get
+
+
+def _instrument_sleep():
+    original = time.sleep
+
+    # Time actually slept, summed over threads (so it can exceed wall time).
+    def sleep(seconds):
+        start = time.perf_counter()
+        try:
+            original(seconds)
+        finally:
+            with _lock:
+                _sleep["count"] += 1
+                _sleep["seconds"] += time.perf_counter() - start
+
+    time.sleep = sleep
+
+
+def start_run(script):
+    """Start collecting metrics for `script` and save them when the process exits."""
+    global _script, _started, _t0
+    if _script is not None:
+        return
+    _script = script
+    _started = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    _t0 = time.perf_counter()
+    _instrument_requests()
+    _instrument_selenium()
+    _instrument_sleep()
+    atexit.register(save_run)
+
+
+@contextmanager
+def stage_timer(name):
+    """Time a block as stage `name` (seconds since the script started, plus peak RSS so far)."""
+    start = time.perf_counter() - _t0
+    try:
+        yield
+    finally:
+        end = time.perf_counter() - _t0
+        with _lock:
+            _stages[name] = {"start": round(start, 2), "end": round(end, 2),
+                             "seconds": round(end - start, 2), "rss_mb": _peak_rss_mb()}
+
+
+def record(**values):
+    """Extra JSON values to store with this script's metrics (e.g. render timings)."""
+    with _lock:
+        _extra.update(values)
+
+
+def script_metrics():
+    """This script's metrics so far."""
+    with _lock:
+        http = json.loads(json.dumps(_http))
+        for stats in [http] + list(http["hosts"].values()):
+            stats["seconds"] = round(stats["seconds"], 2)
+        return {
+            "seconds": round(time.perf_counter() - _t0, 2),
+            "peak_rss_mb": _peak_rss_mb(),
+            "children_peak_rss_mb": _peak_rss_mb(resource.RUSAGE_CHILDREN) if resource else None,
+            "http": http,
+            "selenium": {**_selenium, "seconds": round(_selenium["seconds"], 2)},
+            "sleep": {**_sleep, "seconds": round(_sleep["seconds"], 2)},
+            "stages": dict(_stages),
+            **_extra,
+        }
+
+
+def load_metrics(path=RUN_METRICS_FILE):
+    try:
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("version") == _METRICS_VERSION and isinstance(state.get("runs"), list):
+            return state
+    except Exception:
+        pass
+    return {"version": _METRICS_VERSION, "runs": []}
+
+
+def save_run(path=RUN_METRICS_FILE):
+    """Add this script's metrics to its run entry in `path` (keeping the last runs)."""
+    if _script is None:
+        return
+    try:
+        state = load_metrics(path)
+        run_id = os.environ.get("GITHUB_RUN_ID") or f"local-{_started}"
+        runs = state["runs"]
+        if not runs or runs[-1].get("run_id") != run_id:
+            runs.append({"run_id": run_id, "started": _started, "scripts": {}})
+        runs[-1]["scripts"][_script] = script_metrics()
+        state["runs"] = runs[-RUN_METRICS_HISTORY_RUNS:]
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, path)
+    except Exception as e:
+        print(f"Error writing run metrics: {e}")
@@ -0,0 +1,137 @@
+"""A small stage scheduler for the update pipeline.
+
+Each `Stage` declares the named values it needs (`inputs`), the ones it
+produces (`outputs`) and, for ordering-only dependencies such as a shared
+module-level cache, the stages it must run `after`. `run_stages` starts every
+stage as soon as its dependencies are done, on a thread pool (the stages are
+mostly waiting on HTTP or Selenium; CPU-heavy work such as draw PDF parsing
+already fans out to its own process pool).
+
+When the run finishes, the per-stage times are kept in `STAGE_TIMINGS` and the
+critical path (the chain of dependencies that ended last) is printed: that
+chain, not the sum of all stages, is what bounds the end-to-end time.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from config import PIPELINE_STAGE_WORKERS
+from run_metrics import stage_timer
+
+# Stage name -> {"start", "end", "seconds"} of the last run_stages call (times
+# are seconds since the run started).
+STAGE_TIMINGS = {}
+# Stage names of the last run's critical path, first to last.
+CRITICAL_PATH = []
+
+
+class Stage:
+    """One pipeline step: `func(*inputs)` returns its outputs (a tuple if there are several)."""
+
+    def __init__(self, name, func, inputs=(), outputs=(), after=()):
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.after = list(after)
+
+    def __repr__(self):
+        return f"Stage({self.name!r})"
+
+
+def _dependencies(stages):
+    producers = {}
+    for stage in stages:
+        for out in stage.outputs:
+            if out in producers:
+                raise ValueError(f"{out!r} is produced by both {producers[out].name} and {stage.name}")
+            producers[out] = stage
+    names = {stage.name for stage in stages}
+    deps = {}
+    for stage in stages:
+        missing = [i for i in stage.inputs if i not in producers]
+        missing += [a for a in stage.after if a not in names]
+        if missing:
+            raise ValueError(f"{stage.name}: no stage provides {', '.join(missing)}")
+        deps[stage.name] = {producers[i].name for i in stage.inputs} | set(stage.after)
+    return deps
+
+
+def _store_outputs(stage, result, values):
+    if len(stage.outputs) == 1:
+        values[stage.outputs[0]] = result
+    elif stage.outputs:
+        if len(result) != len(stage.outputs):
+            raise ValueError(f"{stage.name} returned {len(result)} values for {len(stage.outputs)} outputs")
+        values.update(zip(stage.outputs, result))
+
+
+def critical_path(deps, timings):
+    """Stage names from the start of the run to the stage that ended last, following
+    at each step the dependency that finished latest."""
+    if not timings:
+        return []
+    path = [max(timings, key=lambda name: timings[name]["end"])]
+    while deps[path[-1]]:
+        path.append(max(deps[path[-1]], key=lambda name: timings[name]["end"]))
+    return path[::-1]
+
+
+def run_stages(stages, max_workers=PIPELINE_STAGE_WORKERS):
+    """Run the stages as their dependencies complete. Returns {value name: value}.
+
+    If a stage raises, no further stage is started; the ones already running
+    are waited for and the first error is re-raised.
+    """
+    deps = _dependencies(stages)
+    values = {}
+    done = set()
+    pending = list(stages)
+    running = {}
+    STAGE_TIMINGS.clear()
+    CRITICAL_PATH.clear()
+    t0 = time.perf_counter()
+
+    def run(stage):
+        start = time.perf_counter() - t0
+        with stage_timer(stage.name):
+            result = stage.func(*(values[i] for i in stage.inputs))
+        end = time.perf_counter() - t0
+        STAGE_TIMINGS[stage.name] = {"start": round(start, 2), "end": round(end, 2), "seconds": round(end - start, 2)}
+        return result
+
+    error = None
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        while pending or running:
+            if error is None:
+                for stage in [s for s in pending if deps[s.name] <= done]:
+                    pending.remove(stage)
+                    running[pool.submit(run, stage)] = stage
+            if not running:
+                if error is None:
+                    raise ValueError(f"Dependency cycle between {', '.join(s.name for s in pending)}")
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage = running.pop(future)
+                try:
+                    _store_outputs(stage, future.result(), values)
+                    done.add(stage.name)
+                except Exception as e:
+                    print(f"Stage {stage.name} failed: {e}")
+                    error = error or e
+    if error is not None:
+        raise error
+
+    CRITICAL_PATH.extend(critical_path(deps, STAGE_TIMINGS))
+    print_stage_report()
+    return values
+
+
+def print_stage_report():
+    if not STAGE_TIMINGS:
+        return
+    wall = max(t["end"] for t in STAGE_TIMINGS.values())
+    total = sum(t["seconds"] for t in STAGE_TIMINGS.values())
+    chain = " -> ".join(f"{name} {STAGE_TIMINGS[name]['seconds']:.1f}s" for name in CRITICAL_PATH)
+    print(f"Stages: {wall:.1f}s wall for {total:.1f}s of work. Critical path: {chain}")
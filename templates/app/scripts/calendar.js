@@ -0,0 +1,183 @@
+            let calendarFiltersInitialized = false;
+            function closeAllCalendarDropdowns() {
+                const toolbar = document.getElementById('calendar-toolbar');
+                if (!toolbar) return;
+                toolbar.querySelectorAll('.cal-dd.open').forEach(dd => {
+                    dd.classList.remove('open');
+                    const btn = dd.querySelector('[data-cal-dd-btn]');
+                    if (btn) btn.setAttribute('aria-expanded', 'false');
+                });
+            }
+            function initCalendarDropdowns() {
+                const toolbar = document.getElementById('calendar-toolbar');
+                if (!toolbar) return;
+                if (toolbar.dataset.calDdInit === '1') return;
+                toolbar.dataset.calDdInit = '1';
+
+                toolbar.addEventListener('click', function(e) {
+                    const btn = e.target.closest('[data-cal-dd-btn]');
+                    if (!btn) return;
+                    const dd = btn.closest('.cal-dd');
+                    if (!dd) return;
+                    const wasOpen = dd.classList.contains('open');
+                    closeAllCalendarDropdowns();
+                    if (!wasOpen) {
+                        dd.classList.add('open');
+                        btn.setAttribute('aria-expanded', 'true');
+                    }
+                    e.preventDefault();
+                });
+
+                if (!window.__calendarDdDocInit) {
+                    window.__calendarDdDocInit = true;
+                    document.addEventListener('click', function(e) {
+                        const tb = document.getElementById('calendar-toolbar');
+                        if (!tb) return;
+                        if (!tb.contains(e.target)) closeAllCalendarDropdowns();
+                    });
+                    document.addEventListener('keydown', function(e) {
+                        if (e.key === 'Escape') closeAllCalendarDropdowns();
+                    });
+                }
+            }
+            function initCalendarHorizontalScroll() {
+                const view = document.getElementById('view-calendar');
+                if (!view) return;
+                if (view.dataset.calHScrollInit === '1') return;
+                const wrapper = view.querySelector('.table-wrapper');
+                if (!wrapper) return;
+                view.dataset.calHScrollInit = '1';
+
+                function hasHorizontalOverflow() {
+                    return (wrapper.scrollWidth - wrapper.clientWidth) > 2;
+                }
+
+                view.addEventListener('wheel', function(e) {
+                    if (e.ctrlKey) return;
+                    if (e.target && e.target.closest && e.target.closest('.cal-dd-panel')) return;
+                    let delta = 0;
+                    if (e.deltaX && Math.abs(e.deltaX) > 0) delta = e.deltaX;
+                    else if (e.shiftKey && e.deltaY && Math.abs(e.deltaY) > 0) delta = e.deltaY;
+                    if (!delta) return;
+                    if (!hasHorizontalOverflow()) return;
+                    wrapper.scrollLeft += delta;
+                    e.preventDefault();
+                }, { passive: false });
+
+                wrapper.addEventListener('wheel', function(e) {
+                    if (e.ctrlKey) return;
+                    if (e.shiftKey) return;
+                    if (e.target && e.target.closest && e.target.closest('.cal-dd-panel')) return;
+                    if (!hasHorizontalOverflow()) return;
+                    if (!e.deltaY || Math.abs(e.deltaY) < 1) return;
+                    if (e.deltaX && Math.abs(e.deltaX) > Math.abs(e.deltaY)) return;
+                    const before = wrapper.scrollLeft;
+                    wrapper.scrollLeft += e.deltaY;
+                    if (wrapper.scrollLeft !== before) e.preventDefault();
+                }, { passive: false });
+
+                let dragging = false;
+                let dragStartX = 0;
+                let dragStartScrollLeft = 0;
+                wrapper.addEventListener('mousedown', function(e) {
+                    if (e.button !== 0) return;
+                    if (!hasHorizontalOverflow()) return;
+                    dragging = true;
+                    wrapper.classList.add('dragging');
+                    dragStartX = e.pageX;
+                    dragStartScrollLeft = wrapper.scrollLeft;
+                });
+                window.addEventListener('mouseup', function() {
+                    dragging = false;
+                    wrapper.classList.remove('dragging');
+                });
+                window.addEventListener('mousemove', function(e) {
+                    if (!dragging) return;
+                    const dx = e.pageX - dragStartX;
+                    wrapper.scrollLeft = dragStartScrollLeft - dx;
+                });
+
+            }
+            function syncCalendarRowspans() {
+                const table = document.querySelector('#view-calendar .calendar-table');
+                if (!table) return;
+                const rows = Array.from(table.querySelectorAll('tbody tr'));
+                if (!rows.length) return;
+
+                const groupFirstRows = Array.from(table.querySelectorAll('tbody tr.cal-group-first'));
+                if (!groupFirstRows.length) return;
+
+                for (let gi = 0; gi < groupFirstRows.length; gi++) {
+                    const startRow = groupFirstRows[gi];
+                    const startIdx = rows.indexOf(startRow);
+                    if (startIdx === -1) continue;
+                    const nextStartRow = (gi + 1 < groupFirstRows.length) ? groupFirstRows[gi + 1] : null;
+                    const endIdx = nextStartRow ? rows.indexOf(nextStartRow) : rows.length;
+                    if (endIdx === -1) continue;
+
+                    const groupRows = rows.slice(startIdx, endIdx);
+                    if (!groupRows.length) continue;
+
+                    const catCell = groupRows.map(r => r.querySelector('.cal-cat-label')).find(Boolean);
+                    if (!catCell) continue;
+
+                    if (catCell.parentElement) catCell.parentElement.removeChild(catCell);
+                    groupRows.forEach(r => {
+                        r.querySelectorAll('.cal-cat-label').forEach(c => c.remove());
+                    });
+
+                    const visibleRows = groupRows.filter(r => r.style.display !== 'none');
+                    const targetRow = visibleRows.length ? visibleRows[0] : groupRows[0];
+                    targetRow.insertBefore(catCell, targetRow.firstChild);
+                    catCell.rowSpan = visibleRows.length ? visibleRows.length : groupRows.length;
+                }
+            }
+            function applyCalendarFilters() {
+                const levelToggles = document.querySelectorAll('[data-cal-filter-toggle]');
+                const continentToggles = document.querySelectorAll('[data-cal-continent-toggle]');
+                const surfaceToggles = document.querySelectorAll('[data-cal-surface-toggle]');
+                if (!levelToggles.length && !continentToggles.length && !surfaceToggles.length) return;
+
+                const activeLevels = new Set();
+                levelToggles.forEach(cb => { if (cb.checked) activeLevels.add(cb.dataset.calFilterToggle); });
+
+                const activeContinents = new Set();
+                continentToggles.forEach(cb => { if (cb.checked) activeContinents.add(cb.dataset.calContinentToggle); });
+
+                const activeSurfaces = new Set();
+                surfaceToggles.forEach(cb => { if (cb.checked) activeSurfaces.add(cb.dataset.calSurfaceToggle); });
+
+                document.querySelectorAll('#view-calendar tr[data-cal-row-continent]').forEach(row => {
+                    const rowCont = row.dataset.calRowContinent || '';
+                    let show = true;
+                    if (continentToggles.length && rowCont && !activeContinents.has(rowCont)) show = false;
+                    row.style.display = show ? '' : 'none';
+                });
+                syncCalendarRowspans();
+
+                document.querySelectorAll('#view-calendar [data-cal-filter]').forEach(el => {
+                    const levelKey = el.dataset.calFilter || '';
+                    const contKey = el.dataset.calContinent || '';
+                    const surfKey = el.dataset.calSurface || '';
+
+                    let visible = true;
+                    if (levelToggles.length && levelKey && !activeLevels.has(levelKey)) visible = false;
+                    if (continentToggles.length && contKey && !activeContinents.has(contKey)) visible = false;
+                    if (surfaceToggles.length && surfKey && !activeSurfaces.has(surfKey)) visible = false;
+
+                    el.style.display = visible ? '' : 'none';
+                });
+            }
+            function initCalendarFilters() {
+                if (calendarFiltersInitialized) {
+                    applyCalendarFilters();
+                    return;
+                }
+                initCalendarDropdowns();
+                initCalendarHorizontalScroll();
+                const toggles = document.querySelectorAll('[data-cal-filter-toggle], [data-cal-continent-toggle], [data-cal-surface-toggle]');
+                if (!toggles.length) return;
+                toggles.forEach(cb => cb.addEventListener('change', applyCalendarFilters));
+                calendarFiltersInitialized = true;
+                applyCalendarFilters();
+            }
@@ -0,0 +1,219 @@
+            function switchTab(tabName) {
+                if (tabName === 'home' && homeLocked) return;
+                document.querySelectorAll('.menu-item').forEach(el => el.classList.remove('active'));
+                const btn = document.getElementById('btn-' + tabName);
+                if (btn) btn.classList.add('active');
+
+                if (tabName !== 'home') {
+                    homeLocked = true;
+                    const homeView = document.getElementById('view-home');
+                    if (homeView) homeView.style.display = 'none';
+                    document.body.classList.remove('home-mode');
+                } else {
+                    document.body.classList.add('home-mode');
+                }
+
+                if (tabName === 'calendar') {
+                    document.body.classList.add('calendar-mode');
+                } else {
+                    document.body.classList.remove('calendar-mode');
+                }
+
+                document.getElementById('view-upcoming').style.display = (tabName === 'upcoming') ? 'flex' : 'none';
+                document.getElementById('view-entrylists').style.display = (tabName === 'entrylists') ? 'flex' : 'none';
+
+                document.getElementById('view-rankings').style.display = (tabName === 'rankings') ? 'flex' : 'none';
+                document.getElementById('view-history').style.display = (tabName === 'history') ? 'flex' : 'none';
+                document.getElementById('view-fedbcup').style.display = (tabName === 'fedbcup') ? 'flex' : 'none';
+                document.getElementById('view-calendar').style.display = (tabName === 'calendar') ? 'flex' : 'none';
+                document.getElementById('view-roadtogs').style.display = (tabName === 'roadtogs') ? 'flex' : 'none';
+                document.getElementById('view-gallery').style.display = (tabName === 'gallery') ? 'flex' : 'none';
+                document.getElementById('view-draws').style.display = (tabName === 'draws') ? 'block' : 'none';
+                document.getElementById('view-tstrength').style.display = (tabName === 'tstrength') ? 'flex' : 'none';
+
+                if (tabName === 'gallery') initGallery();
+                if (tabName === 'entrylists') ensureTabDataLoaded('entrylists').then(() => updateEntryList()).catch(err => console.error('Failed to load entry lists:', err));
+                if (tabName === 'draws') ensureTabDataLoaded('draws').then(() => updateDraw()).catch(err => console.error('Failed to load draws:', err));
+                if (tabName === 'tstrength') ensureTabDataLoaded('tstrength').then(() => window.tsRender && window.tsRender()).catch(err => console.error('Failed to load T-Strength:', err));
+                if (tabName === 'calendar') initCalendarFilters();
+
+                applyMobileHistoryLayout();
+
+                if (window.trackVisit) {
+                    window.trackVisit(location.pathname + "#" + tabName);
+                }
+
+                // Close mobile menu after selecting
+                if (window.innerWidth <= 768) {
+                    document.getElementById('sidebar').classList.add('mobile-hidden');
+                }
+            }
+
+            document.body.classList.add('home-mode');
+            document.addEventListener('DOMContentLoaded', initCalendarFilters);
+
+            function switchFedBjkTab(subTab) {
+                document.getElementById('fedbcup-view-players').style.display = (subTab === 'players') ? '' : 'none';
+                document.getElementById('fedbcup-view-captains').style.display = (subTab === 'captains') ? '' : 'none';
+                document.getElementById('fedbcup-view-series').style.display = (subTab === 'series') ? '' : 'none';
+                document.getElementById('fedbcup-btn-players').classList.toggle('active', subTab === 'players');
+                document.getElementById('fedbcup-btn-captains').classList.toggle('active', subTab === 'captains');
+                document.getElementById('fedbcup-btn-series').classList.toggle('active', subTab === 'series');
+            }
+
+            function applyMobileHistoryLayout() {
+                const historyLayout = document.querySelector('#view-history .history-layout');
+                if (!historyLayout) return;
+
+                const filterPanel = historyLayout.querySelector('.filter-panel');
+                const historyContent = historyLayout.querySelector('.history-content');
+                if (!filterPanel || !historyContent) return;
+
+                const headerSection = historyContent.querySelector('.table-header-section');
+                if (!headerSection) return;
+
+                if (window.innerWidth <= 768) {
+                    // Mobile order: header/search -> filters -> table
+                    if (!historyContent.contains(filterPanel)) {
+                        headerSection.insertAdjacentElement('afterend', filterPanel);
+                    } else if (headerSection.nextElementSibling !== filterPanel) {
+                        headerSection.insertAdjacentElement('afterend', filterPanel);
+                    }
+                } else {
+                    // Desktop order: filters left -> content right
+                    if (historyContent.contains(filterPanel)) {
+                        historyLayout.insertBefore(filterPanel, historyContent);
+                    }
+                }
+            }
+
+            function reverseScore(score) {
+                if (!score) return '';
+                return score.split(' ').map(set => {
+                    const m = set.match(/^(\d+)-(\d+)(.*)$/);
+                    if (!m) return set;
+                    return m[2] + '-' + m[1] + m[3];
+                }).join(' ');
+            }
+
+            function formatSeed(seed) {
+                if (seed === null || seed === undefined) return '';
+                const text = String(seed).trim();
+                if (!text) return '';
+                const num = Number(text);
+                if (!Number.isNaN(num) && Number.isInteger(num)) {
+                    return String(num);
+                }
+                return text;
+            }
+
+            function buildPrefix(seed, entry) {
+                const parts = [];
+                const formattedSeed = formatSeed(seed);
+                if (formattedSeed) parts.push(formattedSeed);
+                if (entry) parts.push(entry);
+                if (parts.length === 0) return '';
+                return '(' + parts.join('/') + ') ';
+            }
+
+            function displayRound(round, tournament) {
+                return round || '';
+            }
+
+            // Format date string to yyyy-MM-dd
+            function formatDate(dateStr) {
+                if (!dateStr) return '';
+                const parts = dateStr.split('/');
+                if (parts.length === 3) {
+                    return parts[2] + '-' + parts[1].padStart(2, '0') + '-' + parts[0].padStart(2, '0');
+                }
+                const d = new Date(dateStr);
+                if (isNaN(d)) return dateStr;
+                return d.getFullYear() + '-' + String(d.getMonth() + 1).padStart(2, '0') + '-' + String(d.getDate()).padStart(2, '0');
+            }
+
+            // Helper function to get display name from player mapping
+            // Build reverse lookup cache for O(1) name resolution
+            const _displayNameCache = {};
+            function _indexPlayerMapping() {
+                for (const [displayName, aliases] of Object.entries(playerMapping)) {
+                    if (!displayName) continue;
+                    _displayNameCache[String(displayName).toUpperCase()] = displayName;
+                    if (!Array.isArray(aliases)) continue;
+                    for (const alias of aliases) {
+                        if (!alias) continue;
+                        _displayNameCache[String(alias).toUpperCase()] = displayName;
+                    }
+                }
+            }
+            (function() {
+                fetch('data/player_aliases_wta_itf.json', { cache: 'no-cache' })
+                    .then(function(r) { return r && r.ok ? r.json() : []; })
+                    .then(function(items) {
+                        if (!Array.isArray(items)) return;
+                        items.forEach(function(item) {
+                            if (!item || typeof item !== 'object') return;
+                            const displayName = String(item.display_name || '').trim();
+                            if (!displayName) return;
+                            _displayNameCache[displayName.toUpperCase()] = displayName;
+
+                            const aliases = [item.display_name, item.wta_name, item.itf_name, item.bjkc_name];
+                            if (Array.isArray(item.aliases)) {
+                                for (const extra of item.aliases) aliases.push(extra);
+                            }
+                            for (const alias of aliases) {
+                                const aliasText = String(alias || '').trim();
+                                if (!aliasText) continue;
+                                _displayNameCache[aliasText.toUpperCase()] = displayName;
+                            }
+                        });
+                    })
+                    .catch(function() {});
+            })();
+
+            function getDisplayName(upperCaseName) {
+                const cached = _displayNameCache[upperCaseName];
+                if (cached) return cached;
+                // If not found, convert to title case (handling hyphens)
+                const result = upperCaseName.split(' ').map(word => {
+                    if (word.includes('-')) {
+                        return word.split('-').map(part =>
+                            part.charAt(0).toUpperCase() + part.slice(1).toLowerCase()
+                        ).join('-');
+                    }
+                    return word.charAt(0).toUpperCase() + word.slice(1).toLowerCase();
+                }).join(' ');
+                _displayNameCache[upperCaseName] = result;
+                return result;
+            }
+
+            $(document).ready(function() {
+                // Initialize sidebar state for mobile
+                if (window.innerWidth <= 768) {
+                    document.getElementById('sidebar').classList.add('mobile-hidden');
+                }
+
+                $('#playerHistorySelect').select2({
+                    placeholder: 'Select a player...',
+                    allowClear: true,
+                    width: '250px'
+                });
+
+                $('#playerHistorySelect').on('change', function() {
+                    filterHistoryByPlayer();
+                });
+
+                renderHistoryTable();
+                applyMobileHistoryLayout();
+
+                // Handle window resize
+                window.addEventListener('resize', function() {
+                    if (window.innerWidth > 768) {
+                        document.getElementById('sidebar').classList.remove('mobile-hidden');
+                    } else {
+                        document.getElementById('sidebar').classList.add('mobile-hidden');
+                    }
+                    applyMobileHistoryLayout();
+                });
+            });
+
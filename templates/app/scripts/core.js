@@ -0,0 +1,140 @@
+            // Per-tab datasets live in content-hashed files (safe to cache) and are
+            // fetched the first time a tab needs them.
+            const _tabDataFiles = {{ tab_data_files_json }};
+            const _tabDataPromises = {};
+            let tournamentData = {};
+            let playerMapping = {};
+            let roadtogsLedgers = {};
+            let drawsData = {};
+            let drawsTournamentInfo = {};
+            let rankingWeeks = {};
+            let historyShards = {};
+            function _applyTabData(tab, d) {
+                if (tab === 'names') {
+                    playerMapping = d.playerMapping || {};
+                    _indexPlayerMapping();
+                } else if (tab === 'entrylists') {
+                    tournamentData = d.tournamentData || {};
+                } else if (tab === 'roadtogs') {
+                    roadtogsLedgers = d.roadtogsLedgers || {};
+                } else if (tab === 'draws') {
+                    drawsData = d.drawsData || {};
+                    drawsTournamentInfo = d.drawsTournamentInfo || {};
+                } else if (tab === 'tstrength') {
+                    window.tsData = d.tsData || [];
+                } else if (tab === 'rankings') {
+                    rankingWeeks = d.rankingWeeks || {};
+                } else if (tab === 'history') {
+                    historyShards = d.historyShards || {};
+                }
+            }
+            function ensureTabDataLoaded(tab) {
+                if (!_tabDataFiles[tab]) return Promise.resolve({});
+                if (_tabDataPromises[tab]) return _tabDataPromises[tab];
+                _tabDataPromises[tab] = fetch(_tabDataFiles[tab])
+                    .then(r => {
+                        if (!r.ok) throw new Error('HTTP ' + r.status);
+                        return r.json();
+                    })
+                    .then(d => {
+                        _applyTabData(tab, d || {});
+                        return d;
+                    })
+                    .catch(err => {
+                        delete _tabDataPromises[tab];
+                        throw err;
+                    });
+                return _tabDataPromises[tab];
+            }
+            let historyData = null;
+            let _historyDataPromise = null;
+            function ensureHistoryDataLoaded() {
+                if (Array.isArray(historyData)) return Promise.resolve(historyData);
+                if (_historyDataPromise) return _historyDataPromise;
+                _historyDataPromise = Promise.all([
+                    fetch('data/history_data.json', { cache: 'no-cache' }),
+                    ensureTabDataLoaded('names'),
+                ])
+                    .then(([r]) => {
+                        if (!r.ok) throw new Error('HTTP ' + r.status);
+                        return r.json();
+                    })
+                    .then(d => {
+                        historyData = Array.isArray(d) ? d : [];
+                        _historyDataPromise = null;
+                        return historyData;
+                    })
+                    .catch(err => {
+                        _historyDataPromise = null;
+                        throw err;
+                    });
+                return _historyDataPromise;
+            }
+            // One player's matches: data/history_players/<hash>.json, columns + precomputed filter facets.
+            const _historyShardPromises = {};
+            function loadHistoryShard(selectedPlayer) {
+                const digest = historyShards[selectedPlayer];
+                if (!digest) return Promise.resolve({ rows: [], facets: null });
+                if (!_historyShardPromises[digest]) {
+                    _historyShardPromises[digest] = fetch('{{ history_shards_url_prefix }}' + digest + '.json')
+                        .then(r => {
+                            if (!r.ok) throw new Error('HTTP ' + r.status);
+                            return r.json();
+                        })
+                        .then(d => {
+                            const fields = d.f || [], cols = d.c || [];
+                            const n = cols.length ? cols[0].length : 0;
+                            const rows = new Array(n);
+                            for (let i = 0; i < n; i++) {
+                                const row = {};
+                                for (let j = 0; j < fields.length; j++) row[fields[j]] = cols[j][i];
+                                rows[i] = row;
+                            }
+                            return { rows, facets: d.facets || null };
+                        })
+                        .catch(err => {
+                            delete _historyShardPromises[digest];
+                            throw err;
+                        });
+                }
+                return _historyShardPromises[digest];
+            }
+            const gsCutoffs = {{ gs_cutoffs_json }};
+            const _iocToIso2 = {ALB:'al',ALG:'dz',AND:'ad',ANG:'ao',ARG:'ar',ARM:'am',AUS:'au',AUT:'at',AZE:'az',BAH:'bs',BAR:'bb',BDI:'bi',BEL:'be',BEN:'bj',BIH:'ba',BLR:'by',BOL:'bo',BOT:'bw',BRA:'br',BUL:'bg',CAL:'nc',CAM:'kh',CAN:'ca',CHI:'cl',CHN:'cn',CIV:'ci',CMR:'cm',COL:'co',CRC:'cr',CRO:'hr',CUB:'cu',CUW:'cw',CYP:'cy',CZE:'cz',DEN:'dk',DOM:'do',ECU:'ec',EGY:'eg',ESA:'sv',ESP:'es',EST:'ee',FIJ:'fj',FIN:'fi',FRA:'fr',FRG:'de',GAB:'ga',GBR:'gb',GEO:'ge',GER:'de',GLP:'gp',GRE:'gr',GUA:'gt',HAI:'ht',HKG:'hk',HUN:'hu',INA:'id',IND:'in',IRI:'ir',IRL:'ie',IRN:'ir',ISR:'il',ITA:'it',JAM:'jm',JOR:'jo',JPN:'jp',KAZ:'kz',KEN:'ke',KGZ:'kg',KHM:'kh',KOR:'kr',KOS:'xk',KSA:'sa',LAO:'la',LAT:'lv',LIE:'li',LTU:'lt',LUX:'lu',MAD:'mg',MAR:'ma',MAS:'my',MDA:'md',MEX:'mx',MKD:'mk',MLT:'mt',MNE:'me',MON:'mc',MRI:'mu',NAM:'na',NCA:'ni',NCD:'nc',NED:'nl',NEP:'np',NGA:'ng',NGR:'ng',NOR:'no',NZL:'nz',OMA:'om',OMN:'om',PAK:'pk',PAN:'pa',PAR:'py',PER:'pe',PHI:'ph',PLE:'ps',PNG:'pg',POL:'pl',POR:'pt',PUR:'pr',QAT:'qa',ROC:'ru',ROM:'ro',ROU:'ro',RSA:'za',RUS:'ru',SAM:'ws',SEN:'sn',SGP:'sg',SIN:'sg',SLO:'si',SMR:'sm',SRB:'rs',SRI:'lk',SUI:'ch',SVK:'sk',SWE:'se',SYR:'sy',TCH:'cz',THA:'th',TKM:'tm',TPE:'tw',TRI:'tt',TTO:'tt',TUN:'tn',TUR:'tr',UAE:'ae',UKR:'ua',URU:'uy',USA:'us',UZB:'uz',VEN:'ve',VIE:'vn',XKX:'xk',ZAM:'zm',ZIM:'zw'};
+            const _localFlags = new Set(['YUG','SCG','CIS','URS']);
+            function countryFlag(code, showCode) {
+                if (!code || code === '-') return code || '';
+                const upper = code.toUpperCase();
+                if (_localFlags.has(upper)) {
+                    const img = `<img src="data/flags/${upper.toLowerCase()}.svg" alt="${code}" title="${code}" style="vertical-align:middle;margin-right:3px;width:16px;height:11px;outline:0.3px solid #000">`;
+                    return showCode === false ? img : img + code;
+                }
+                const iso = _iocToIso2[upper];
+                if (!iso) return code;
+                const img = `<img src="https://purecatamphetamine.github.io/country-flag-icons/3x2/${iso.toUpperCase()}.svg" alt="${code}" title="${code}" style="vertical-align:middle;margin-right:3px;width:16px;height:11px;outline:0.3px solid #000">`;
+                return showCode === false ? img : img + code;
+            }
+            function countryFlagHistory(code, showCode) {
+                const html = countryFlag(code, showCode);
+                if (window.innerWidth > 768) return html;
+                return String(html).replace('width:16px;height:11px', 'width:12px;height:8px');
+            }
+            function toggleMobileMenu() {
+                const sidebar = document.getElementById('sidebar');
+                sidebar.classList.toggle('mobile-hidden');
+            }
+
+            // Close mobile menu when clicking outside
+            document.addEventListener('click', function(event) {
+                const sidebar = document.getElementById('sidebar');
+                const menuToggle = document.querySelector('.mobile-menu-toggle');
+
+                if (window.innerWidth <= 768) {
+                    if (!sidebar.contains(event.target) && !menuToggle.contains(event.target)) {
+                        sidebar.classList.add('mobile-hidden');
+                    }
+                }
+            });
+
+            // Close mobile menu when tab is clicked
+            let homeLocked = false;
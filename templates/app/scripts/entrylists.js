@@ -0,0 +1,95 @@
+            function selectEntryTournament(el) {
+                document.querySelectorAll('#view-entrylists .entry-menu-item').forEach(item => item.classList.remove('active'));
+                el.classList.add('active');
+                updateEntryList(el.getAttribute('data-key'), el.textContent);
+            }
+
+
+
+
+            let _prioFilterActive = false;
+
+            function togglePrio1() {
+                _prioFilterActive = !_prioFilterActive;
+                document.getElementById('btn-prio1').textContent = _prioFilterActive ? 'Show All' : 'Show Prio 1';
+                updateEntryList();
+            }
+
+            function renderRows(list, isMain, isITF, renumber) {
+                const prioCell = p => isITF ? `<td>${p.priority||''}</td>` : '';
+                let html = '';
+                list.forEach((p, i) => {
+                    const displayPos = renumber ? (i + 1) : p.pos;
+                    const bold = isMain ? 'font-weight:bold;' : '';
+                    const flag = (p.country && p.country !== '-') ? countryFlag(p.country, false) + ' ' : '';
+                    html += `<tr class="${p.country==='ARG'?'row-arg':''}"><td>${displayPos}</td><td style="text-align:left;${bold}">${flag}${p.name}</td><td>${p.rank}</td>${prioCell(p)}</tr>`;
+                });
+                return html;
+            }
+
+            function updateEntryList(key, name) {
+                if (!key) {
+                    const active = document.querySelector('.entry-menu-item.active');
+                    if (!active) return;
+                    key = active.getAttribute('data-key');
+                    name = active.textContent;
+                }
+                const body = document.getElementById('entry-body');
+                document.getElementById('entry-title').textContent = name || 'Entry List';
+                if (!tournamentData[key]) return;
+                const players = tournamentData[key];
+                const isITF = !key.startsWith('http');
+                document.getElementById('entry-prio-header').style.display = isITF ? '' : 'none';
+                const btn = document.getElementById('btn-prio1');
+                btn.style.display = isITF ? '' : 'none';
+                if (!isITF) _prioFilterActive = false;
+                btn.textContent = _prioFilterActive ? 'Show All' : 'Show Prio 1';
+                let html = '';
+                const byPos = (a, b) => (Number(a.pos_num ?? 999) - Number(b.pos_num ?? 999))
+                    || String(a.name || '').localeCompare(String(b.name || ''));
+                const main = players.filter(p => p.type === 'MAIN').sort(byPos);
+                const qual = players.filter(p => p.type === 'QUAL').sort(byPos);
+                const alt = players.filter(p => p.type === 'ALT').sort(byPos);
+                const cols = isITF ? 5 : 4;
+
+                if (_prioFilterActive) {
+                    // JR prio1 players go at the bottom; non-prio1 JR spots filled from qual/alt
+                    const mainJRPrio1 = main.filter(p => p.entry === 'JR' && p.priority === '1');
+                    const mainRegular = main.filter(p => p.entry !== 'JR');
+                    const regularSpots = main.length - mainJRPrio1.length;
+                    const pool = [
+                        ...mainRegular.filter(p => p.priority === '1'),
+                        ...qual.filter(p => p.priority === '1'),
+                        ...alt.filter(p => p.priority === '1'),
+                    ];
+                    const displayMain = [
+                        ...pool.slice(0, regularSpots),
+                        ...mainJRPrio1,
+                    ];
+                    const remainingPool = pool.slice(regularSpots);
+                    const displayQual = remainingPool.slice(0, qual.length);
+                    const displayAlt  = remainingPool.slice(qual.length);
+                    html += renderRows(displayMain, true, isITF, true);
+                    if (displayQual.length > 0) {
+                        html += `<tr class="divider-row"><td colspan="${cols}">QUALIFYING</td></tr>`;
+                        html += renderRows(displayQual, false, isITF, true);
+                    }
+                    if (displayAlt.length > 0) {
+                        html += `<tr class="divider-row"><td colspan="${cols}">ALTERNATES</td></tr>`;
+                        html += renderRows(displayAlt, false, isITF, true);
+                    }
+                } else {
+                    html += renderRows(main, true, isITF, false);
+                    if (qual.length > 0) {
+                        html += `<tr class="divider-row"><td colspan="${cols}">QUALIFYING</td></tr>`;
+                        html += renderRows(qual, false, isITF, false);
+                    }
+                    if (alt.length > 0) {
+                        html += `<tr class="divider-row"><td colspan="${cols}">ALTERNATES</td></tr>`;
+                        html += renderRows(alt, false, isITF, false);
+                    }
+                }
+                body.innerHTML = html;
+            }
+
+
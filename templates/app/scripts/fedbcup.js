@@ -0,0 +1,7 @@
+            function filterNational() {
+                const q = document.getElementById('national-search').value.toLowerCase();
+                document.querySelectorAll('#national-body tr').forEach(row => {
+                    const text = row.textContent.toLowerCase();
+                    row.classList.toggle('hidden', !text.includes(q));
+                });
+            }
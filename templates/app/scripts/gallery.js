@@ -0,0 +1,261 @@
+            // ── Gallery ───────────────────────────────────────────────────────
+            const GALLERY_IK_URL = 'https://ik.imagekit.io/tomistgg';
+            const GALLERY_PAGE_SIZE = 24;
+            let galleryPhotos = [];
+            let galleryRendered = 0;
+            let galleryLbIndex = 0;
+            let galleryCurrentAlbum = '';
+            let galleryPlayerFilter = '';
+            let galleryInited = false;
+            let galleryAlbums = [];
+            let galleryLbList = [];
+            let galleryCurrentList = [];
+
+            function galleryUrl(pid, tr, tournament) {
+                if (!pid) return '';
+                var cleanPid = pid.replace(/^\//, '');
+                var path = cleanPid;
+                if (tournament) {
+                    var prefix = tournament + '/';
+                    if (cleanPid.indexOf(prefix) !== 0) {
+                        path = prefix + cleanPid;
+                    }
+                }
+                return GALLERY_IK_URL + '/' + path + (tr ? ('?tr=' + tr) : '');
+            }
+            function galleryThumb(pid, tournament) { return galleryUrl(pid, 'w-400,h-300,fo-auto,q-80', tournament); }
+            function galleryFull(pid, tournament) { return galleryUrl(pid, 'q-90', tournament); }
+            function galleryDownload(pid, tournament) {
+                if (!pid) return '';
+                return galleryUrl(pid, 'orig-true', tournament) + '&ik-attachment=true';
+            }
+
+            function initGallery() {
+                if (galleryInited) return;
+                galleryInited = true;
+                fetch('data/gallery.json')
+                    .then(function(r) { return r.json(); })
+                    .then(function(data) {
+                        galleryPhotos = (data || []).map(function(p) {
+                            var pid = p.public_id || p.path || '';
+                            var inferred = '';
+                            if (pid.indexOf('/') !== -1) {
+                                inferred = pid.split('/')[0];
+                            }
+                            return {
+                                public_id: pid,
+                                tournament: p.tournament || p.album || inferred || 'Unsorted',
+                                players: Array.isArray(p.players) ? p.players : [],
+                                is_cover: p.is_cover === true || p.cover === true
+                            };
+                        });
+                        galleryBuildAlbums();
+                        galleryRenderAlbums();
+                        galleryApplyAlbum();
+                    })
+                    .catch(function() {
+                        var el = document.getElementById('gallery-empty');
+                        el.style.display = 'block';
+                        el.textContent = 'Could not load gallery.';
+                    });
+            }
+
+            function galleryBuildAlbums() {
+                var byTourn = {};
+                var order = [];
+                galleryPhotos.forEach(function(ph) {
+                    var t = ph.tournament || 'Unsorted';
+                    if (!byTourn[t]) {
+                        byTourn[t] = { name: t, count: 0, cover: ph.public_id || '', coverLocked: false };
+                        order.push(t);
+                    }
+                    byTourn[t].count += 1;
+                    if (ph.is_cover && ph.public_id) {
+                        byTourn[t].cover = ph.public_id;
+                        byTourn[t].coverLocked = true;
+                    } else if (!byTourn[t].coverLocked && !byTourn[t].cover && ph.public_id) {
+                        byTourn[t].cover = ph.public_id;
+                    }
+                });
+                // Newest albums first (based on first appearance in data/gallery.json)
+                order.reverse();
+                galleryAlbums = order.map(function(k) {
+                    var a = byTourn[k];
+                    delete a.coverLocked;
+                    return a;
+                });
+            }
+
+            function galleryRenderAlbums() {
+                var wrap = document.getElementById('gallery-albums');
+                wrap.innerHTML = '';
+                if (!galleryAlbums.length) return;
+                galleryAlbums.forEach(function(alb) {
+                    var card = document.createElement('div');
+                    card.className = 'gallery-album-card';
+                    if (alb.cover) {
+                        card.innerHTML = '<img src="' + galleryThumb(alb.cover, alb.name) + '" alt="' + galleryEsc(alb.name) + '" loading="lazy" />'
+                            + '<div class="gallery-album-info">'
+                            + '<div class="gallery-album-title">' + galleryEsc(alb.name) + '</div>'
+                            + '<div class="gallery-album-count">' + alb.count + ' photos</div>'
+                            + '</div>';
+                    } else {
+                        card.innerHTML = '<div class="gallery-album-cover">No cover</div>'
+                            + '<div class="gallery-album-info">'
+                            + '<div class="gallery-album-title">' + galleryEsc(alb.name) + '</div>'
+                            + '<div class="gallery-album-count">' + alb.count + ' photos</div>'
+                            + '</div>';
+                    }
+                    card.addEventListener('click', function() {
+                        galleryCurrentAlbum = alb.name;
+                        galleryApplyAlbum();
+                        window.scrollTo({ top: document.getElementById('gallery-grid').offsetTop - 60, behavior: 'smooth' });
+                    });
+                    wrap.appendChild(card);
+                });
+            }
+
+            function galleryApplyAlbum() {
+                var filtered = galleryPhotos.filter(function(ph) {
+                    if (!galleryCurrentAlbum) return false;
+                    if (ph.tournament !== galleryCurrentAlbum) return false;
+                    if (galleryPlayerFilter) {
+                        return (ph.players || []).indexOf(galleryPlayerFilter) !== -1;
+                    }
+                    return true;
+                });
+                galleryShuffle(filtered);
+                galleryCurrentList = filtered;
+                galleryBuildPlayerFilter();
+                galleryRendered = 0;
+                document.getElementById('gallery-grid').innerHTML = '';
+                galleryRenderBatch(galleryCurrentList);
+                galleryUpdateUI(galleryCurrentList.length);
+            }
+
+            function galleryShuffle(list) {
+                for (var i = list.length - 1; i > 0; i--) {
+                    var j = Math.floor(Math.random() * (i + 1));
+                    var tmp = list[i];
+                    list[i] = list[j];
+                    list[j] = tmp;
+                }
+            }
+
+            function galleryBuildPlayerFilter() {
+                var sel = document.getElementById('gallery-player-filter');
+                sel.innerHTML = '<option value="">All players</option>';
+                if (!galleryCurrentAlbum) return;
+                var names = new Set();
+                galleryPhotos.forEach(function(ph) {
+                    if (ph.tournament !== galleryCurrentAlbum) return;
+                    (ph.players || []).forEach(function(p) { names.add(p); });
+                });
+                Array.from(names).sort().forEach(function(n) {
+                    var o = document.createElement('option');
+                    o.value = n;
+                    o.textContent = n;
+                    sel.appendChild(o);
+                });
+                sel.value = galleryPlayerFilter;
+            }
+
+            function galleryRenderBatch(filtered) {
+                var grid = document.getElementById('gallery-grid');
+                var batch = filtered.slice(galleryRendered, galleryRendered + GALLERY_PAGE_SIZE);
+                batch.forEach(function(ph, i) {
+                    var idx = galleryRendered + i;
+                    var card = document.createElement('div');
+                    card.className = 'gallery-card';
+                    var players = ph.players || [];
+                    var playersLabel = players.length ? players.join(' · ') : '';
+                    card.innerHTML = '<img src="' + galleryThumb(ph.public_id, ph.tournament) + '" alt="' + galleryEsc(playersLabel || ph.tournament) + '" loading="lazy" />'
+                        + '<div class="gallery-card-info">'
+                        + '<div class="gallery-card-players">' + galleryEsc(playersLabel) + '</div>'
+                        + '</div>';
+                    card.addEventListener('click', (function(capturedIdx) {
+                        return function(e) {
+                            galleryOpenLb(capturedIdx, filtered);
+                        };
+                    })(idx));
+                    grid.appendChild(card);
+                });
+                galleryRendered += batch.length;
+            }
+
+            function galleryUpdateUI(n) {
+                var showAlbums = !galleryCurrentAlbum;
+                document.getElementById('gallery-albums').style.display = showAlbums ? 'grid' : 'none';
+                document.getElementById('gallery-back-btn').style.display = showAlbums ? 'none' : 'inline-block';
+                document.getElementById('gallery-player-filter').style.display = showAlbums ? 'none' : 'inline-block';
+                var titleEl = document.getElementById('gallery-album-title');
+                titleEl.style.display = showAlbums ? 'none' : 'block';
+                titleEl.textContent = showAlbums ? '' : galleryCurrentAlbum;
+                if (showAlbums) {
+                    document.getElementById('gallery-count').textContent = '';
+                    document.getElementById('gallery-empty').style.display = 'none';
+                    document.getElementById('gallery-loadmore-wrap').style.display = 'none';
+                    return;
+                }
+                document.getElementById('gallery-count').textContent = n + ' photo' + (n !== 1 ? 's' : '');
+                document.getElementById('gallery-empty').style.display = n === 0 ? 'block' : 'none';
+                document.getElementById('gallery-loadmore-wrap').style.display = galleryRendered < n ? 'block' : 'none';
+            }
+
+            function galleryEsc(s) {
+                return String(s).replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;').replace(/"/g, '&quot;');
+            }
+
+            function galleryOpenLb(index, list) {
+                galleryLbIndex = index;
+                galleryLbList = list || [];
+                galleryShowLb();
+                document.getElementById('gallery-lb').classList.add('open');
+                document.body.style.overflow = 'hidden';
+            }
+
+            function galleryCloseLb() {
+                document.getElementById('gallery-lb').classList.remove('open');
+                document.body.style.overflow = '';
+            }
+
+            function galleryShowLb() {
+                var ph = galleryLbList[galleryLbIndex];
+                var players = ph.players || [];
+                document.getElementById('gallery-lb-img').src = galleryFull(ph.public_id, ph.tournament);
+                document.getElementById('gallery-lb-img').alt = players.join(', ') || ph.tournament;
+                document.getElementById('gallery-lb-tourn').textContent = ph.tournament;
+                document.getElementById('gallery-lb-players').textContent = players.join(' · ');
+                document.getElementById('gallery-lb-counter').textContent = (galleryLbIndex + 1) + ' / ' + galleryLbList.length;
+                document.getElementById('gallery-lb-download').href = galleryDownload(ph.public_id, ph.tournament);
+            }
+
+            document.getElementById('gallery-lb-close').addEventListener('click', galleryCloseLb);
+            document.getElementById('gallery-lb-prev').addEventListener('click', function() { galleryLbIndex = (galleryLbIndex - 1 + galleryLbList.length) % galleryLbList.length; galleryShowLb(); });
+            document.getElementById('gallery-lb-next').addEventListener('click', function() { galleryLbIndex = (galleryLbIndex + 1) % galleryLbList.length; galleryShowLb(); });
+            document.getElementById('gallery-lb').addEventListener('click', function(e) { if (e.target === document.getElementById('gallery-lb')) galleryCloseLb(); });
+            document.addEventListener('keydown', function(e) {
+                if (!document.getElementById('gallery-lb').classList.contains('open')) return;
+                if (e.key === 'Escape') galleryCloseLb();
+                if (e.key === 'ArrowLeft') { galleryLbIndex = (galleryLbIndex - 1 + galleryLbList.length) % galleryLbList.length; galleryShowLb(); }
+                if (e.key === 'ArrowRight') { galleryLbIndex = (galleryLbIndex + 1) % galleryLbList.length; galleryShowLb(); }
+            });
+
+            document.getElementById('gallery-back-btn').addEventListener('click', function() {
+                galleryCurrentAlbum = '';
+                galleryPlayerFilter = '';
+                document.getElementById('gallery-grid').innerHTML = '';
+                galleryRendered = 0;
+                galleryUpdateUI(0);
+                window.scrollTo({ top: document.getElementById('gallery-albums').offsetTop - 60, behavior: 'smooth' });
+            });
+            document.getElementById('gallery-player-filter').addEventListener('change', function(e) {
+                galleryPlayerFilter = e.target.value;
+                galleryApplyAlbum();
+            });
+            document.getElementById('gallery-loadmore-btn').addEventListener('click', function() {
+                if (!galleryCurrentAlbum) return;
+                galleryRenderBatch(galleryCurrentList);
+                document.getElementById('gallery-loadmore-wrap').style.display = galleryRendered < galleryCurrentList.length ? 'block' : 'none';
+            });
+
@@ -0,0 +1,697 @@
+            function renderHistoryTable() {
+                const thead = document.getElementById('history-head');
+                const tbody = document.getElementById('history-body');
+
+                // Define column headers (excluding hidden _ columns)
+                const displayColumns = ['DATE', 'TOURNAMENT', 'SURFACE', 'ROUND', 'RANK', 'PLAYER', 'SCORE', 'OPP_RANK', 'OPPONENT'];
+                let headHtml = '<tr>';
+                displayColumns.forEach(col => {
+                    const headerText = col.replace('_', ' ');
+                    headHtml += `<th>${headerText}</th>`;
+                });
+                headHtml += '</tr>';
+                thead.innerHTML = headHtml;
+
+                // Set initial placeholder message
+                tbody.innerHTML = `<tr><td colspan="${displayColumns.length}" style="padding: 20px; color: #64748b;">Select a player to view their matches</td></tr>`;
+            }
+
+            let currentPlayerData = [];
+
+            function toggleFilterGroup(element) {
+                element.parentElement.classList.toggle('collapsed');
+            }
+
+            function toggleRankFilterGroup(element) {
+                const group = element.closest('.filter-group');
+                if (!group) return;
+                const row = group.closest('.rank-filter-last-row');
+                if (row) {
+                    row.querySelectorAll('.filter-group').forEach(g => {
+                        if (g !== group) g.classList.add('collapsed');
+                    });
+                }
+                group.classList.toggle('collapsed');
+            }
+
+            function getRowMatchType(row) {
+                const explicit = (row['MATCH_TYPE'] || row['matchType'] || '').toString().trim();
+                if (explicit) return explicit;
+
+                // Backward-compatible fallback for older rows without matchType.
+                const tournament = (row['TOURNAMENT'] || '').toString();
+                const isITF = tournament.includes('ITF') || tournament.includes('W15') || tournament.includes('W25') ||
+                              tournament.includes('W35') || tournament.includes('W50') || tournament.includes('W60') ||
+                              tournament.includes('W75') || tournament.includes('W100');
+                return isITF ? 'ITF' : 'WTA';
+            }
+
+            function getRowYear(row) {
+                const dateStr = (row['DATE'] || '').toString().trim();
+                const match = dateStr.match(/^(\d{4})/);
+                return match ? match[1] : '';
+            }
+
+            function getResultLabel(row, isWinner) {
+                const statusDesc = (row['_resultStatusDesc'] || '').toString().toLowerCase();
+                const scoreText = (row['SCORE'] || '').toString().toLowerCase();
+                const isRet = statusDesc.includes('retired') || statusDesc.includes('ret.') || scoreText.includes('ret.');
+                const isDef = statusDesc.includes('default') || statusDesc.includes('def.') || scoreText.includes('def.');
+
+                if (isWinner) {
+                    if (isRet) return 'Wins by RET';
+                    if (isDef) return 'Wins by DEF';
+                    return 'Wins';
+                }
+                if (isRet) return 'Losses by RET';
+                if (isDef) return 'Losses by DEF';
+                return 'Losses';
+            }
+
+            function isTeamEventRow(row) {
+                const matchType = (row['MATCH_TYPE'] || row['matchType'] || '').toString();
+                const category = (row['CATEGORY'] || row['tournamentCategory'] || '').toString();
+                const tournament = (row['TOURNAMENT'] || row['tournamentName'] || '').toString();
+                return (
+                    matchType === 'Fed/BJK Cup' ||
+                    category.includes('Fed/BJK Cup') ||
+                    tournament.includes('BJK') ||
+                    tournament.includes('Fed Cup')
+                );
+            }
+
+            function isDoublesHistoryRow(row) {
+                const wName = (row['_winnerName'] || '').toString();
+                const lName = (row['_loserName'] || '').toString();
+                return wName.includes('/') || lName.includes('/');
+            }
+
+            function getHistoryPerspective(row, selectedPlayer) {
+                const winnerNameRaw = (row['_winnerName'] || "").toString().toUpperCase();
+                const loserNameRaw = (row['_loserName'] || "").toString().toUpperCase();
+                const winnerNameNormalized = getDisplayName(winnerNameRaw).toUpperCase();
+                const loserNameNormalized = getDisplayName(loserNameRaw).toUpperCase();
+                const winnerCountry = (row['_winnerCountry'] || '').toString().trim().toUpperCase();
+                const loserCountry = (row['_loserCountry'] || '').toString().trim().toUpperCase();
+
+                // Always keep the ARG side in PLAYER when only one side is ARG.
+                if (winnerCountry === 'ARG' && loserCountry !== 'ARG') {
+                    return {
+                        isWinner: true,
+                        winnerNameRaw,
+                        loserNameRaw,
+                        winnerNameNormalized,
+                        loserNameNormalized
+                    };
+                }
+                if (loserCountry === 'ARG' && winnerCountry !== 'ARG') {
+                    return {
+                        isWinner: false,
+                        winnerNameRaw,
+                        loserNameRaw,
+                        winnerNameNormalized,
+                        loserNameNormalized
+                    };
+                }
+
+                // If both are ARG (or neither), preserve selected-player perspective when possible.
+                if (selectedPlayer && selectedPlayer !== '__ALL__') {
+                    if (winnerNameNormalized === selectedPlayer) {
+                        return {
+                            isWinner: true,
+                            winnerNameRaw,
+                            loserNameRaw,
+                            winnerNameNormalized,
+                            loserNameNormalized
+                        };
+                    }
+                    if (loserNameNormalized === selectedPlayer) {
+                        return {
+                            isWinner: false,
+                            winnerNameRaw,
+                            loserNameRaw,
+                            winnerNameNormalized,
+                            loserNameNormalized
+                        };
+                    }
+                }
+
+                return {
+                    isWinner: true,
+                    winnerNameRaw,
+                    loserNameRaw,
+                    winnerNameNormalized,
+                    loserNameNormalized
+                };
+            }
+
+            function getHistoryOpponentName(row, isWinner) {
+                if (row['_opponent'] !== undefined) return row['_opponent'];
+                const opponentName = isWinner ? (row['_loserName'] || '') : (row['_winnerName'] || '');
+                return opponentName ? getDisplayName(opponentName.toUpperCase()) : '';
+            }
+
+            function getRoundFilterLabel(row) {
+                const roundValue = (row['ROUND'] || '').toString().trim();
+                if (!roundValue) return '';
+                if (isTeamEventRow(row)) return roundValue.startsWith('Team - ') ? roundValue : `Team - ${roundValue}`;
+                return roundValue;
+            }
+
+            function scanHistoryFacets(playerMatches) {
+                // Extract unique values for each filter
+                const surfaces = new Set();
+                const rounds = new Set();
+                const results = new Set();
+                const years = new Set();
+                const tournaments = new Set();
+                const categories = new Set();
+                const opponents = new Set();
+                const opponentCountries = new Set();
+                const playerEntries = new Set();
+                const matchTypes = new Set();
+
+                const selectedPlayer = document.getElementById('playerHistorySelect').value.toUpperCase();
+
+                playerMatches.forEach(row => {
+                    if (isDoublesHistoryRow(row)) return;
+                    const perspective = getHistoryPerspective(row, selectedPlayer);
+                    const isWinner = perspective.isWinner;
+                    const resultLabel = getResultLabel(row, isWinner);
+                    if (resultLabel) results.add(resultLabel);
+
+                    // Surface
+                    if (row['SURFACE']) surfaces.add(row['SURFACE']);
+
+                    // Round (Team events are prefixed only in filter labels)
+                    const roundFilterLabel = getRoundFilterLabel(row);
+                    if (roundFilterLabel) rounds.add(roundFilterLabel);
+
+                    // Year
+                    const year = getRowYear(row);
+                    if (year) years.add(year);
+
+                    // Tournament
+                    if (row['TOURNAMENT']) tournaments.add(row['TOURNAMENT']);
+
+                    // Category
+                    const category = row['CATEGORY'] || '';
+                    if (category) categories.add(category);
+
+                    // Opponent
+                    const opponentName = getHistoryOpponentName(row, isWinner);
+                    if (opponentName) opponents.add(opponentName);
+
+                    // Opp. Country
+                    const opponentCountry = isWinner ? (row['_loserCountry'] || '') : (row['_winnerCountry'] || '');
+                    if (opponentCountry) opponentCountries.add(opponentCountry);
+
+                    // Player Entry
+                    const playerEntry = isWinner ? (row['_winnerEntry'] || '') : (row['_loserEntry'] || '');
+                    if (playerEntry) playerEntries.add(playerEntry);
+
+                    // Match Type (from CSV matchType column; fallback for legacy rows)
+                    const matchType = getRowMatchType(row);
+                    if (matchType) matchTypes.add(matchType);
+                });
+
+                const roundOrderForFilter = {
+                    'QR1': 1, 'QR2': 2, 'QR3': 3, 'QR4': 4,
+                    '1st Round': 5, '2nd Round': 6, '3rd Round': 7, '4th Round': 8, '5th Round': 9,
+                    'Quarter-finals': 10, 'Semi-finals': 11, 'Final': 12,
+                    'Team - Round Robin': 13, 'Team - Last 32': 14, 'Team - Last 16': 15,
+                    'Team - Quarter Finals': 16, 'Team - Semi Finals': 17, 'Team - Final': 18,
+                };
+                return {
+                    surfaces: Array.from(surfaces).sort(),
+                    rounds: Array.from(rounds).sort((a, b) => {
+                        const oa = roundOrderForFilter[a] ?? 99;
+                        const ob = roundOrderForFilter[b] ?? 99;
+                        return oa !== ob ? oa - ob : a.localeCompare(b);
+                    }),
+                    results: [
+                        'Wins',
+                        'Losses',
+                        'Wins by RET',
+                        'Losses by RET',
+                        'Wins by DEF',
+                        'Losses by DEF'
+                    ].filter(r => results.has(r)),
+                    years: Array.from(years).sort((a, b) => Number(b) - Number(a)),
+                    tournaments: Array.from(tournaments).sort((a, b) => a.localeCompare(b)),
+                    categories: Array.from(categories).sort((a, b) => a.localeCompare(b)),
+                    opponents: Array.from(opponents).sort(),
+                    opponentCountries: Array.from(opponentCountries).sort(),
+                    playerEntries: Array.from(playerEntries).sort(),
+                    matchTypes: Array.from(matchTypes).sort(),
+                };
+            }
+
+            // facets: precomputed by history_shards.py for a player's shard; scanned for "All".
+            function populateFilters(playerMatches, facets) {
+                const f = facets || scanHistoryFacets(playerMatches);
+                populateFilterOptions('filter-surface', f.surfaces || []);
+                populateFilterOptions('filter-round', f.rounds || []);
+                populateFilterOptions('filter-result', f.results || []);
+                populateFilterOptions('filter-year', ['Career', 'Last 52', ...(f.years || [])]);
+                populateFilterOptions('filter-tournament', f.tournaments || []);
+                populateFilterOptions('filter-category', f.categories || []);
+                populateOpponentSelect(f.opponents || []);
+                populateFilterOptions('filter-opponent-country', f.opponentCountries || []);
+                populateFilterOptions('filter-player-entry', f.playerEntries || []);
+                populateFilterOptions('filter-seed', ['Yes', 'No']);
+                populateFilterOptions('filter-match-type', f.matchTypes || []);
+            }
+
+            function populateFilterOptions(filterId, values) {
+                const container = document.getElementById(filterId);
+                let html = '';
+                values.forEach(value => {
+                    if (value) {
+                        html += `<div class="filter-option" data-value="${value}" onclick="toggleFilterOption(event, this)">${value}</div>`;
+                    }
+                });
+                container.innerHTML = html || '<div style="padding: 5px; color: #94a3b8; font-size: 11px;">No options</div>';
+            }
+
+            function populateOpponentSelect(opponents) {
+                const select = document.getElementById('filter-opponent-select');
+
+                // Destroy existing Select2 if it exists
+                if ($(select).data('select2')) {
+                    $(select).select2('destroy');
+                }
+
+                // Clear and populate options
+                let html = '<option value="">All Opponents</option>';
+                opponents.forEach(opponent => {
+                    if (opponent) {
+                        html += `<option value="${opponent}">${opponent}</option>`;
+                    }
+                });
+                select.innerHTML = html;
+
+                // Initialize Select2 with search
+                $(select).select2({
+                    placeholder: 'All Opponents',
+                    allowClear: true,
+                    width: '100%'
+                });
+
+                // Auto-apply filters when selection changes
+                $(select).off('change').on('change', function() {
+                    const selectedText = this.options[this.selectedIndex] ? this.options[this.selectedIndex].text : 'All Opponents';
+                    const rendered = this.nextElementSibling
+                        ? this.nextElementSibling.querySelector('.select2-selection__rendered')
+                        : null;
+                    if (rendered) {
+                        rendered.textContent = selectedText;
+                        rendered.title = selectedText;
+                    }
+                    applyHistoryFilters();
+                });
+            }
+
+            function toggleFilterOption(event, element) {
+                // Support Ctrl+Click for multi-select
+                if (!event.ctrlKey && !event.metaKey) {
+                    // Single click without Ctrl - deselect all others in this group first
+                    const siblings = element.parentElement.querySelectorAll('.filter-option');
+                    siblings.forEach(sib => {
+                        if (sib !== element) sib.classList.remove('selected');
+                    });
+                }
+
+                // Toggle this option
+                element.classList.toggle('selected');
+
+                // Auto-apply filters
+                applyHistoryFilters();
+            }
+
+            function getSelectedFilterValues(filterId) {
+                const container = document.getElementById(filterId);
+                const selectedOptions = container.querySelectorAll('.filter-option.selected');
+                return Array.from(selectedOptions).map(option => option.getAttribute('data-value'));
+            }
+
+            function updateHistoryCounter(matches, selectedPlayer) {
+                const counter = document.getElementById('history-wl-counter');
+                if (!counter) return;
+
+                const nonWO = (matches || []).filter(row => !['Walkover', 'Bye'].includes(row['_resultStatusDesc'] || ''));
+                const total = nonWO.length;
+                if (!selectedPlayer || total === 0) {
+                    counter.textContent = `Matches: ${total}`;
+                    return;
+                }
+                if (selectedPlayer === '__ALL__') {
+                    let wins = 0, argVsArg = 0;
+                    nonWO.forEach(row => {
+                        const wc = (row['_winnerCountry'] || '').toUpperCase();
+                        const lc = (row['_loserCountry'] || '').toUpperCase();
+                        if (wc === 'ARG' && lc === 'ARG') { argVsArg++; }
+                        else if (wc === 'ARG') { wins++; }
+                    });
+                    const losses = total - wins - argVsArg;
+                    const record = argVsArg > 0 ? `${wins}-${argVsArg}-${losses}` : `${wins}-${losses}`;
+                    counter.textContent = `Matches: ${total} (${record})`;
+                    return;
+                }
+
+                let wins = 0;
+                nonWO.forEach(row => {
+                    if (getHistoryPerspective(row, selectedPlayer).isWinner) wins += 1;
+                });
+                const losses = total - wins;
+                counter.textContent = `Matches: ${total} (${wins}-${losses})`;
+            }
+
+            function applyHistoryFilters() {
+                const selectedPlayer = document.getElementById('playerHistorySelect').value.toUpperCase();
+                if (!selectedPlayer) return;
+
+                // Get selected filter values
+                const selectedSurfaces = getSelectedFilterValues('filter-surface');
+                const selectedRounds = getSelectedFilterValues('filter-round');
+                const selectedResults = getSelectedFilterValues('filter-result');
+                const selectedYears = getSelectedFilterValues('filter-year');
+                const selectedTournaments = getSelectedFilterValues('filter-tournament');
+                const selectedCategories = getSelectedFilterValues('filter-category');
+                const selectedOpponent = document.getElementById('filter-opponent-select').value;
+                const selectedOpponentCountries = getSelectedFilterValues('filter-opponent-country');
+                const selectedPlayerEntries = getSelectedFilterValues('filter-player-entry');
+                const selectedSeeds = getSelectedFilterValues('filter-seed');
+                const selectedMatchTypes = getSelectedFilterValues('filter-match-type');
+
+                const asRankInput = document.getElementById('filter-as-rank');
+                const asRankModeEl = document.getElementById('filter-as-rank-mode');
+                const vsRankInput = document.getElementById('filter-vs-rank');
+                const vsRankModeEl = document.getElementById('filter-vs-rank-mode');
+                const asRankVal = asRankInput && asRankInput.value ? parseInt(asRankInput.value, 10) : null;
+                const asRankMode = asRankModeEl ? asRankModeEl.value : 'higher';
+                const vsRankVal = vsRankInput && vsRankInput.value ? parseInt(vsRankInput.value, 10) : null;
+                const vsRankMode = vsRankModeEl ? vsRankModeEl.value : 'higher';
+
+                // Filter the data (if nothing selected in a category, show all)
+                const filtered = currentPlayerData.filter(row => {
+                    if (isDoublesHistoryRow(row)) return false;
+                    const perspective = getHistoryPerspective(row, selectedPlayer);
+                    const isWinner = perspective.isWinner;
+
+                    // Surface filter
+                    if (selectedSurfaces.length > 0 && !selectedSurfaces.includes(row['SURFACE'] || '')) return false;
+
+                    // Round filter
+                    const roundFilterLabel = getRoundFilterLabel(row);
+                    if (selectedRounds.length > 0 && !selectedRounds.includes(roundFilterLabel)) return false;
+
+                    // Result filter
+                    const result = getResultLabel(row, isWinner);
+                    if (selectedResults.length > 0 && !selectedResults.includes(result)) return false;
+
+                    // Year filter
+                    const rowYear = getRowYear(row);
+                    if (selectedYears.length > 0 && !selectedYears.includes('Career')) {
+                        const wantLast52 = selectedYears.includes('Last 52');
+                        const otherYears = selectedYears.filter(y => y !== 'Last 52');
+                        let pass = false;
+                        if (wantLast52) {
+                            const today = new Date();
+                            const dayOfWeek = today.getDay() === 0 ? 6 : today.getDay() - 1; // Mon=0
+                            const weekStart = new Date(today);
+                            weekStart.setDate(today.getDate() - dayOfWeek);
+                            weekStart.setHours(0, 0, 0, 0);
+                            const cutoff = new Date(weekStart);
+                            cutoff.setDate(weekStart.getDate() - 51 * 7);
+                            const rowDate = new Date(row['DATE'] || '');
+                            if (!isNaN(rowDate) && rowDate >= cutoff) pass = true;
+                        }
+                        if (!pass && otherYears.length > 0 && otherYears.includes(rowYear)) pass = true;
+                        if (!pass) return false;
+                    }
+
+                    // Tournament filter
+                    if (selectedTournaments.length > 0 && !selectedTournaments.includes(row['TOURNAMENT'] || '')) return false;
+
+                    // Category filter
+                    const rowCategory = row['CATEGORY'] || '';
+                    if (selectedCategories.length > 0 && !selectedCategories.includes(rowCategory)) return false;
+
+                    // Opponent filter (single select from dropdown)
+                    if (selectedOpponent && getHistoryOpponentName(row, isWinner) !== selectedOpponent) return false;
+
+                    // Opp. Country filter
+                    const opponentCountry = isWinner ? (row['_loserCountry'] || '') : (row['_winnerCountry'] || '');
+                    if (selectedOpponentCountries.length > 0 && !selectedOpponentCountries.includes(opponentCountry)) return false;
+
+                    // Player Entry filter
+                    const playerEntry = isWinner ? (row['_winnerEntry'] || '') : (row['_loserEntry'] || '');
+                    if (selectedPlayerEntries.length > 0 && !selectedPlayerEntries.includes(playerEntry)) return false;
+
+                    // Seed filter
+                    const playerSeed = isWinner ? (row['_winnerSeed'] || '') : (row['_loserSeed'] || '');
+                    const hasSeed = playerSeed ? 'Yes' : 'No';
+                    if (selectedSeeds.length > 0 && !selectedSeeds.includes(hasSeed)) return false;
+
+                    // Match Type filter
+                    const matchType = getRowMatchType(row);
+                    if (selectedMatchTypes.length > 0 && !selectedMatchTypes.includes(matchType)) return false;
+
+                    // Rank filters
+                    if (asRankVal !== null) {
+                        const pr = parseInt(isWinner ? (row['_winnerRank'] || '') : (row['_loserRank'] || ''), 10);
+                        if (isNaN(pr)) return false;
+                        if (asRankMode === 'higher' && pr > asRankVal) return false;
+                        if (asRankMode === 'lower' && pr < asRankVal) return false;
+                    }
+                    if (vsRankVal !== null) {
+                        const vr = parseInt(isWinner ? (row['_loserRank'] || '') : (row['_winnerRank'] || ''), 10);
+                        if (isNaN(vr)) return false;
+                        if (vsRankMode === 'higher' && vr > vsRankVal) return false;
+                        if (vsRankMode === 'lower' && vr < vsRankVal) return false;
+                    }
+
+                    return true;
+                });
+
+                updateHistoryCounter(filtered, selectedPlayer);
+                renderFilteredMatches(filtered, selectedPlayer);
+            }
+
+            function clearHistoryFilters() {
+                // Remove selected class from all filter options
+                document.querySelectorAll('.filter-option.selected').forEach(option => {
+                    option.classList.remove('selected');
+                });
+                // Reset opponent select dropdown
+                $('#filter-opponent-select').val('').trigger('change');
+                // Reset rank filters
+                const asRankInput = document.getElementById('filter-as-rank');
+                const vsRankInput = document.getElementById('filter-vs-rank');
+                const asRankMode = document.getElementById('filter-as-rank-mode');
+                const vsRankMode = document.getElementById('filter-vs-rank-mode');
+                if (asRankInput) asRankInput.value = '';
+                if (vsRankInput) vsRankInput.value = '';
+                if (asRankMode) asRankMode.value = 'higher';
+                if (vsRankMode) vsRankMode.value = 'higher';
+                // Auto-apply filters (which will show all matches since nothing is selected)
+                applyHistoryFilters();
+            }
+
+            const HISTORY_PAGE_SIZE = 1000;
+            let _historyPagedMatches = [];
+            let _historyPagedPlayer = '';
+            let _historyCurrentPage = 1;
+
+            function renderFilteredMatches(matches, selectedPlayer) {
+                const tbody = document.getElementById('history-body');
+                const displayColumns = ['DATE', 'TOURNAMENT', 'SURFACE', 'ROUND', 'RANK', 'PLAYER', 'SCORE', 'OPP_RANK', 'OPPONENT'];
+                matches = (matches || []).filter(row => !isDoublesHistoryRow(row));
+                updateHistoryCounter(matches, selectedPlayer);
+
+                if (matches.length === 0) {
+                    tbody.innerHTML = `<tr><td colspan="${displayColumns.length}" style="padding: 20px;">No matches found with the selected filters.</td></tr>`;
+                    _updateHistoryPagination(0, 1, 1);
+                    return;
+                }
+
+                // Round priority (lower = higher in table)
+                const roundOrder = {
+                    'Final': 1, 'Semi-finals': 2, 'Quarter-finals': 3,
+                    '4th Round': 4, '3rd Round': 5, '2nd Round': 6, '1st Round': 7,
+                    'QR4': 8, 'QR3': 9, 'QR2': 10, 'QR1': 11,
+                    'Semi Finals': 12, 'Quarter Finals': 13,
+                    'Last 16': 14, 'Last 32': 15, 'Round Robin': 16
+                };
+                function getRoundOrder(round) {
+                    return roundOrder[round] || 99;
+                }
+
+                // Sort by date descending, then by round order ascending
+                matches.sort((a, b) => {
+                    const dateA = formatDate(a['DATE'] || '1900-01-01');
+                    const dateB = formatDate(b['DATE'] || '1900-01-01');
+                    if (dateA !== dateB) return dateB.localeCompare(dateA);
+                    return getRoundOrder(displayRound(a['ROUND'], a['TOURNAMENT'])) - getRoundOrder(displayRound(b['ROUND'], b['TOURNAMENT']));
+                });
+
+                _historyPagedMatches = matches;
+                _historyPagedPlayer = selectedPlayer;
+                _renderHistoryPage(1);
+            }
+
+            function _renderHistoryPage(page) {
+                const total = _historyPagedMatches.length;
+                const totalPages = Math.ceil(total / HISTORY_PAGE_SIZE);
+                _historyCurrentPage = Math.max(1, Math.min(page, totalPages));
+                const start = (_historyCurrentPage - 1) * HISTORY_PAGE_SIZE;
+                const pageMatches = _historyPagedMatches.slice(start, start + HISTORY_PAGE_SIZE);
+                const selectedPlayer = _historyPagedPlayer;
+
+                const parts = [];
+                for (let i = 0; i < pageMatches.length; i++) {
+                    const row = pageMatches[i];
+                    const perspective = getHistoryPerspective(row, selectedPlayer);
+                    const isWinner = perspective.isWinner;
+                    const playerNameRaw = isWinner ? perspective.winnerNameRaw : perspective.loserNameRaw;
+                    const playerDisplayName = getDisplayName(playerNameRaw);
+
+                    const rivalDisplayName = getHistoryOpponentName(row, isWinner);
+
+                    const pSeed = isWinner ? (row['_winnerSeed'] || '') : (row['_loserSeed'] || '');
+                    const pEntry = isWinner ? (row['_winnerEntry'] || '') : (row['_loserEntry'] || '');
+                    const rSeed = isWinner ? (row['_loserSeed'] || '') : (row['_winnerSeed'] || '');
+                    const rEntry = isWinner ? (row['_loserEntry'] || '') : (row['_winnerEntry'] || '');
+
+                    const rivalCountry = isWinner ? (row['_loserCountry'] || '') : (row['_winnerCountry'] || '');
+                    const opponentFlag = (rivalCountry && rivalCountry !== '-') ? countryFlagHistory(rivalCountry, false) : '';
+                    const opponentCell = `<span class="opponent-cell">${
+                        opponentFlag ? `<span class="opponent-flag">${opponentFlag}</span>` : ''
+                    }<span class="opponent-name">${buildPrefix(rSeed, rEntry) + rivalDisplayName}</span></span>`;
+
+                    const playerRank = (isWinner ? (row['_winnerRank'] || '') : (row['_loserRank'] || '')).toString();
+                    const oppRank = (isWinner ? (row['_loserRank'] || '') : (row['_winnerRank'] || '')).toString();
+                    const scoreText = isWinner ? (row['SCORE'] || '') : reverseScore(row['SCORE'] || '');
+                    const scoreClass = isWinner ? 'score-win' : 'score-loss';
+
+                    parts.push('<tr><td>', formatDate(row['DATE'] || ''),
+                        '</td><td>', row['TOURNAMENT'] || '',
+                        '</td><td>', row['SURFACE'] || '',
+                        '</td><td>', displayRound(row['ROUND'] || '', row['TOURNAMENT'] || ''),
+                        '</td><td>', playerRank,
+                        '</td><td>', buildPrefix(pSeed, pEntry) + playerDisplayName,
+                        '</td><td>', `<span class="${scoreClass}">${scoreText}</span>`,
+                        '</td><td>', oppRank,
+                        '</td><td>', opponentCell,
+                        '</td></tr>');
+                }
+                document.getElementById('history-body').innerHTML = parts.join('');
+                _updateHistoryPagination(total, _historyCurrentPage, totalPages);
+            }
+
+            function _updateHistoryPagination(total, currentPage, totalPages) {
+                const container = document.getElementById('history-pagination');
+                if (!container) return;
+                if (total <= HISTORY_PAGE_SIZE) {
+                    container.style.display = 'none';
+                    return;
+                }
+                const start = (currentPage - 1) * HISTORY_PAGE_SIZE + 1;
+                const end = Math.min(currentPage * HISTORY_PAGE_SIZE, total);
+                const prevDisabled = currentPage === 1 ? 'disabled' : '';
+                const nextDisabled = currentPage === totalPages ? 'disabled' : '';
+                container.style.display = 'flex';
+                container.innerHTML =
+                    `<button class="history-page-btn" ${prevDisabled} onclick="_renderHistoryPage(_historyCurrentPage - 1)">&#9664; Prev</button>` +
+                    `<span>${start}–${end} of ${total}</span>` +
+                    `<button class="history-page-btn" ${nextDisabled} onclick="_renderHistoryPage(_historyCurrentPage + 1)">Next &#9654;</button>`;
+            }
+
+            async function filterHistoryByPlayer() {
+                const selectedPlayer = document.getElementById('playerHistorySelect').value.toUpperCase();
+                const tbody = document.getElementById('history-body');
+                const displayColumns = ['DATE', 'TOURNAMENT', 'SURFACE', 'ROUND', 'RANK', 'PLAYER', 'SCORE', 'OPP_RANK', 'OPPONENT'];
+
+                if (selectedPlayer === '__ALL__') {
+                    tbody.innerHTML = `<tr><td colspan="${displayColumns.length}" style="padding: 20px; color: #64748b;">Loading match history...</td></tr>`;
+                    try {
+                        await ensureHistoryDataLoaded();
+                    } catch (err) {
+                        console.error('Failed to load match history:', err);
+                        tbody.innerHTML = `<tr><td colspan="${displayColumns.length}" style="padding: 20px;">Failed to load match history. Please refresh and try again.</td></tr>`;
+                        updateHistoryCounter([], '__ALL__');
+                        return;
+                    }
+                    const allFiltered = historyData.filter(row => !isDoublesHistoryRow(row));
+                    if (allFiltered.length === 0) {
+                        tbody.innerHTML = `<tr><td colspan="${displayColumns.length}" style="padding: 20px;">No matches found.</td></tr>`;
+                        updateHistoryCounter([], '__ALL__');
+                        return;
+                    }
+                    currentPlayerData = allFiltered;
+                    populateFilters(allFiltered);
+                    renderFilteredMatches(allFiltered, '__ALL__');
+                    return;
+                }
+
+                if (!selectedPlayer) {
+                    currentPlayerData = [];
+                    ['filter-surface', 'filter-round', 'filter-result', 'filter-year', 'filter-tournament', 'filter-category', 'filter-opponent-country', 'filter-player-entry', 'filter-seed', 'filter-match-type']
+                        .forEach(id => {
+                            const el = document.getElementById(id);
+                            if (el) el.innerHTML = '';
+                        });
+                    const asRankInput = document.getElementById('filter-as-rank');
+                    const vsRankInput = document.getElementById('filter-vs-rank');
+                    const asRankMode = document.getElementById('filter-as-rank-mode');
+                    const vsRankMode = document.getElementById('filter-vs-rank-mode');
+                    if (asRankInput) asRankInput.value = '';
+                    if (vsRankInput) vsRankInput.value = '';
+                    if (asRankMode) asRankMode.value = 'higher';
+                    if (vsRankMode) vsRankMode.value = 'higher';
+                    const oppSelect = document.getElementById('filter-opponent-select');
+                    if (oppSelect) {
+                        if ($(oppSelect).data('select2')) {
+                            $(oppSelect).select2('destroy');
+                        }
+                        oppSelect.innerHTML = '<option value="">All Opponents</option>';
+                    }
+                    tbody.innerHTML = `<tr><td colspan="${displayColumns.length}" style="padding: 20px;">Select a player...</td></tr>`;
+                    updateHistoryCounter([], '');
+                    return;
+                }
+
+                tbody.innerHTML = `<tr><td colspan="${displayColumns.length}" style="padding: 20px; color: #64748b;">Loading match history...</td></tr>`;
+                // The shard only holds rows where she is the rendered PLAYER side (the ARG-side
+                // view); nationality-switch rows where she is the OPPONENT stay in ALL only.
+                let shard;
+                try {
+                    await Promise.all([ensureTabDataLoaded('history'), ensureTabDataLoaded('names')]);
+                    shard = await loadHistoryShard(selectedPlayer);
+                } catch (err) {
+                    console.error('Failed to load match history:', err);
+                    tbody.innerHTML = `<tr><td colspan="${displayColumns.length}" style="padding: 20px;">Failed to load match history. Please refresh and try again.</td></tr>`;
+                    updateHistoryCounter([], selectedPlayer);
+                    return;
+                }
+                if (document.getElementById('playerHistorySelect').value.toUpperCase() !== selectedPlayer) return;
+
+                const filtered = shard.rows;
+
+                if (filtered.length === 0) {
+                    tbody.innerHTML = `<tr><td colspan="${displayColumns.length}" style="padding: 20px;">No matches found for this player.</td></tr>`;
+                    updateHistoryCounter([], selectedPlayer);
+                    return;
+                }
+
+                // Store current player data for filtering
+                currentPlayerData = filtered;
+
+                // Populate filters with this player's precomputed facets
+                populateFilters(filtered, shard.facets);
+
+                // Render all matches (filters start with all checked)
+                renderFilteredMatches(filtered, selectedPlayer);
+            }
+
@@ -0,0 +1,111 @@
+            let showArgOnly = false;
+            function toggleRankingsScope() {
+                showArgOnly = !showArgOnly;
+                const btn = document.getElementById('rankings-toggle-btn');
+                const view = document.getElementById('view-rankings');
+                if (btn) btn.textContent = showArgOnly ? 'Show ALL' : 'Show ARG';
+                if (view) view.classList.toggle('rankings-show-all', !showArgOnly);
+                filterRankings();
+            }
+            function filterRankings() {
+                const q = document.getElementById('rankings-search').value.toLowerCase();
+                document.querySelectorAll('#rankings-body tr').forEach(row => {
+                    const text = row.textContent.toLowerCase();
+                    const nat = row.getAttribute('data-country') || (row.children[2] ? row.children[2].textContent.trim().toUpperCase() : '');
+                    const matchesSearch = text.includes(q);
+                    const matchesCountry = !showArgOnly || nat === 'ARG';
+                    row.classList.toggle('hidden', !(matchesSearch && matchesCountry));
+                });
+            }
+            // One small columnar JSON shard per ranking week (see rankings_shards.py);
+            // the week -> hash manifest comes with the 'rankings' tab payload.
+            const _rankingWeekCache = {};
+            function _shardToRows(shard) {
+                const rows = [];
+                for (let i = 0; i < shard.r.length; i++) {
+                    rows.push({ r: shard.r[i], pts: shard.p[i], n: shard.n[i], c: shard.c[i], d: shard.d[i] });
+                }
+                return rows;
+            }
+            function _loadRankingWeek(dateStr) {
+                if (_rankingWeekCache[dateStr]) return _rankingWeekCache[dateStr];
+                _rankingWeekCache[dateStr] = ensureTabDataLoaded('rankings')
+                    .then(() => {
+                        const hash = rankingWeeks[dateStr];
+                        if (!hash) return null;
+                        return fetch('{{ rankings_shards_url_prefix }}' + dateStr + '.' + hash + '.json').then(r => {
+                            if (!r.ok) throw new Error('HTTP ' + r.status);
+                            return r.json();
+                        });
+                    })
+                    .then(shard => shard ? _shardToRows(shard) : null)
+                    .catch(err => {
+                        console.error('Failed to load rankings for ' + dateStr + ':', err);
+                        delete _rankingWeekCache[dateStr];
+                        throw err;
+                    });
+                return _rankingWeekCache[dateStr];
+            }
+            function _renderRankingRows(players) {
+                const tbody = document.getElementById('rankings-body');
+                let html = '';
+                players.forEach(p => {
+                    const dob = (p.d || '').split('T')[0];
+                    const name = (p.n || '').toLowerCase().replace(/(^|\s)(\S)/g, (_, b, c) => b + c.toUpperCase());
+                    const isArg = (p.c || '').toUpperCase() === 'ARG';
+                    html += `<tr class="${isArg ? 'arg-player-row' : ''}" data-country="${(p.c||'').toUpperCase()}"><td>${p.r || ''}</td><td style="text-align:left;font-weight:bold;">${countryFlag(p.c || '', false)} ${name}</td><td>${p.pts || ''}</td><td>${dob}</td></tr>`;
+                });
+                tbody.innerHTML = html;
+                filterRankings();
+            }
+            const _rankingsDatesIndex = {{ rankings_dates_index_json }};
+            const _rankingMonthNames = ['Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec'];
+            function _populateRankingMonths(year, selectMonth, selectDay) {
+                const sel = document.getElementById('rankings-month-select');
+                const months = Object.keys(_rankingsDatesIndex[year] || {}).map(Number).sort((a,b)=>a-b);
+                const chosenM = (selectMonth != null && months.includes(+selectMonth)) ? +selectMonth : months[months.length-1];
+                sel.innerHTML = months.map(m => {
+                    const isSel = (m === chosenM) ? ' selected' : '';
+                    return `<option value="${m}"${isSel}>${_rankingMonthNames[m-1]}</option>`;
+                }).join('');
+                _populateRankingDays(year, chosenM, selectDay);
+            }
+            function _populateRankingDays(year, monthNum, selectDay) {
+                const sel = document.getElementById('rankings-day-select');
+                const days = ((_rankingsDatesIndex[year] || {})[String(monthNum)] || []).slice().sort((a,b)=>a-b);
+                const chosenD = (selectDay != null && days.includes(+selectDay)) ? +selectDay : days[days.length-1];
+                sel.innerHTML = days.map(d => {
+                    const isSel = (d === chosenD) ? ' selected' : '';
+                    return `<option value="${d}"${isSel}>${d}</option>`;
+                }).join('');
+            }
+            function onRankingYearChange(year) {
+                _populateRankingMonths(year, null, null);
+            }
+            function onRankingMonthChange() {
+                const year = document.getElementById('rankings-year-select').value;
+                const month = +document.getElementById('rankings-month-select').value;
+                _populateRankingDays(year, month, null);
+            }
+            function applyRankingSelection() {
+                const year = document.getElementById('rankings-year-select').value;
+                const month = document.getElementById('rankings-month-select').value;
+                const day = document.getElementById('rankings-day-select').value;
+                if (!year || !month || !day) return;
+                const mm = month.toString().padStart(2,'0');
+                const dd = day.toString().padStart(2,'0');
+                switchRankingWeek(`${year}-${mm}-${dd}`);
+            }
+            function switchRankingWeek(dateStr) {
+                const controls = ['rankings-year-select','rankings-month-select','rankings-day-select','rankings-load-btn'].map(id => document.getElementById(id));
+                controls.forEach(el => { if(el) { el.disabled = true; el.style.opacity = '0.5'; } });
+                _loadRankingWeek(dateStr)
+                    .then(players => {
+                        if (players) _renderRankingRows(players);
+                    })
+                    .catch(() => {})
+                    .finally(() => {
+                        controls.forEach(el => { if(el) { el.disabled = false; el.style.opacity = '1'; } });
+                    });
+            }
+            _populateRankingMonths('{{ rankings_latest_year_str }}', {{ rankings_latest_month }}, {{ rankings_latest_day }});
@@ -0,0 +1,108 @@
+            // Road to GS: the per-player ledgers (countable results, drop dates and
+            // best-18 totals at each GS cutoff) are computed by road_to_gs.py at build
+            // time; the tab payload only carries the {PLAYER: hash} index.
+            const _rtgsLedgerPromises = {};
+            function loadRoadToGSLedger(selectedPlayer) {
+                const digest = roadtogsLedgers[selectedPlayer];
+                if (!digest) return Promise.resolve(null);
+                if (!_rtgsLedgerPromises[digest]) {
+                    _rtgsLedgerPromises[digest] = fetch('{{ roadtogs_url_prefix }}' + digest + '.json')
+                        .then(r => {
+                            if (!r.ok) throw new Error('HTTP ' + r.status);
+                            return r.json();
+                        })
+                        .catch(err => {
+                            delete _rtgsLedgerPromises[digest];
+                            throw err;
+                        });
+                }
+                return _rtgsLedgerPromises[digest];
+            }
+
+            function updateGSCutoffTables(ledger) {
+                const cutoffs = (ledger && ledger.cutoffs) || {};
+                gsCutoffs.forEach(gs => {
+                    ['q','md'].forEach(type => {
+                        const accEl = document.getElementById('gs-acc-'+type+'-'+gs.id);
+                        const estEl = document.getElementById('gs-est-'+type+'-'+gs.id);
+                        if (!accEl||!estEl) return;
+                        const c = ledger ? (cutoffs[gs.id] || {})[type] : null;
+                        if (!c) { accEl.textContent='-'; estEl.textContent='-'; estEl.style.color=''; estEl.style.fontWeight=''; return; }
+                        accEl.textContent = c.points;
+                        const est = c.est;
+                        estEl.textContent = est;
+                        estEl.style.fontWeight = 'bold';
+                        estEl.style.color = est > 0 ? '#1a7a1a' : est >= -10 ? '#b8860b' : est >= -25 ? '#cc5500' : '#cc0000';
+                    });
+                });
+            }
+
+            function initRoadToGS() {
+                const select = document.getElementById('roadtogsPlayerSelect');
+                if (!select) return;
+                $(select).select2({ placeholder: 'Select Player...', allowClear: true, width: '100%' });
+                $(select).on('change', renderRoadToGS);
+            }
+
+            async function renderRoadToGS() {
+                const selectedPlayer = document.getElementById('roadtogsPlayerSelect').value.toUpperCase();
+                const tbody = document.getElementById('roadtogs-body');
+
+                if (!selectedPlayer) {
+                    tbody.innerHTML = '<tr><td colspan="5" style="padding: 20px; color: #64748b;">Select a player to view their results</td></tr>';
+                    document.getElementById('roadtogs-points-total').textContent = 'Points: 0';
+                    updateGSCutoffTables(null);
+                    return;
+                }
+
+                tbody.innerHTML = '<tr><td colspan="5" style="padding: 20px; color: #64748b;">Loading match history...</td></tr>';
+                let ledger;
+                try {
+                    await ensureTabDataLoaded('roadtogs');
+                    ledger = await loadRoadToGSLedger(selectedPlayer);
+                } catch (err) {
+                    console.error('Failed to load Road to GS ledger:', err);
+                    tbody.innerHTML = '<tr><td colspan="5" style="padding: 20px;">Failed to load match history. Please refresh and try again.</td></tr>';
+                    document.getElementById('roadtogs-points-total').textContent = 'Points: 0';
+                    updateGSCutoffTables(null);
+                    return;
+                }
+                if (document.getElementById('roadtogsPlayerSelect').value.toUpperCase() !== selectedPlayer) return;
+
+                const countable = (ledger && ledger.countable) || [];
+                const nonCountable = (ledger && ledger.nonCountable) || [];
+                document.getElementById('roadtogs-points-total').textContent = 'Points: ' + ((ledger && ledger.points) || 0);
+                updateGSCutoffTables(ledger);
+
+                if (countable.length === 0 && nonCountable.length === 0) {
+                    tbody.innerHTML = '<tr><td colspan="5" style="padding: 20px; color: #64748b;">No tournaments found in the last 52 weeks.</td></tr>';
+                    return;
+                }
+
+                // Render table
+                const _today = new Date(); _today.setUTCHours(0,0,0,0);
+                const _in14 = new Date(_today); _in14.setUTCDate(_today.getUTCDate() + 14);
+                const _in28 = new Date(_today); _in28.setUTCDate(_today.getUTCDate() + 28);
+                function _dropStyle(dropDateStr) {
+                    if (!dropDateStr) return '';
+                    const d = new Date(dropDateStr);
+                    if (d <= _in14) return ' style="color:#cc0000;font-weight:bold;"';
+                    if (d <= _in28) return ' style="color:#cc5500;font-weight:bold;"';
+                    return '';
+                }
+                const parts = [];
+                countable.forEach(t => {
+                    parts.push(`<tr><td>${t.date}</td><td>${t.tournament}</td><td>${t.roundDisplay}</td><td>${t.points}</td><td${_dropStyle(t.dropDate)}>${t.dropDate}</td></tr>`);
+                });
+                if (nonCountable.length > 0) {
+                    parts.push('<tr class="roadtogs-separator"><td colspan="5">NON-COUNTABLE TOURNAMENTS</td></tr>');
+                    nonCountable.forEach(t => {
+                        parts.push(`<tr><td>${t.date}</td><td>${t.tournament}</td><td>${t.roundDisplay}</td><td>${t.points}</td><td${_dropStyle(t.dropDate)}>${t.dropDate}</td></tr>`);
+                    });
+                }
+
+                tbody.innerHTML = parts.join('');
+            }
+
+            document.addEventListener('DOMContentLoaded', initRoadToGS);
+
@@ -0,0 +1,7 @@
+            function filter() {
+                const q = document.getElementById('s').value.toLowerCase();
+                document.querySelectorAll('#tb tr').forEach(row => {
+                    const matches = row.getAttribute('data-name').includes(q);
+                    row.classList.toggle('hidden', !matches);
+                });
+            }
@@ -1,19 +1,37 @@
 """Compute tournament strength for WTA tournaments."""
 
-import csv
 import json
-import math
 import os
-import re
 import requests
+import threading
 import time
-import unicodedata
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 
+import numpy as np
+
+from names import normalize_key
+from rankings_store import open_store, LazyWeekMapping
+from week_index import WeekIndex, monday_of
+from wta_matches_cache import fetch_tournament_matches
+
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(BASE_DIR, "data")
 RANKINGS_CSV = os.path.join(DATA_DIR, "wta_rankings_20_29.csv")
 TSTRENGTH_CACHE = os.path.join(DATA_DIR, "tstrength_cache.json")
+# Append-only checkpoint log: one computed cache entry per line, replayed on the
+# next run if a build is interrupted, folded into TSTRENGTH_CACHE at the end.
+TSTRENGTH_JOURNAL = os.path.join(DATA_DIR, "tstrength_cache.journal.jsonl")
+
+# Concurrent match fetching, shared token bucket over all workers.
+TSTRENGTH_FETCH_WORKERS = 6
+TSTRENGTH_REQUESTS_PER_SECOND = 3.0
+TSTRENGTH_REQUEST_BURST = 3
+
+# Distribution stats stored per draw next to HM/GM (entry["stats"]).
+TSTRENGTH_TOP_N = 8
+TSTRENGTH_PERCENTILES = (25, 75)
+TSTRENGTH_TOP_RANK_CUTOFF = 100
 
 _WTA_API_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
@@ -78,21 +96,10 @@ _REGION_MAP = {
 
 def _normalize_name(name):
     """Normalize a player name for matching: strip accents, uppercase, collapse spaces."""
-    # Strip accents/diacritics
-    nfkd = unicodedata.normalize("NFKD", name)
-    ascii_name = "".join(c for c in nfkd if not unicodedata.combining(c))
-    # Uppercase and collapse multiple spaces
-    return re.sub(r"\s+", " ", ascii_name.upper().strip())
-
+    return normalize_key(name)
 
-def _get_monday(date_str):
-    """Get the Monday of the week for a date string (YYYY-MM-DD)."""
-    dt = datetime.strptime(date_str[:10], "%Y-%m-%d")
-    monday = dt - timedelta(days=dt.weekday())
-    return monday.strftime("%Y-%m-%d")
 
-
-def _resolve_ranking_week(start_date, draw, rankings_index, available_weeks):
+def _resolve_ranking_week(start_date, draw, rankings_index, week_index):
     """Resolve the ranking week to use for a tournament draw.
 
     Qualifying often starts on Sunday, so using the tournament's Monday start date
@@ -103,45 +110,52 @@ def _resolve_ranking_week(start_date, draw, rankings_index, available_weeks):
     try:
         dt = datetime.strptime((start_date or "")[:10], "%Y-%m-%d")
     except Exception:
-        return _get_monday(start_date)
+        return monday_of(start_date)
 
     if draw == "Q":
         dt = dt - timedelta(days=1)
 
-    desired_week = (dt - timedelta(days=dt.weekday())).strftime("%Y-%m-%d")
+    desired_week = monday_of(dt)
     if rankings_index.get(desired_week):
         return desired_week
 
-    for week in reversed(available_weeks):
-        if week <= desired_week and rankings_index.get(week):
+    i = week_index.position_on_or_before(desired_week)
+    while i >= 0:
+        week = week_index.weeks[i]
+        if rankings_index.get(week):
             return week
+        i -= 1
+
+    return week_index.latest() or desired_week
+
 
-    return available_weeks[-1] if available_weeks else desired_week
+def _rankings_rows_to_index(rows):
+    week_index = {}
+    for _pid, player, _country, _dob, rank, _points in rows:
+        if rank is None:
+            continue
+        norm = _normalize_name(player)
+        week_index[norm] = rank
+        # Add partial name (first + first-last) as fallback if 3+ words
+        parts = norm.split()
+        if len(parts) >= 3:
+            partial = parts[0] + " " + parts[1]
+            if partial not in week_index:
+                week_index[partial] = rank
+    return week_index
 
 
 def _load_rankings_index():
-    """Load all rankings into a dict: {week_date: {normalized_name: rank}}.
+    """Load all rankings into a dict-like: {week_date: {normalized_name: rank}}.
 
+    Weeks are read from the columnar rankings store and indexed on first access.
     Also builds partial-name entries (first name + first last name) as fallback
     for players with multiple last names (e.g. "Irene Burillo" for "Irene Burillo Escorihuela").
     """
-    index = {}
-    with open(RANKINGS_CSV, encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            week = row["week_date"]
-            if week not in index:
-                index[week] = {}
-            norm = _normalize_name(row["player"])
-            rank = int(row["rank"])
-            index[week][norm] = rank
-            # Add partial name (first + first-last) as fallback if 3+ words
-            parts = norm.split()
-            if len(parts) >= 3:
-                partial = parts[0] + " " + parts[1]
-                if partial not in index[week]:
-                    index[week][partial] = rank
-    return index
+    store = open_store(RANKINGS_CSV)
+    if store is None:
+        return {}
+    return LazyWeekMapping([store], _rankings_rows_to_index)
 
 
 def _fetch_tournaments(year):
@@ -252,12 +266,8 @@ def _fetch_main_draw_players(tournament_id, year="2025"):
 
 def _fetch_tournament_matches(tournament_id, year="2025"):
     """Fetch tournament matches from WTA API (includes main draw + qualifying)."""
-    url = f"https://api.wtatennis.com/tennis/tournaments/{tournament_id}/{year}/matches"
     try:
-        r = requests.get(url, headers=_WTA_API_HEADERS, timeout=15)
-        r.raise_for_status()
-        data = r.json()
-        return data.get("matches", []) or []
+        return fetch_tournament_matches(tournament_id, year, headers=_WTA_API_HEADERS)
     except Exception as e:
         print(f"  Error fetching matches for {tournament_id}: {e}")
         return []
@@ -290,19 +300,190 @@ def _extract_draw_players(matches, draw_level_type):
     return sorted(all_players), participants_locked
 
 
-def _harmonic_mean(values):
-    """Compute harmonic mean of a list of positive numbers."""
-    if not values or any(v <= 0 for v in values):
-        return 0
-    return len(values) / sum(1.0 / v for v in values)
+def _strength_stats(rank_lists):
+    """HM, GM and distribution stats for a batch of draws, vectorized over all of them.
+
+    rank_lists are non-empty lists of positive ranks. Returns one dict per list:
+    hm, gm and stats (median, top-N mean, percentile band, top-100 share).
+    """
+    if not rank_lists:
+        return []
+    counts = np.array([len(r) for r in rank_lists])
+    # Ragged lists -> NaN-padded matrix, each row sorted ascending (best rank first).
+    grid = np.full((len(rank_lists), counts.max()), np.nan)
+    rows = np.repeat(np.arange(len(rank_lists)), counts)
+    cols = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    grid[rows, cols] = np.concatenate([np.asarray(r, dtype=float) for r in rank_lists])
+    grid.sort(axis=1)
+
+    hm = counts / np.nansum(1.0 / grid, axis=1)
+    gm = np.exp(np.nanmean(np.log(grid), axis=1))
+    median = np.nanmedian(grid, axis=1)
+    top_n = np.nanmean(grid[:, :TSTRENGTH_TOP_N], axis=1)
+    bands = np.nanpercentile(grid, TSTRENGTH_PERCENTILES, axis=1)
+    top_share = np.sum(grid <= TSTRENGTH_TOP_RANK_CUTOFF, axis=1) / counts
+
+    results = []
+    for i in range(len(rank_lists)):
+        stats = {"median": round(float(median[i]), 1), f"top{TSTRENGTH_TOP_N}": round(float(top_n[i]), 1)}
+        for pct, band in zip(TSTRENGTH_PERCENTILES, bands):
+            stats[f"p{pct}"] = round(float(band[i]), 1)
+        stats[f"top{TSTRENGTH_TOP_RANK_CUTOFF}Share"] = round(float(top_share[i]), 3)
+        results.append({"hm": round(float(hm[i]), 1), "gm": round(float(gm[i]), 1), "stats": stats})
+    return results
 
 
-def _geometric_mean(values):
-    """Compute geometric mean of a list of positive numbers."""
-    if not values or any(v <= 0 for v in values):
+def _apply_strength_stats(entries):
+    """Fill hm/gm/stats on cache entries that have player rankings. Returns how many were set."""
+    ranked = [
+        e for e in entries
+        if isinstance(e.get("rankings"), list) and e["rankings"] and all(int(r) > 0 for r in e["rankings"])
+    ]
+    for entry, values in zip(ranked, _strength_stats([e["rankings"] for e in ranked])):
+        entry.update(values)
+    return len(ranked)
+
+
+class _TokenBucket:
+    """Thread-safe token bucket: `rate` requests per second, bursts of up to `burst`."""
+
+    def __init__(self, rate, burst):
+        self.rate = max(0.001, float(rate))
+        self.capacity = max(1.0, float(burst))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def _normalize_cache_entry(entry):
+    """Canonical draw code ("MD"/"Q") on a cached entry; returns its "year_id_draw" key."""
+    draw = (entry.get("draw") or entry.get("drawType") or "MD").strip().upper()
+    if draw in {"M", "MAIN"}:
+        draw = "MD"
+    if draw in {"QUALY", "QUAL", "Q"}:
+        draw = "Q"
+    entry["draw"] = draw
+    year = entry.get("year", "2025")
+    return f"{year}_{entry['id']}_{draw}"
+
+
+def _replay_journal(cache):
+    """Apply checkpointed entries from an interrupted run on top of cache. Returns the count."""
+    if not os.path.exists(TSTRENGTH_JOURNAL):
         return 0
-    log_sum = sum(math.log(v) for v in values)
-    return math.exp(log_sum / len(values))
+    replayed = 0
+    with open(TSTRENGTH_JOURNAL, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # torn last line from a killed run
+            if not isinstance(entry, dict) or "id" not in entry or _is_ignored_tournament(entry.get("name", "")):
+                continue
+            cache[_normalize_cache_entry(entry)] = entry
+            replayed += 1
+    return replayed
+
+
+def _append_journal(journal, entries):
+    for entry in entries:
+        journal.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    journal.flush()
+    os.fsync(journal.fileno())
+
+
+def _compact_cache(cache):
+    """Write the full cache atomically, then drop the journal it now contains."""
+    filtered_cache_values = [e for e in cache.values() if not _is_ignored_tournament(e.get("name", ""))]
+    tmp = TSTRENGTH_CACHE + ".tmp"
+    # One entry per line: rank arrays stay on a single line (small, diff-friendly).
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write("[\n")
+        f.write(",\n".join(json.dumps(e, separators=(",", ":")) for e in filtered_cache_values))
+        f.write("\n]\n")
+    os.replace(tmp, TSTRENGTH_CACHE)
+    if os.path.exists(TSTRENGTH_JOURNAL):
+        os.remove(TSTRENGTH_JOURNAL)
+
+
+def _build_draw_entries(t, needs, matches, rankings_index, week_index, unranked_players):
+    """Cache entries for the requested draws of one tournament, given its matches.
+
+    hm/gm/stats are left at 0 here; the caller computes them for all draws of a
+    run in one _apply_strength_stats batch.
+    """
+    tid = t["id"]
+    yr = t["year"]
+    surface = t.get("surface", "")
+    country = t.get("country", "")
+    region = _REGION_MAP.get(country, country)
+
+    entries = []
+    for draw in ("MD", "Q"):
+        if draw not in needs:
+            continue
+        ranking_week = _resolve_ranking_week(t["startDate"], draw, rankings_index, week_index)
+        week_rankings = rankings_index.get(ranking_week, {})
+        draw_level = "M" if draw == "MD" else "Q"
+        players, participants_locked = _extract_draw_players(matches, draw_level)
+        if (not players) or (not participants_locked):
+            entries.append({
+                "id": tid, "name": t["name"], "city": t["city"],
+                "level": t["level"], "startDate": t["startDate"],
+                "surface": surface,
+                "country": country,
+                "region": region,
+                "year": yr,
+                "draw": draw,
+                "participantsLocked": False,
+                "rankings": [], "hm": 0, "gm": 0, "playerCount": 0
+            })
+            continue
+
+        player_ranks = []
+        for p in players:
+            norm_p = _normalize_name(p)
+            rank = week_rankings.get(norm_p)
+            if rank is None and len(norm_p.split()) >= 3:
+                partial = norm_p.split()[0] + " " + norm_p.split()[1]
+                rank = week_rankings.get(partial)
+            if rank is None:
+                rank = DEFAULT_RANK
+                unranked_players[p] = unranked_players.get(p, [])
+                unranked_players[p].append(f"{t['name']} ({draw})")
+            player_ranks.append(rank)
+
+        player_ranks.sort()
+        entries.append({
+            "id": tid,
+            "name": t["name"],
+            "city": t["city"],
+            "level": t["level"],
+            "startDate": t["startDate"],
+            "surface": surface,
+            "country": country,
+            "region": region,
+            "year": yr,
+            "draw": draw,
+            "participantsLocked": True,
+            "rankings": player_ranks,
+            "hm": 0,
+            "gm": 0,
+            "playerCount": len(player_ranks),
+        })
+    return entries
 
 
 def build_tstrength_data(from_year=None, full_backfill=False):
@@ -317,6 +498,11 @@ def build_tstrength_data(from_year=None, full_backfill=False):
     Note: If a tournament was previously cached with 0 players (e.g., API data
     temporarily unavailable), it will be retried when it appears in the recent
     window again.
+
+    Matches are fetched by TSTRENGTH_FETCH_WORKERS threads behind a token bucket;
+    every computed entry is appended to TSTRENGTH_JOURNAL right away, so an
+    interrupted run resumes where it stopped. The journal is compacted into
+    TSTRENGTH_CACHE at the end.
     """
     def _needs_refresh(cached_entry):
         if not cached_entry:
@@ -343,17 +529,22 @@ def build_tstrength_data(from_year=None, full_backfill=False):
             for entry in cached_list:
                 if _is_ignored_tournament(entry.get("name", "")):
                     continue
-                draw = (entry.get("draw") or entry.get("drawType") or "MD").strip().upper()
-                if draw in {"M", "MAIN"}:
-                    draw = "MD"
-                if draw in {"QUALY", "QUAL", "Q"}:
-                    draw = "Q"
-                entry["draw"] = draw
-                year = entry.get("year", "2025")
-                cache_key = f"{year}_{entry['id']}_{draw}"
-                cache[cache_key] = entry
+                cache[_normalize_cache_entry(entry)] = entry
         except Exception:
             pass
+    # Resume: entries checkpointed by an interrupted run count as cached.
+    replayed = 0
+    try:
+        replayed = _replay_journal(cache)
+        if replayed:
+            print(f"Resuming T-Strength build: {replayed} entries replayed from journal")
+    except Exception as e:
+        print(f"Warning: could not read T-Strength journal: {e}")
+
+    # Entries cached before distribution stats existed get them in one batch.
+    backfilled = _apply_strength_stats([e for e in cache.values() if "stats" not in e])
+    if backfilled:
+        print(f"T-Strength: computed distribution stats for {backfilled} cached draws")
 
     today = datetime.now()
     today_str = today.strftime("%Y-%m-%d")
@@ -425,85 +616,52 @@ def build_tstrength_data(from_year=None, full_backfill=False):
 
     if not new_tournaments:
         print("  No new tournaments to process")
+        if replayed or backfilled:
+            try:
+                _compact_cache(cache)
+            except Exception as e:
+                print(f"Error saving T-Strength cache: {e}")
     else:
         print(f"  {len(new_tournaments)} new tournaments to process")
 
         # Load rankings only if we have new tournaments
         print("Loading rankings for T-Strength...")
         rankings_index = _load_rankings_index()
-        available_weeks = sorted(rankings_index.keys())
+        week_index = WeekIndex(rankings_index.keys())
         unranked_players = {}
 
-        for t in new_tournaments:
-            tid = t["id"]
-            yr = t.get("year", current_year)
-            needs = tournament_needs.get(f"{yr}_{tid}", set())
-
-            print(f"  Fetching players for {t['name']} ({t['startDate']})...")
-            matches = _fetch_tournament_matches(tid, yr)
-            time.sleep(0.3)
+        bucket = _TokenBucket(TSTRENGTH_REQUESTS_PER_SECOND, TSTRENGTH_REQUEST_BURST)
 
-            surface = t.get("surface", "")
-            country = t.get("country", "")
-            region = _REGION_MAP.get(country, country)
+        def _fetch(t):
+            bucket.acquire()
+            return _fetch_tournament_matches(t["id"], t.get("year", current_year))
 
-            for draw in ("MD", "Q"):
-                if draw not in needs:
-                    continue
-                ranking_week = _resolve_ranking_week(t["startDate"], draw, rankings_index, available_weeks)
-                week_rankings = rankings_index.get(ranking_week, {})
-                draw_level = "M" if draw == "MD" else "Q"
-                players, participants_locked = _extract_draw_players(matches, draw_level)
-                cache_key = f"{yr}_{tid}_{draw}"
-                if (not players) or (not participants_locked):
-                    cache[cache_key] = {
-                        "id": tid, "name": t["name"], "city": t["city"],
-                        "level": t["level"], "startDate": t["startDate"],
-                        "surface": surface,
-                        "country": country,
-                        "region": region,
-                        "year": yr,
-                        "draw": draw,
-                        "participantsLocked": False,
-                        "rankings": [], "hm": 0, "gm": 0, "playerCount": 0
-                    }
-                    continue
-
-                player_ranks = []
-                for p in players:
-                    norm_p = _normalize_name(p)
-                    rank = week_rankings.get(norm_p)
-                    if rank is None and len(norm_p.split()) >= 3:
-                        partial = norm_p.split()[0] + " " + norm_p.split()[1]
-                        rank = week_rankings.get(partial)
-                    if rank is None:
-                        rank = DEFAULT_RANK
-                        unranked_players[p] = unranked_players.get(p, [])
-                        unranked_players[p].append(f"{t['name']} ({draw})")
-                    player_ranks.append(rank)
-
-                player_ranks.sort()
-                hm = round(_harmonic_mean(player_ranks), 1)
-                gm = round(_geometric_mean(player_ranks), 1)
-
-                entry = {
-                    "id": tid,
-                    "name": t["name"],
-                    "city": t["city"],
-                    "level": t["level"],
-                    "startDate": t["startDate"],
-                    "surface": surface,
-                    "country": country,
-                    "region": region,
-                    "year": yr,
-                    "draw": draw,
-                    "participantsLocked": True,
-                    "rankings": player_ranks,
-                    "hm": hm,
-                    "gm": gm,
-                    "playerCount": len(player_ranks),
-                }
-                cache[cache_key] = entry
+        # Matches are fetched concurrently; entries are computed on this thread
+        # (the lazy rankings index is not thread-safe) and checkpointed as they land.
+        # Journal lines carry the players' ranks only; a resumed run fills in their
+        # stats with the cached-entry backfill above.
+        new_entries = []
+        with open(TSTRENGTH_JOURNAL, "a", encoding="utf-8") as journal, \
+                ThreadPoolExecutor(max_workers=max(1, TSTRENGTH_FETCH_WORKERS)) as pool:
+            futures = {pool.submit(_fetch, t): t for t in new_tournaments}
+            try:
+                for done, fut in enumerate(as_completed(futures), 1):
+                    t = dict(futures[fut], year=futures[fut].get("year", current_year))
+                    print(f"  [{done}/{len(futures)}] Players for {t['name']} ({t['startDate']})")
+                    needs = tournament_needs.get(f"{t['year']}_{t['id']}", set())
+                    entries = _build_draw_entries(t, needs, fut.result(), rankings_index, week_index, unranked_players)
+                    for entry in entries:
+                        cache[f"{entry['year']}_{entry['id']}_{entry['draw']}"] = entry
+                    _append_journal(journal, entries)
+                    new_entries.extend(entries)
+            except BaseException:
+                # Interrupted: drop queued fetches; the journal keeps what was computed.
+                for f in futures:
+                    f.cancel()
+                raise
+
+        # HM/GM and distribution stats of every draw of this run, as one batch.
+        _apply_strength_stats(new_entries)
 
         still_empty = []
         for t in new_tournaments:
@@ -516,11 +674,9 @@ def build_tstrength_data(from_year=None, full_backfill=False):
             for label in still_empty:
                 print(f"  - {label}")
 
-        # Save updated cache
+        # Fold the journal into the cache file
         try:
-            filtered_cache_values = [e for e in cache.values() if not _is_ignored_tournament(e.get("name", ""))]
-            with open(TSTRENGTH_CACHE, "w", encoding="utf-8") as f:
-                json.dump(filtered_cache_values, f, indent=2)
+            _compact_cache(cache)
         except Exception as e:
             print(f"Error saving T-Strength cache: {e}")
 
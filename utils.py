@@ -1,5 +1,7 @@
 import os
+import glob
 import json
+import hashlib
 import unicodedata
 
 import csv
@@ -159,6 +161,58 @@ def save_json_array_one_line_per_item(path, items):
         f.write("\n]\n")
 
 
+def write_text_if_changed(path, text):
+    """Write `text` to `path` unless the file already holds exactly that. Returns True if written."""
+    data = text.encode("utf-8")
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return True
+
+
+def write_hashed_json_files(directory, payloads, name="{digest}.json", pattern="*.json", label=None):
+    """Write content-addressed JSON files into `directory` and remove stale ones.
+
+    payloads yields (key, payload) pairs. Each payload is dumped as compact JSON
+    to `name` (formatted with key and digest, the first 12 hex digits of the
+    body's sha1) unless that file already exists, so unchanged content keeps its
+    URL. Files matching `pattern` that were not produced in this call are
+    deleted. With `label`, a summary is printed when anything changed.
+    Returns {key: digest}.
+    """
+    os.makedirs(directory, exist_ok=True)
+    digests = {}
+    keep = set()
+    written = 0
+    for key, payload in payloads:
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        digest = hashlib.sha1(body.encode("utf-8")).hexdigest()[:12]
+        fname = name.format(key=key, digest=digest)
+        path = os.path.join(directory, fname)
+        if not os.path.exists(path):
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(body)
+            written += 1
+        digests[key] = digest
+        keep.add(fname)
+
+    removed = 0
+    for path in glob.glob(os.path.join(directory, pattern)):
+        if os.path.basename(path) not in keep:
+            os.remove(path)
+            removed += 1
+    if label and (written or removed):
+        print(f"{label}: {written} written, {removed} removed ({len(digests)} files)")
+    return digests
+
+
 def override_country_for_player(player_name, country_code):
     key = (player_name or "").strip().upper()
     if key in COUNTRY_OVERRIDES:
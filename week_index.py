@@ -0,0 +1,117 @@
+"""Monday-based week helpers and a sorted week index shared across modules.
+
+Weeks are identified by their Monday as "YYYY-MM-DD". `week_ordinal` maps a
+Monday to a consecutive integer (0 = 0001-01-01, itself a Monday), so week
+arithmetic is integer arithmetic. `WeekIndex` precomputes, for every week
+between its first and last entry, the position of the latest indexed week on
+or before it, which makes "latest ranking week <= date" a table lookup.
+"""
+
+import bisect
+from datetime import date, datetime, timedelta
+
+
+def _as_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = str(value or "").strip()[:10]
+    if not text:
+        return None
+    try:
+        return date.fromisoformat(text)
+    except ValueError:
+        return None
+
+
+def monday_of(value):
+    """Monday ("YYYY-MM-DD") of the week containing a date/datetime/"YYYY-MM-DD..." string; None if unparseable."""
+    d = _as_date(value)
+    if d is None:
+        return None
+    return (d - timedelta(days=d.weekday())).strftime("%Y-%m-%d")
+
+
+def week_ordinal(value):
+    """Consecutive week number of the week containing value (None if unparseable)."""
+    d = _as_date(value)
+    if d is None:
+        return None
+    return (d.toordinal() - 1) // 7
+
+
+def week_from_ordinal(ordinal):
+    return date.fromordinal(ordinal * 7 + 1).strftime("%Y-%m-%d")
+
+
+def shift_week(value, weeks):
+    """Monday `weeks` weeks after (negative: before) the week containing value."""
+    ordinal = week_ordinal(value)
+    return None if ordinal is None else week_from_ordinal(ordinal + weeks)
+
+
+class WeekIndex:
+    """Sorted week dates with O(1) "latest week on or before" lookups.
+
+    Weeks are usually Mondays, but any "YYYY-MM-DD" works: a query resolves to
+    the latest indexed week whose date is <= the query date.
+    """
+
+    def __init__(self, weeks):
+        self.weeks = sorted(set(weeks))
+        self._position = {w: i for i, w in enumerate(self.weeks)}
+        # _latest[o - _first] = position of the last week whose week ordinal is <= o
+        ordinals = [week_ordinal(w) for w in self.weeks]
+        self._first = None
+        self._latest = []
+        valid = [(o, i) for i, o in enumerate(ordinals) if o is not None]
+        if valid:
+            self._first = valid[0][0]
+            latest = -1
+            pending = iter(valid)
+            nxt = next(pending, None)
+            for o in range(self._first, valid[-1][0] + 1):
+                while nxt is not None and nxt[0] <= o:
+                    latest = nxt[1]
+                    nxt = next(pending, None)
+                self._latest.append(latest)
+
+    def __len__(self):
+        return len(self.weeks)
+
+    def __contains__(self, week):
+        return week in self._position
+
+    def __iter__(self):
+        return iter(self.weeks)
+
+    def latest(self):
+        return self.weeks[-1] if self.weeks else None
+
+    def position(self, week):
+        """Position of an indexed week, or None."""
+        return self._position.get(week)
+
+    def position_on_or_before(self, value):
+        """Position of the latest indexed week <= value, or -1 when there is none."""
+        key = value if isinstance(value, str) else monday_of(value)
+        if key in self._position:
+            return self._position[key]
+        ordinal = week_ordinal(key)
+        if ordinal is None or self._first is None:
+            return bisect.bisect_right(self.weeks, key or "") - 1
+        if ordinal < self._first:
+            return -1
+        if ordinal - self._first >= len(self._latest):
+            return len(self.weeks) - 1
+        i = self._latest[ordinal - self._first]
+        # Non-Monday entries share a week ordinal with later days of that week.
+        while i >= 0 and self.weeks[i] > key:
+            i -= 1
+        return i
+
+    def on_or_before(self, value):
+        """Latest indexed week <= value, or None."""
+        i = self.position_on_or_before(value)
+        return self.weeks[i] if i >= 0 else None
@@ -5,15 +5,16 @@ import unicodedata
 from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
 
-import csv as _csv
-import os as _os
-
 from config import (
     API_URL, HEADERS, NAME_LOOKUP,
     WTA_RANKINGS_CSV, WTA_RANKINGS_CSV_10_19,
     WTA_RANKINGS_CSV_00_09, WTA_RANKINGS_CSV_83_99
 )
 from utils import fix_display_name, format_player_name
+from week_index import WeekIndex
+from rankings_store import open_store, LazyWeekMapping
+from rankings_csv import RankingsCsv
+from run_metrics import count_retry
 from calendar_builder import get_next_monday, get_monday_from_date, format_week_label
 
 
@@ -271,6 +272,8 @@ def get_rankings(date_str, nationality=None):
             req_headers.setdefault("Referer", "https://www.wtatennis.com/")
             saw_rate_limit = False
             for attempt in range(8):
+                if attempt:
+                    count_retry(API_URL)
                 try:
                     r = _REQUESTS_SESSION.get(API_URL, params=params, headers=req_headers, timeout=30)
                     # Retry on throttling / transient server errors.
@@ -346,79 +349,142 @@ def get_rankings(date_str, nationality=None):
     return ranking_results
 
 
-_wta_csv_cache = None  # module-level in-memory cache: date_str -> list of player dicts
+_wta_csv_cache = None  # module-level cache: date_str -> list of player dicts (built per week on access)
+
+
+def _store_rows_to_players(rows):
+    players = []
+    for pid, official_name, country, dob, rank, points in rows:
+        official_upper = official_name.upper()
+        display_upper = NAME_LOOKUP.get(official_upper, official_upper)
+        players.append({
+            "Player":  display_upper,
+            "OfficialPlayer": official_upper,
+            "Id": pid,
+            "Rank":    rank,
+            "Country": country,
+            "Key":     display_upper,
+            "Points":  points,
+            "DOB":     dob,
+        })
+    return players
 
 
 def _load_wta_csv():
     global _wta_csv_cache
     if _wta_csv_cache is not None:
         return _wta_csv_cache
-    _wta_csv_cache = {}
-    # Load higher-priority decade files first so overlapping 2000 weeks prefer
+    # Higher-priority decade files come first so overlapping 2000 weeks prefer
     # the dedicated 00_09 CSV, while older-only weeks still come from 83_99.
+    stores = []
     for csv_file in [WTA_RANKINGS_CSV, WTA_RANKINGS_CSV_10_19, WTA_RANKINGS_CSV_00_09, WTA_RANKINGS_CSV_83_99]:
-        if not _os.path.exists(csv_file):
-            continue
-        existing_dates = set(_wta_csv_cache.keys())
-        with open(csv_file, encoding="utf-8-sig") as f:
-            for row in _csv.DictReader(f):
-                d = row["week_date"]
-                if d in existing_dates:
-                    continue
-                if d not in _wta_csv_cache:
-                    _wta_csv_cache[d] = []
-                pid = (row.get("id") or row.get("player_id") or row.get("playerId") or "").strip()
-                official_name = row["player"]
-                official_upper = official_name.upper()
-                display_upper = NAME_LOOKUP.get(official_upper, official_upper)
-                _wta_csv_cache[d].append({
-                    "Player":  display_upper,
-                    "OfficialPlayer": official_upper,
-                    "Id": pid,
-                    "Rank":    int(row["rank"]) if row.get("rank") else None,
-                    "Country": row["country"],
-                    "Key":     display_upper,
-                    "Points":  int(row["points"]) if row.get("points") else 0,
-                    "DOB":     row.get("dob", ""),
-                })
+        store = open_store(csv_file)
+        if store is not None:
+            stores.append(store)
+    _wta_csv_cache = LazyWeekMapping(stores, _store_rows_to_players)
     return _wta_csv_cache
 
 
 def _save_wta_csv_date(date_str, players):
-    """Append a new week's rankings to the current decade CSV file."""
+    """Add a new week's rankings to the current decade CSV file (its own week block)."""
     if not players:
         return
-    with open(WTA_RANKINGS_CSV, "a", encoding="utf-8", newline="") as f:
-        writer = _csv.writer(f)
-        for p in players:
-            name = (p.get("OfficialPlayer") or p.get("Player") or "").strip()
-            writer.writerow([date_str, p.get("Id", ""), p.get("Rank", ""), p.get("Points", 0), name, p.get("Country", ""), p.get("DOB", "")])
+    rows = [{
+        "week_date": date_str,
+        "id": p.get("Id", ""),
+        "rank": p.get("Rank", ""),
+        "points": p.get("Points", 0),
+        "player": (p.get("OfficialPlayer") or p.get("Player") or "").strip(),
+        "country": p.get("Country", ""),
+        "dob": p.get("DOB", ""),
+    } for p in players]
+    RankingsCsv(WTA_RANKINGS_CSV).put_week(date_str, rows)
+
+
+class WtaRankings:
+    """Lazy per-week view of the WTA rankings history.
+
+    Only the weeks a caller asks for are materialised from the rankings store;
+    weeks fetched from the API during the run are added with `add()`.
+    """
+
+    def __init__(self, weeks_by_date):
+        self._weeks_by_date = weeks_by_date
+        self._week_index = None
+        self._by_country = {}
+
+    def __contains__(self, week):
+        return week in self._weeks_by_date
+
+    def week_index(self):
+        """WeekIndex over all available weeks (rebuilt after `add()`)."""
+        if self._week_index is None:
+            self._week_index = WeekIndex(self._weeks_by_date.keys())
+        return self._week_index
+
+    def weeks(self):
+        """All available week dates (YYYY-MM-DD), ascending."""
+        return self.week_index().weeks
+
+    def get(self, week):
+        """Player dicts for a week, or None if the week is not available."""
+        if week not in self._weeks_by_date:
+            return None
+        return self._weeks_by_date[week]
+
+    def week_version(self, week):
+        """Content fingerprint of a stored week (None if unknown or added in memory)."""
+        version = getattr(self._weeks_by_date, "week_version", None)
+        return version(week) if version else None
+
+    def nearest_on_or_before(self, week):
+        """Latest available week <= week, or None."""
+        return self.week_index().on_or_before(week)
+
+    def by_country(self, week, code):
+        key = (week, code)
+        if key not in self._by_country:
+            self._by_country[key] = [p for p in (self.get(week) or []) if p.get("Country") == code]
+        return self._by_country[key]
+
+    def add(self, week, players):
+        self._weeks_by_date[week] = players
+        self._week_index = None
+        self._by_country = {k: v for k, v in self._by_country.items() if k[0] != week}
+
+
+_wta_rankings = None  # shared process-wide WtaRankings instance
+
+
+def get_wta_rankings():
+    global _wta_rankings
+    if _wta_rankings is None:
+        _wta_rankings = WtaRankings(_load_wta_csv())
+    return _wta_rankings
 
 
 def get_wta_rankings_cached(date_str, nationality=None):
     """Get WTA rankings from CSV, falling back to API if the date is missing."""
-    csv_data = _load_wta_csv()
+    rankings = get_wta_rankings()
 
-    if date_str in csv_data:
-        players = csv_data[date_str]
+    if date_str in rankings:
         if nationality:
-            return [p for p in players if p.get("Country") == nationality]
-        return players
+            return rankings.by_country(date_str, nationality)
+        return rankings.get(date_str)
 
     # Date not in CSV — fetch from API, save to CSV, and keep in memory
     new_data = get_rankings(date_str, nationality=nationality)
     if new_data:
-        csv_data[date_str] = new_data
+        rankings.add(date_str, new_data)
         _save_wta_csv_date(date_str, new_data)
         return new_data
 
     # Fallback: use the latest available date in the CSV
-    if csv_data:
-        latest_key = sorted(csv_data.keys())[-1]
-        players = csv_data.get(latest_key, [])
+    latest_key = rankings.week_index().latest()
+    if latest_key:
         if nationality:
-            return [p for p in players if p.get("Country") == nationality]
-        return players
+            return rankings.by_country(latest_key, nationality)
+        return rankings.get(latest_key)
 
     return []
 
@@ -0,0 +1,106 @@
+"""Shared on-disk cache for the WTA `/tournaments/{id}/{year}/matches` endpoint.
+
+tstrength, populate_data/wta_load_new.py and populate_data/tournament_sizes_update.py
+all read tournament matches through `fetch_tournament_matches`, so one workflow
+run downloads each payload once. Every caller goes through the same canonical
+request (all match states, no query string); a `states` filter is applied
+locally to the cached list. Entries are keyed by that request URL (sha1 of the
+URL, not of the response) under WTA_MATCHES_CACHE_DIR:
+
+- finished tournaments (singles final played, nothing live) never expire;
+- in-progress or not-yet-started ones expire after WTA_MATCHES_CACHE_TTL seconds.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+import requests
+
+from config import HEADERS, WTA_MATCHES_CACHE_DIR, WTA_MATCHES_CACHE_TTL
+
+MATCHES_URL = "https://api.wtatennis.com/tennis/tournaments/{tournament_id}/{year}/matches"
+
+# API `states` codes -> MatchState values of the returned matches
+# ("C" = completed, reported as MatchState "F").
+_STATE_CODES = {"L": {"L"}, "C": {"F"}}
+
+
+def _cache_path(url):
+    return os.path.join(WTA_MATCHES_CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+
+def _is_finished(matches):
+    """True once the singles final is played and no match is live anymore."""
+    final_played = False
+    for m in matches:
+        if str(m.get("MatchState", "") or "").upper() == "L":
+            return False
+        if (m.get("DrawLevelType") == "M" and m.get("DrawMatchType") == "S"
+                and str(m.get("RoundID", "")) == "F" and m.get("MatchState") == "F"):
+            final_played = True
+    return final_played
+
+
+def _read_cache(url):
+    try:
+        with open(_cache_path(url), "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except Exception:
+        return None
+    if entry.get("url") != url:
+        return None
+    if entry.get("finished") or time.time() - entry.get("fetched_at", 0) < WTA_MATCHES_CACHE_TTL:
+        return entry.get("matches", [])
+    return None
+
+
+def _write_cache(url, matches):
+    os.makedirs(WTA_MATCHES_CACHE_DIR, exist_ok=True)
+    path = _cache_path(url)
+    tmp = path + ".tmp"
+    entry = {"url": url, "fetched_at": time.time(), "finished": _is_finished(matches), "matches": matches}
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(entry, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def _filter_states(matches, states):
+    if not states:
+        return matches
+    wanted = set()
+    for code in states.split(","):
+        code = code.strip().upper()
+        wanted |= _STATE_CODES.get(code, {code})
+    return [m for m in matches if str(m.get("MatchState", "") or "").strip().upper() in wanted]
+
+
+def _download(url, tournament_id, year, headers, timeout):
+    r = requests.get(url, headers=headers or HEADERS, timeout=timeout)
+    r.raise_for_status()
+    raw = r.content
+    try:
+        text = raw.decode("utf-8")
+    except UnicodeDecodeError:
+        text = raw.decode("latin-1")
+    matches = json.loads(text).get("matches", []) or []
+    try:
+        _write_cache(url, matches)
+    except Exception as e:
+        print(f"  Warning: could not cache WTA matches for {tournament_id}/{year}: {e}")
+    return matches
+
+
+def fetch_tournament_matches(tournament_id, year, states=None, headers=None, timeout=15):
+    """Return the `matches` list for a tournament/year, from cache when still valid.
+
+    `states` takes the API's `states` codes (e.g. "L, C") and keeps only matches
+    in those states; the request itself always asks for every state, so all
+    callers share one cached response. HTTP/parse errors propagate to the caller.
+    """
+    url = MATCHES_URL.format(tournament_id=tournament_id, year=year)
+    matches = _read_cache(url)
+    if matches is None:
+        matches = _download(url, tournament_id, year, headers, timeout)
+    return _filter_states(matches, states)